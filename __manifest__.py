@@ -1,6 +1,6 @@
 {
     "name": "Golfzon Dashboard",
-    "version": "2.1.0",
+    "version": "2.2.0",
     "category": "Custom/Dashboard",
     "sequence" : "-1",
     "summary": "Professional Golfzon Dashboard with Fully Modular Architecture",
@@ -34,6 +34,7 @@
         "views/menu.xml", 
         "views/templates.xml",
         "data/dummy_data.xml",
+        "data/ir_cron.xml",
         "views/booking_info_views.xml",
         "views/persons.xml",
         "views/visit_customer.xml",
@@ -2,15 +2,56 @@ from odoo import http
 from odoo.http import request
 from datetime import datetime, timedelta, date
 from calendar import monthrange
+from dateutil.relativedelta import relativedelta
 import json
 import logging
 
+from ..models.gender_counter import FEMALE_CODES, GENDER_EXPRESSION, MALE_CODES
+from ..models.reservation_forecast import MAX_HORIZON_DAYS
+from ..utils.forecast import ForecastUnavailable
+from ..utils.age_histogram import AGE_GROUPS, MAX_AGE
+from ..utils.downsample import lttb_indices
+from ..utils.instrumentation import endpoint_stats, instrumented, sql_label, WINDOW_MINUTES
+from ..utils.result_cache import cached_endpoint, dashboard_cache
+
 _logger = logging.getLogger(__name__)
 
+# Length in days of the preset sales chart periods
+SALES_PERIOD_DAYS = {"7days": 7, "30days": 30, "90days": 90, "1year": 365}
+MAX_CUSTOM_PERIOD_DAYS = 3 * 366
+SALES_BUCKETS = ("auto", "day", "week", "month")
+
+# Heatmap slots: (key, first hour, end hour excluded, label)
+HEATMAP_SLOTS = [
+    ("early morning", 5, 8, "Early Morning(5 AM -7 AM)"),
+    ("morning", 8, 13, "Morning(8 AM -12 PM)"),
+    ("afternoon", 13, 17, "Afternoon(13 PM -16 PM)"),
+    ("night", 17, 20, "Night(17 PM -19 PM)"),
+]
+
+# Heatmap windows: (days, days shifted back from the latest booking date).
+# Whole weeks, so every weekday is counted the same number of times.
+HEATMAP_WINDOWS = {
+    "7days": (7, 0),
+    "4weeks": (28, 0),
+    "quarter": (91, 0),
+    "last_year_week": (7, 364),
+}
+
+# Shortest projection served by the reservation forecast
+MIN_FORECAST_HORIZON_DAYS = 14
+
+# Visit count bands of the segment cross-tab (same as the member group inquiry)
+VISIT_BANDS = ("none", "5_under", "5_10", "10_more")
+
+# The cross-tab is a daily snapshot: the cache key changes with the date
+SEGMENT_CACHE_TTL_SECONDS = 24 * 3600
+
 
 class SalesStatusController(http.Controller):
 
     @http.route('/golfzon/settings/location', type='json', auth='user')
+    @instrumented
     def get_configured_location(self, **kwargs):
         """Get configured location from company settings"""
         try:
@@ -30,6 +71,7 @@ class SalesStatusController(http.Controller):
 
 
     @http.route('/golfzon/dashboard/set_lang', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrumented
     def set_language(self, lang='ko_KR', **kwargs):
         """Handle language switching for dashboard"""
         try:
@@ -62,19 +104,12 @@ class SalesStatusController(http.Controller):
         
    
     @http.route('/golfzon/api/current_language', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrumented
     def get_current_language(self, **kwargs):
         """Get current user language state"""
         try:
-            current_lang = request.env.user.lang or 'ko_KR'  # Default to Korean
-            is_korean = 'ko' in current_lang.lower()
-            
             return request.make_response(
-                json.dumps({
-                    'status': 'success',
-                    'current_lang': current_lang,
-                    'is_korean': is_korean,
-                    'display_name': 'Korean' if is_korean else 'English'
-                }),
+                json.dumps(self._get_language_payload()),
                 headers={'Content-Type': 'application/json'}
             )
         except Exception as e:
@@ -88,7 +123,19 @@ class SalesStatusController(http.Controller):
                 headers={'Content-Type': 'application/json'}
             )    
             
+    def _get_language_payload(self):
+        """Current user language state (shared by the http route and the bootstrap)"""
+        current_lang = request.env.user.lang or 'ko_KR'  # Default to Korean
+        is_korean = 'ko' in current_lang.lower()
+        return {
+            'status': 'success',
+            'current_lang': current_lang,
+            'is_korean': is_korean,
+            'display_name': 'Korean' if is_korean else 'English'
+        }
+
     @http.route('/golfzon/api/set_default_korean', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrumented
     def set_default_korean(self, **kwargs):
         """Set Korean as default language for current user"""
         try:
@@ -118,36 +165,12 @@ class SalesStatusController(http.Controller):
             )
             
     @http.route('/golfzon/api/current_date', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrumented
     def get_current_date(self, **kwargs):
         """Get current date formatted according to user language"""
         try:
-            from datetime import datetime
-            
-            current_date = datetime.now()
-            user_lang = request.env.user.lang or 'ko_KR'
-            
-            # Format date according to user language
-            if 'ko' in user_lang.lower():
-                # Korean format: "2025년 10월 5일 일요일"
-                korean_days = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
-                korean_months = ['1월', '2월', '3월', '4월', '5월', '6월', 
-                                '7월', '8월', '9월', '10월', '11월', '12월']
-                
-                day_name = korean_days[current_date.weekday()]
-                month_name = korean_months[current_date.month - 1]
-                
-                formatted_date = f"{current_date.year}년 {month_name} {current_date.day}일 {day_name}"
-            else:
-                # English format: "Sunday, October 5, 2025"
-                formatted_date = current_date.strftime('%A, %B %d, %Y')
-            
             return request.make_response(
-                json.dumps({
-                    'status': 'success',
-                    'formatted_date': formatted_date,
-                    'language': user_lang,
-                    'raw_date': current_date.isoformat()
-                }),
+                json.dumps(self._get_date_payload()),
                 headers={'Content-Type': 'application/json'}
             )
             
@@ -162,37 +185,117 @@ class SalesStatusController(http.Controller):
                 headers={'Content-Type': 'application/json'}
             )
 
+    def _get_date_payload(self):
+        """Current date formatted according to user language"""
+        current_date = datetime.now()
+        user_lang = request.env.user.lang or 'ko_KR'
+
+        # Format date according to user language
+        if 'ko' in user_lang.lower():
+            # Korean format: "2025년 10월 5일 일요일"
+            korean_days = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
+            korean_months = ['1월', '2월', '3월', '4월', '5월', '6월',
+                            '7월', '8월', '9월', '10월', '11월', '12월']
+
+            day_name = korean_days[current_date.weekday()]
+            month_name = korean_months[current_date.month - 1]
+
+            formatted_date = f"{current_date.year}년 {month_name} {current_date.day}일 {day_name}"
+        else:
+            # English format: "Sunday, October 5, 2025"
+            formatted_date = current_date.strftime('%A, %B %d, %Y')
+
+        return {
+            'status': 'success',
+            'formatted_date': formatted_date,
+            'language': user_lang,
+            'raw_date': current_date.isoformat()
+        }
+
+    # Dashboard Bootstrap (all widgets in one request)
+    @http.route("/golfzon/dashboard/bootstrap", type="json", auth="user", methods=["POST"])
+    @instrumented
+    def get_dashboard_bootstrap(self, sales_period="30days", visitor_period="30days", reservation_period="30days", **kwargs):
+        """
+        Fetch every dashboard widget in a single request on a single cursor.
+        Each section runs inside its own savepoint, so a failing query only
+        loses that section. Returns a per-section timing breakdown.
+        """
+        start_time = datetime.now()
+
+        sections = [
+            ("language", self._get_language_payload, {}),
+            ("date", self._get_date_payload, {}),
+            ("performance", self.get_performance_indicators, {}),
+            ("sales", self.get_sales_data, {"period": sales_period}),
+            ("visitor", self.get_visitor_data, {"period": visitor_period}),
+            ("reservation", self.get_reservation_trend_data, {"period": reservation_period}),
+            ("age", self.get_age_group_data, {}),
+            ("heatmap", self.get_heatmap_data, {}),
+            ("member_composition", self.get_member_composition_data, {}),
+            ("golf_info", self.get_golf_info, {}),
+        ]
+
+        payload = {}
+        timings = {}
+        for name, loader, params in sections:
+            section_start = datetime.now()
+            try:
+                with request.env.cr.savepoint():
+                    payload[name] = loader(**params)
+            except Exception as e:
+                _logger.error(f"❌ Bootstrap section '{name}' failed: {str(e)}", exc_info=True)
+                payload[name] = {"success": False, "error": str(e)}
+            timings[name] = round((datetime.now() - section_start).total_seconds() * 1000, 2)
+
+        execution_time = (datetime.now() - start_time).total_seconds() * 1000
+        _logger.info(f"✅ Dashboard bootstrap fetched in {execution_time:.2f}ms: {timings}")
+
+        return {
+            "success": True,
+            "sections": payload,
+            "timings_ms": timings,
+            "execution_time_ms": round(execution_time, 2),
+        }
+
     # Sales Status Data
     @http.route("/golfzon/sales_data", type="json", auth="user", methods=["POST"])
-    def get_sales_data(self, period="30days"):
+    @instrumented
+    @cached_endpoint("sales_data", depends=("payment.infos", "golfzon.daily.metrics"))
+    def get_sales_data(self, period="30days", start_date=None, end_date=None, bucket="auto", max_points=None):
         """
         Fetch sales data from payment_infos table with millisecond performance.
         Returns data for current year and previous year for comparison.
+
+        :param period: one of SALES_PERIOD_DAYS, or "custom" with start_date
+            and end_date (YYYY-MM-DD)
+        :param bucket: "day", "week", "month" or "auto" (by range length)
+        :param max_points: with daily points, downsample both series to this
+            many points (LTTB on the current year series)
         """
         try:
             start_time = datetime.now()
 
             _logger.info(f"Fetching sales data for period: {period}")
 
+            if bucket not in SALES_BUCKETS:
+                raise ValueError(f"Unknown sales bucket: {bucket}")
+
             # Determine the date range
-            date_range = self._calculate_date_range(period)
+            date_range = self._calculate_date_range(period, start_date, end_date)
 
             _logger.info(
                 f"Date range: {date_range['current_start']} to {date_range['current_end']}"
             )
 
-            # Fetch data for current year and previous year
-            current_year_data = self._fetch_sales_by_period(
-                date_range["current_start"], date_range["current_end"]
-            )
-
-            previous_year_data = self._fetch_sales_by_period(
-                date_range["previous_start"], date_range["previous_end"]
-            )
+            # Fetch aligned data for current year and previous year
+            series = self._fetch_sales_by_period(date_range)
+            current_year_data = series["current"]
+            previous_year_data = series["previous"]
 
-            # Calculate total sales (sum of all daily amounts)
-            total_sales_current = sum(day["amount"] for day in current_year_data)
-            total_sales_previous = sum(day["amount"] for day in previous_year_data)
+            # Total sales (sum of all daily amounts)
+            total_sales_current = series["current_total"]
+            total_sales_previous = series["previous_total"]
 
             _logger.info(
                 f"Total sales current: {total_sales_current}, previous: {total_sales_previous}"
@@ -207,9 +310,7 @@ class SalesStatusController(http.Controller):
 
             # Calculate average unit price (average sales per day)
             # Count only days with actual sales (non-zero amounts)
-            days_with_sales = len(
-                [day for day in current_year_data if day["amount"] > 0]
-            )
+            days_with_sales = series["current_days_with_data"]
             avg_unit_price = (
                 total_sales_current / days_with_sales if days_with_sales > 0 else 0
             )
@@ -217,6 +318,18 @@ class SalesStatusController(http.Controller):
             # Get total number of days in period
             total_days = len(current_year_data)
 
+            # Totals above are computed on the daily series, the chart gets
+            # bucketed or downsampled points
+            if bucket == "auto":
+                bucket = self._auto_sales_bucket(total_days)
+            if bucket in ("week", "month"):
+                current_year_data = self._bucket_sales(current_year_data, bucket)
+                previous_year_data = self._bucket_sales(previous_year_data, bucket)
+            elif max_points:
+                keep = lttb_indices([day["amount"] for day in current_year_data], int(max_points))
+                current_year_data = [current_year_data[i] for i in keep]
+                previous_year_data = [previous_year_data[i] for i in keep if i < len(previous_year_data)]
+
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
 
@@ -245,40 +358,41 @@ class SalesStatusController(http.Controller):
                     "execution_time_ms": round(execution_time, 2),
                     "days_with_sales": days_with_sales,
                     "total_days": total_days,
+                    "bucket": bucket,
+                    "points": len(current_year_data),
                 },
             }
+        except ValueError as e:
+            _logger.warning(f"Invalid sales data request: {str(e)}")
+            return {"success": False, "error": str(e)}
         except Exception as e:
             _logger.error(f"Error fetching sales data: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
-    def _calculate_date_range(self, period):
+    @sql_label("sales.latest_date")
+    def _calculate_date_range(self, period, start_date=None, end_date=None):
         """
         Calculate date ranges for current and previous year.
         Handles scenarios where today's data might not exist.
+        A "custom" period uses start_date and end_date as given.
         """
-        PaymentInfos = request.env["payment.infos"].sudo()
+        if period == "custom":
+            return self._custom_date_range(start_date, end_date)
 
-        # Try to get the latest date from database
-        latest_record = PaymentInfos.search(
-            [("cancel_yn", "=", "N"), ("pay_amt", ">", 0)],
-            order="pay_date desc",
-            limit=1,
-        )
+        # Latest payment date from the in-memory watermark registry
+        latest_date = request.env["golfzon.data.watermark"].sudo()._latest_date("payment")
 
-        if latest_record and latest_record.pay_date:
+        if latest_date:
             # Use latest date from database as "today"
-            reference_date = latest_record.pay_date
+            reference_date = latest_date
             _logger.info(f"Using latest date from database: {reference_date}")
         else:
             # Fallback to actual today
             reference_date = datetime.now().date()
             _logger.info(f"Using current date: {reference_date}")
 
-        # Calculate number of days based on period
-        if period == "7days":
-            days = 7
-        else:  # Default to 30 days
-            days = 30
+        # Calculate number of days based on period, default to 30 days
+        days = SALES_PERIOD_DAYS.get(period, 30)
 
         # Current year range
         # For 7 days: 2025-09-29 to 2025-10-05 (7 days total)
@@ -286,24 +400,41 @@ class SalesStatusController(http.Controller):
         current_end = reference_date
         current_start = current_end - timedelta(days=days - 1)
 
-        # Previous year range (same dates, previous year)
+        _logger.info(f"Period: {period}, Days: {days}")
+        return self._with_previous_year(current_start, current_end)
+
+    def _custom_date_range(self, start_date, end_date):
+        """Date ranges of a custom period, raise ValueError on invalid dates"""
+        if not start_date or not end_date:
+            raise ValueError("A custom period needs start_date and end_date")
+        current_start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        current_end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        if current_end < current_start:
+            raise ValueError("end_date is before start_date")
+        if (current_end - current_start).days + 1 > MAX_CUSTOM_PERIOD_DAYS:
+            raise ValueError(f"A custom period is limited to {MAX_CUSTOM_PERIOD_DAYS} days")
+        return self._with_previous_year(current_start, current_end)
+
+    def _with_previous_year(self, current_start, current_end):
+        """Current range plus the same dates of the previous year"""
         try:
             previous_end = datetime(
                 current_end.year - 1, current_end.month, current_end.day
             ).date()
-            previous_start = datetime(
-                current_start.year - 1, current_start.month, current_start.day
-            ).date()
         except ValueError:
             # Handle Feb 29 in leap years
             previous_end = datetime(
                 current_end.year - 1, current_end.month, current_end.day - 1
             ).date()
+        try:
+            previous_start = datetime(
+                current_start.year - 1, current_start.month, current_start.day
+            ).date()
+        except ValueError:
             previous_start = datetime(
                 current_start.year - 1, current_start.month, current_start.day - 1
             ).date()
 
-        _logger.info(f"Period: {period}, Days: {days}")
         _logger.info(f"Current: {current_start} to {current_end}")
         _logger.info(f"Previous: {previous_start} to {previous_end}")
 
@@ -312,68 +443,250 @@ class SalesStatusController(http.Controller):
             "current_end": current_end,
             "previous_start": previous_start,
             "previous_end": previous_end,
-            "days": days,
+            "days": (current_end - current_start).days + 1,
         }
 
-    def _fetch_sales_by_period(self, start_date, end_date):
+    @staticmethod
+    def _auto_sales_bucket(days):
+        """Daily points up to two months, weekly up to half a year, monthly beyond"""
+        if days <= 62:
+            return "day"
+        if days <= 190:
+            return "week"
+        return "month"
+
+    @staticmethod
+    def _bucket_sales(days, bucket):
+        """
+        Fold a daily series into week or month buckets. Weeks are counted
+        from the first day of the range, so the current and previous year
+        series get the same buckets. Each point is dated by its first day
+        and carries the last one as "end".
+        """
+        buckets = []
+        for index, day in enumerate(days):
+            if bucket == "week":
+                new_bucket = index % 7 == 0
+            else:
+                new_bucket = not buckets or day["date"][:7] != buckets[-1]["date"][:7]
+            if new_bucket:
+                buckets.append({"date": day["date"], "end": day["date"], "amount": 0, "transaction_count": 0})
+            buckets[-1]["end"] = day["date"]
+            buckets[-1]["amount"] += day["amount"]
+            buckets[-1]["transaction_count"] += day["transaction_count"] or 0
+        return buckets
+
+    def _fetch_daily_series(self, date_range, value_column, key, extra_columns=()):
+        """
+        Current and previous year daily series of golfzon_daily_metrics in
+        one statement. Both windows come from generate_series, so days
+        without data are filled with zeros, and the days are paired by
+        position (the previous year window is one day shorter or longer
+        around Feb 29). Totals and days with data come from window
+        aggregates of the same statement.
+
+        :param value_column: rollup column summed per day, returned as ``key``
+        :param extra_columns: other rollup columns summed per day, returned
+            under their own name
+        :return: {"current", "previous", "current_total", "previous_total",
+            "current_days_with_data", "previous_days_with_data"}
+        """
+        columns = [value_column, *extra_columns]
+        daily_sums = ", ".join(f"SUM({c}) AS {c}" for c in columns)
+        current_values = ", ".join(f"COALESCE(dc.{c}, 0) AS current_{c}" for c in columns)
+        previous_values = ", ".join(f"COALESCE(dp.{c}, 0) AS previous_{c}" for c in columns)
+        query = f"""
+            WITH current_days AS (
+                SELECT d::date AS day, n
+                FROM generate_series(%(current_start)s::date, %(current_end)s::date, interval '1 day')
+                    WITH ORDINALITY AS g(d, n)
+            ),
+            previous_days AS (
+                SELECT d::date AS day, n
+                FROM generate_series(%(previous_start)s::date, %(previous_end)s::date, interval '1 day')
+                    WITH ORDINALITY AS g(d, n)
+            ),
+            daily AS (
+                SELECT metric_date, {daily_sums}
+                FROM golfzon_daily_metrics
+                WHERE metric_date BETWEEN %(current_start)s AND %(current_end)s
+                    OR metric_date BETWEEN %(previous_start)s AND %(previous_end)s
+                GROUP BY metric_date
+            )
+            SELECT
+                c.day AS current_date,
+                p.day AS previous_date,
+                {current_values},
+                {previous_values},
+                SUM(COALESCE(dc.{value_column}, 0)) OVER () AS current_total,
+                SUM(COALESCE(dp.{value_column}, 0)) OVER () AS previous_total,
+                COUNT(*) FILTER (WHERE dc.{value_column} > 0) OVER () AS current_days_with_data,
+                COUNT(*) FILTER (WHERE dp.{value_column} > 0) OVER () AS previous_days_with_data
+            FROM current_days c
+            FULL JOIN previous_days p USING (n)
+            LEFT JOIN daily dc ON dc.metric_date = c.day
+            LEFT JOIN daily dp ON dp.metric_date = p.day
+            ORDER BY n
+        """
+        request.env.cr.execute(query, {
+            "current_start": date_range["current_start"],
+            "current_end": date_range["current_end"],
+            "previous_start": date_range["previous_start"],
+            "previous_end": date_range["previous_end"],
+        })
+        rows = request.env.cr.dictfetchall()
+
+        number = float if value_column == "sales_amount" else int
+        series = {
+            "current": [],
+            "previous": [],
+            "current_total": number(rows[0]["current_total"]) if rows else 0,
+            "previous_total": number(rows[0]["previous_total"]) if rows else 0,
+            "current_days_with_data": rows[0]["current_days_with_data"] if rows else 0,
+            "previous_days_with_data": rows[0]["previous_days_with_data"] if rows else 0,
+        }
+        for row in rows:
+            for side in ("current", "previous"):
+                if row[f"{side}_date"] is None:
+                    continue
+                point = {
+                    "date": row[f"{side}_date"].strftime("%Y-%m-%d"),
+                    key: number(row[f"{side}_{value_column}"]),
+                }
+                for column in extra_columns:
+                    point[column] = int(row[f"{side}_{column}"])
+                series[side].append(point)
+
+        _logger.info(
+            f"Daily {value_column}: {series['current_total']:,} over {len(series['current'])} days "
+            f"({series['current_days_with_data']} with data), previous year {series['previous_total']:,}"
+        )
+        return series
+
+    @sql_label("sales.by_period")
+    def _fetch_sales_by_period(self, date_range):
         """
-        Fetch aggregated sales data using optimized SQL query.
-        Groups by date and sums payment amounts.
+        Aligned current and previous year daily sales from the
+        golfzon_daily_metrics rollup, see _fetch_daily_series.
         """
-        # Use direct SQL for maximum performance
-        query = """
-            SELECT 
-                pay_date,
-                COALESCE(SUM(pay_amt), 0) as total_amount,
-                COUNT(*) as transaction_count
-            FROM payment_infos
-            WHERE pay_date >= %s 
-                AND pay_date <= %s
-                AND cancel_yn = 'N'
-            GROUP BY pay_date
-            ORDER BY pay_date ASC
+        return self._fetch_daily_series(
+            date_range, "sales_amount", "amount", extra_columns=("transaction_count",)
+        )
+
+    # Sales Breakdown
+    @http.route("/golfzon/sales/breakdown", type="json", auth="user", methods=["POST"])
+    @instrumented
+    @cached_endpoint("sales_breakdown", depends=("payment.infos", "golfzon.daily.metrics", "golfzon.daily.sales.breakdown"))
+    def get_sales_breakdown(self, period="30days", start_date=None, end_date=None):
+        """
+        Sales per store, per payment method and per calculation type, plus
+        the grand total, for a period (same periods as /golfzon/sales_data).
+        All of them come from one GROUPING SETS aggregation, over the daily
+        breakdown rollup once it has been built, over payment_infos before.
         """
+        try:
+            start_time = datetime.now()
+            if start_date or end_date:
+                period = "custom"
+            date_range = self._calculate_date_range(period, start_date, end_date)
+            breakdown = self._fetch_sales_breakdown(
+                date_range["current_start"], date_range["current_end"]
+            )
 
-        request.env.cr.execute(query, (start_date, end_date))
-        results = request.env.cr.dictfetchall()
+            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            _logger.info(
+                f"Sales breakdown ({breakdown['source']}) fetched in {execution_time:.2f}ms"
+            )
+            return {
+                "success": True,
+                "data": {
+                    **breakdown,
+                    "period": period,
+                    "date_range": {
+                        "start": date_range["current_start"].strftime("%Y-%m-%d"),
+                        "end": date_range["current_end"].strftime("%Y-%m-%d"),
+                    },
+                    "execution_time_ms": round(execution_time, 2),
+                },
+            }
+        except ValueError as e:
+            _logger.warning(f"Invalid sales breakdown request: {str(e)}")
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            _logger.error(f"Error fetching sales breakdown: {str(e)}", exc_info=True)
+            return {"success": False, "error": str(e)}
 
-        _logger.info(
-            f"Fetched {len(results)} days with data between {start_date} and {end_date}"
+    @sql_label("sales.breakdown")
+    def _fetch_sales_breakdown(self, start_date, end_date):
+        """
+        Run the GROUPING SETS aggregation and split the rows by grouping.
+        Code 0 stands for payments without a store, method or type.
+        """
+        rollup_built = bool(
+            request.env["ir.config_parameter"].sudo().get_param("golfzon_dashboard.daily_metrics_sync")
         )
-
-        # Create a complete date range with zero values for missing dates
-        date_dict = {}
-        current_date = start_date
-        while current_date <= end_date:
-            date_dict[current_date.strftime("%Y-%m-%d")] = {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "amount": 0,
-                "transaction_count": 0,
+        if rollup_built:
+            source = "rollup"
+            table, date_column = "golfzon_daily_sales_breakdown", "sale_date"
+            amount, count, condition = "SUM(sales_amount)", "SUM(transaction_count)", "TRUE"
+            store, method, cal_type = "store_cd_id", "payment_cd_id", "cal_type_cd_id"
+        else:
+            source = "payments"
+            table, date_column = "payment_infos", "pay_date"
+            amount, count, condition = "SUM(pay_amt)", "COUNT(*)", "cancel_yn = 'N'"
+            store = "COALESCE(store_cd_id, 0)"
+            method = "COALESCE(payment_cd_id, 0)"
+            cal_type = "COALESCE(cal_type_cd_id, 0)"
+
+        request.env.cr.execute(
+            f"""
+            SELECT
+                {store} AS store_cd_id,
+                {method} AS payment_cd_id,
+                {cal_type} AS cal_type_cd_id,
+                GROUPING({store}, {method}, {cal_type}) AS grouping_id,
+                COALESCE({amount}, 0) AS amount,
+                COALESCE({count}, 0) AS transaction_count
+            FROM {table}
+            WHERE {date_column} BETWEEN %s AND %s
+                AND {condition}
+            GROUP BY GROUPING SETS (({store}), ({method}), ({cal_type}), ())
+            ORDER BY amount DESC
+            """,
+            (start_date, end_date),
+        )
+        rows = request.env.cr.dictfetchall()
+
+        # GROUPING() bits: store 4, payment method 2, calculation type 1,
+        # set when the column is aggregated away
+        groupings = {
+            0b011: ("by_store", "store_cd_id"),
+            0b101: ("by_payment_method", "payment_cd_id"),
+            0b110: ("by_calculation_type", "cal_type_cd_id"),
+        }
+        total = {"amount": 0.0, "transaction_count": 0}
+        breakdown = {"by_store": [], "by_payment_method": [], "by_calculation_type": []}
+        for row in rows:
+            values = {
+                "amount": float(row["amount"]),
+                "transaction_count": int(row["transaction_count"]),
             }
-            current_date += timedelta(days=1)
+            if row["grouping_id"] == 0b111:
+                total = values
+            else:
+                key, column = groupings[row["grouping_id"]]
+                breakdown[key].append({"code": row[column], **values})
 
-        # Fill in actual data
-        for row in results:
-            date_key = row["pay_date"].strftime("%Y-%m-%d")
-            if date_key in date_dict:
-                # Store raw amount (database value)
-                date_dict[date_key]["amount"] = float(row["total_amount"] or 0)
-                date_dict[date_key]["transaction_count"] = row["transaction_count"]
-
-        # Convert to list maintaining order
-        result_list = list(date_dict.values())
-
-        # Log summary
-        total_amount = sum(day["amount"] for day in result_list)
-        days_with_data = len([day for day in result_list if day["amount"] > 0])
-        _logger.info(
-            f"Total amount for period: {total_amount:,.0f}, Days with data: {days_with_data}/{len(result_list)}"
-        )
+        for lines in breakdown.values():
+            for line in lines:
+                line["share"] = round(line["amount"] / total["amount"] * 100, 1) if total["amount"] else 0
 
-        return result_list
+        return {"source": source, "total": total, **breakdown}
 
     # Performance Cards Data
     @http.route("/golfzon/dashboard/performance_indicators", type="json", auth="user", methods=["POST"],)
+    @instrumented
+    @cached_endpoint("performance_indicators", depends=("payment.infos", "time.table", "golfzon.monthly.kpi", "golfzon.sales.ledger"))
     def get_performance_indicators(self, **kwargs):
         """
         Fetch performance indicators data from database with millisecond performance.
@@ -388,53 +701,67 @@ class SalesStatusController(http.Controller):
             current_year_start = date(today.year, 1, 1)
             current_month_start = date(today.year, today.month, 1)
 
-            # Previous year dates
+            # Previous year and same month of the previous year
             prev_year_start = date(today.year - 1, 1, 1)
-            prev_year_end = date(today.year - 1, 12, 31)
-
-            # Previous year same month
-            try:
-                prev_month_start = date(today.year - 1, today.month, 1)
-                if today.month == 12:
-                    prev_month_end = date(today.year - 1, 12, 31)
-                else:
-                    last_day = monthrange(today.year - 1, today.month)[1]
-                    prev_month_end = date(today.year - 1, today.month, last_day)
-            except ValueError:
-                # Handle leap year edge cases
-                prev_month_start = date(today.year - 1, today.month, 1)
-                prev_month_end = date(today.year - 1, today.month, 28)
-
-            # Fetch all three card data
-            sales_data = self._get_sales_performance_data(
-                current_year_start,
-                today,
-                current_month_start,
-                prev_year_start,
-                prev_year_end,
-                prev_month_start,
-                prev_month_end,
-            )
-
-            aov_data = self._get_average_order_value_data(
-                current_year_start,
-                today,
-                current_month_start,
-                prev_year_start,
-                prev_year_end,
-                prev_month_start,
-                prev_month_end,
-            )
+            prev_month_start = date(today.year - 1, today.month, 1)
+            current_month_end = date(today.year, today.month, monthrange(today.year, today.month)[1])
+
+            # Closed months come from the monthly rollup, only the open
+            # month, and the past months the rollup has not closed yet, are
+            # aggregated live
+            closed = request.env["golfzon.monthly.kpi"].sudo()._closed_totals({
+                "year": (current_year_start, current_month_start),
+                "prev_year": (prev_year_start, current_year_start),
+                "prev_month": (prev_month_start, prev_month_start + relativedelta(months=1)),
+            })
+            missing_windows = {
+                f"{name}_missing_{index}": (month, month + relativedelta(months=1, days=-1))
+                for name, totals in closed.items()
+                for index, month in enumerate(totals["missing"])
+            }
+            open_payments = self._aggregate_payment_windows({
+                "month": (current_month_start, today),
+                **missing_windows,
+            })
+            # Bookings of the current month include the slots still to come
+            open_bookings = self._aggregate_booking_windows({
+                "month": (current_month_start, current_month_end),
+                "month_to_date": (current_month_start, today),
+                **missing_windows,
+            })
+            for name, totals in closed.items():
+                for index in range(len(totals["missing"])):
+                    window = f"{name}_missing_{index}"
+                    totals["sales_amount"] += open_payments[f"{window}_sum"]
+                    totals["sales_count"] += int(open_payments[f"{window}_count"])
+                    totals["booking_count"] += open_bookings[f"{window}_count"]
+
+            year_amount = closed["year"]["sales_amount"] + open_payments["month_sum"]
+            year_count = closed["year"]["sales_count"] + open_payments["month_count"]
+            payments = {
+                "year_sum": year_amount,
+                "year_avg": self._average(year_amount, year_count),
+                "prev_year_sum": closed["prev_year"]["sales_amount"],
+                "prev_year_avg": self._average(
+                    closed["prev_year"]["sales_amount"], closed["prev_year"]["sales_count"]
+                ),
+                "month_sum": open_payments["month_sum"],
+                "month_avg": self._average(open_payments["month_sum"], open_payments["month_count"]),
+                "prev_month_sum": closed["prev_month"]["sales_amount"],
+                "prev_month_avg": self._average(
+                    closed["prev_month"]["sales_amount"], closed["prev_month"]["sales_count"]
+                ),
+            }
+            bookings = {
+                "year_count": closed["year"]["booking_count"] + open_bookings["month_to_date_count"],
+                "prev_year_count": closed["prev_year"]["booking_count"],
+                "month_count": open_bookings["month_count"],
+                "prev_month_count": closed["prev_month"]["booking_count"],
+            }
 
-            utilization_data = self._get_utilization_rate_data(
-                current_year_start,
-                today,
-                current_month_start,
-                prev_year_start,
-                prev_year_end,
-                prev_month_start,
-                prev_month_end,
-            )
+            sales_data = self._get_sales_performance_data(payments)
+            aov_data = self._get_average_order_value_data(payments)
+            utilization_data = self._get_utilization_rate_data(bookings)
 
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
@@ -454,283 +781,122 @@ class SalesStatusController(http.Controller):
             )
             return {"success": False, "error": str(e)}
 
-    def _get_sales_performance_data(self, year_start, year_end, month_start, prev_year_start, prev_year_end, prev_month_start, prev_month_end):
-        """Calculate sales performance metrics using optimized database queries"""
-
-        PaymentInfos = request.env["payment.infos"].sudo()
-
-        # Use read_group for aggregated queries - much faster than looping
-        # Cumulative sales this year
-        cumulative_current = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", year_start),
-                ("pay_date", "<=", year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:sum"],
-            [],
+    @staticmethod
+    def _window_filters(column, windows):
+        """
+        FILTER clauses and parameters selecting each (start, end) window of
+        ``windows`` on ``column``, plus the overall range to scan
+        """
+        filters = {
+            name: f"{column} BETWEEN %({name}_start)s AND %({name}_end)s"
+            for name in windows
+        }
+        params = {}
+        for name, (start, end) in windows.items():
+            params[f"{name}_start"] = start
+            params[f"{name}_end"] = end
+        params["scan_start"] = min(start for start, _end in windows.values())
+        params["scan_end"] = max(end for _start, end in windows.values())
+        return filters, params
+
+    @sql_label("performance.payments")
+    def _aggregate_payment_windows(self, windows):
+        """Net sales and payment count of the sales ledger for every window, in one pass"""
+        filters, params = self._window_filters("entry_date", windows)
+        columns = ",\n".join(
+            f"COALESCE(SUM(amount) FILTER (WHERE {where}), 0) AS {name}_sum,\n"
+            f"COALESCE(SUM(transaction_count) FILTER (WHERE {where}), 0) AS {name}_count"
+            for name, where in filters.items()
         )
-        cumulative_sales = (
-            cumulative_current[0]["pay_amt"]
-            if cumulative_current and cumulative_current[0].get("pay_amt")
-            else 0
+        request.env.cr.execute(
+            f"""
+            SELECT {columns}
+            FROM golfzon_sales_ledger
+            WHERE entry_date BETWEEN %(scan_start)s AND %(scan_end)s
+            """,
+            params,
         )
-
-        # Cumulative sales previous year
-        cumulative_previous = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", prev_year_start),
-                ("pay_date", "<=", prev_year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:sum"],
-            [],
+        return {key: float(value) for key, value in request.env.cr.dictfetchone().items()}
+
+    @sql_label("performance.bookings")
+    def _aggregate_booking_windows(self, windows):
+        """Booked time slots for every window, in one pass"""
+        filters, params = self._window_filters("bookg_date", windows)
+        columns = ",\n".join(
+            f"COUNT(*) FILTER (WHERE {where}) AS {name}_count"
+            for name, where in filters.items()
         )
-        cumulative_prev_sales = (
-            cumulative_previous[0]["pay_amt"]
-            if cumulative_previous and cumulative_previous[0].get("pay_amt")
-            else 0
+        request.env.cr.execute(
+            f"""
+            SELECT {columns}
+            FROM time_table
+            WHERE account_id IS NOT NULL
+                AND bookg_date BETWEEN %(scan_start)s AND %(scan_end)s
+            """,
+            params,
         )
+        return request.env.cr.dictfetchone()
 
-        # Current monthly sales
-        monthly_current = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", month_start),
-                ("pay_date", "<=", year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:sum"],
-            [],
-        )
-        monthly_sales = (
-            monthly_current[0]["pay_amt"]
-            if monthly_current and monthly_current[0].get("pay_amt")
-            else 0
-        )
+    @staticmethod
+    def _average(amount, count):
+        return amount / count if count else 0
 
-        # Previous year same month sales
-        monthly_previous = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", prev_month_start),
-                ("pay_date", "<=", prev_month_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:sum"],
-            [],
-        )
-        monthly_prev_sales = (
-            monthly_previous[0]["pay_amt"]
-            if monthly_previous and monthly_previous[0].get("pay_amt")
-            else 0
-        )
+    @staticmethod
+    def _yoy_change(current, previous):
+        """Year-over-year change in percent, 0 without a previous value"""
+        return ((current - previous) / previous * 100) if previous else 0
 
-        # Calculate year-over-year percentages
-        cumulative_yoy = (
-            ((cumulative_sales - cumulative_prev_sales) / cumulative_prev_sales * 100)
-            if cumulative_prev_sales
-            else 0
-        )
-        monthly_yoy = (
-            ((monthly_sales - monthly_prev_sales) / monthly_prev_sales * 100)
-            if monthly_prev_sales
-            else 0
-        )
+    @staticmethod
+    def _format_trend(change):
+        return f"{'+' if change >= 0 else ''}{int(round(change))}%"
+
+    def _get_sales_performance_data(self, payments):
+        """Sales performance card from the aggregated payment windows"""
+        cumulative_yoy = self._yoy_change(payments["year_sum"], payments["prev_year_sum"])
+        monthly_yoy = self._yoy_change(payments["month_sum"], payments["prev_month_sum"])
 
         # Format for display
         return {
-            "current_revenue": self._format_number(cumulative_sales),
-            "monthly_revenue": self._format_number(monthly_sales),
-            "current_trend": f"{'+' if cumulative_yoy >= 0 else ''}{int(round(cumulative_yoy))}%",
-            "monthly_trend": f"{'+' if monthly_yoy >= 0 else ''}{int(round(monthly_yoy))}%",
+            "current_revenue": self._format_number(payments["year_sum"]),
+            "monthly_revenue": self._format_number(payments["month_sum"]),
+            "current_trend": self._format_trend(cumulative_yoy),
+            "monthly_trend": self._format_trend(monthly_yoy),
             "current_trend_value": cumulative_yoy,
             "monthly_trend_value": monthly_yoy,
         }
 
-    def _get_average_order_value_data(self, year_start,  year_end, month_start, prev_year_start, prev_year_end, prev_month_start, prev_month_end,):
-        """Calculate average order value metrics using optimized database queries"""
-
-        PaymentInfos = request.env["payment.infos"].sudo()
-
-        # Cumulative average this year
-        cumulative_current = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", year_start),
-                ("pay_date", "<=", year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:avg"],
-            [],
-        )
-        cumulative_avg = (
-            cumulative_current[0]["pay_amt"]
-            if cumulative_current and cumulative_current[0].get("pay_amt")
-            else 0
-        )
-
-        # Cumulative average previous year
-        cumulative_previous = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", prev_year_start),
-                ("pay_date", "<=", prev_year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:avg"],
-            [],
-        )
-        cumulative_prev_avg = (
-            cumulative_previous[0]["pay_amt"]
-            if cumulative_previous and cumulative_previous[0].get("pay_amt")
-            else 0
-        )
-
-        # Current monthly average
-        monthly_current = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", month_start),
-                ("pay_date", "<=", year_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:avg"],
-            [],
-        )
-        monthly_avg = (
-            monthly_current[0]["pay_amt"]
-            if monthly_current and monthly_current[0].get("pay_amt")
-            else 0
-        )
-
-        # Previous year same month average
-        monthly_previous = PaymentInfos.read_group(
-            [
-                ("pay_date", ">=", prev_month_start),
-                ("pay_date", "<=", prev_month_end),
-                ("cancel_yn", "=", "N"),
-            ],
-            ["pay_amt:avg"],
-            [],
-        )
-        monthly_prev_avg = (
-            monthly_previous[0]["pay_amt"]
-            if monthly_previous and monthly_previous[0].get("pay_amt")
-            else 0
-        )
-
-        # Calculate year-over-year percentages
-        cumulative_yoy = (
-            ((cumulative_avg - cumulative_prev_avg) / cumulative_prev_avg * 100)
-            if cumulative_prev_avg
-            else 0
-        )
-        monthly_yoy = (
-            ((monthly_avg - monthly_prev_avg) / monthly_prev_avg * 100)
-            if monthly_prev_avg
-            else 0
-        )
+    def _get_average_order_value_data(self, payments):
+        """Average order value card from the aggregated payment windows"""
+        cumulative_yoy = self._yoy_change(payments["year_avg"], payments["prev_year_avg"])
+        monthly_yoy = self._yoy_change(payments["month_avg"], payments["prev_month_avg"])
 
         return {
-            "current_weekly_value": self._format_number(cumulative_avg),
-            "monthly_value": self._format_number(monthly_avg),
-            "current_trend": f"{'+' if cumulative_yoy >= 0 else ''}{int(round(cumulative_yoy))}%",
-            "monthly_trend": f"{'+' if monthly_yoy >= 0 else ''}{int(round(monthly_yoy))}%",
+            "current_weekly_value": self._format_number(payments["year_avg"]),
+            "monthly_value": self._format_number(payments["month_avg"]),
+            "current_trend": self._format_trend(cumulative_yoy),
+            "monthly_trend": self._format_trend(monthly_yoy),
             "current_trend_value": cumulative_yoy,
             "monthly_trend_value": monthly_yoy,
         }
 
-    def _get_utilization_rate_data(self, year_start, year_end, month_start, prev_year_start, prev_year_end, prev_month_start, prev_month_end,):
+    def _get_utilization_rate_data(self, bookings):
         """
-        Calculate utilization rate metrics from time_table.
+        Utilization rate card from the aggregated booking windows.
         Since all time_table records are bookings, we count actual bookings.
         """
+        bookings_current_year = bookings["year_count"]
+        bookings_previous_year = bookings["prev_year_count"]
+        bookings_current_month = bookings["month_count"]
+        bookings_previous_month = bookings["prev_month_count"]
 
-        TimeTable = request.env["time.table"].sudo()
-
-        from calendar import monthrange
-
-        # Ensure current month end is the last day of current month
-        current_month_last_day = monthrange(year_end.year, year_end.month)[1]
-        current_month_end = date(year_end.year, year_end.month, current_month_last_day)
-
-        _logger.info("=" * 70)
-        _logger.info("=== UTILIZATION RATE CALCULATION (TIME_TABLE BOOKINGS) ===")
-        _logger.info(f"Current Year: {year_start} to {year_end}")
-        _logger.info(f"Previous Year: {prev_year_start} to {prev_year_end}")
-        _logger.info(f"Current Month: {month_start} to {current_month_end}")
-        _logger.info(f"Previous Month: {prev_month_start} to {prev_month_end}")
-        _logger.info("=" * 70)
-
-        # Since time_table contains booking records, we just count them
-        # Each record = 1 booked time slot
+        cumulative_yoy = self._yoy_change(bookings_current_year, bookings_previous_year)
+        monthly_yoy = self._yoy_change(bookings_current_month, bookings_previous_month)
 
-        # === CURRENT YEAR BOOKINGS ===
-        bookings_current_year = TimeTable.search_count(
-            [
-                ("bookg_date", ">=", year_start),
-                ("bookg_date", "<=", year_end),
-                ("account_id", "!=", False),  # Ensure it's a valid booking
-            ]
-        )
-
-        # === PREVIOUS YEAR BOOKINGS ===
-        bookings_previous_year = TimeTable.search_count(
-            [
-                ("bookg_date", ">=", prev_year_start),
-                ("bookg_date", "<=", prev_year_end),
-                ("account_id", "!=", False),
-            ]
-        )
-
-        # === CURRENT MONTH BOOKINGS ===
-        bookings_current_month = TimeTable.search_count(
-            [
-                ("bookg_date", ">=", month_start),
-                ("bookg_date", "<=", current_month_end),
-                ("account_id", "!=", False),
-            ]
-        )
-
-        # === PREVIOUS YEAR SAME MONTH BOOKINGS ===
-        bookings_previous_month = TimeTable.search_count(
-            [
-                ("bookg_date", ">=", prev_month_start),
-                ("bookg_date", "<=", prev_month_end),
-                ("account_id", "!=", False),
-            ]
-        )
-
-        _logger.info(f"\n📊 BOOKING COUNTS:")
-        _logger.info(f"  Current Year (Jan-Oct 2025): {bookings_current_year} bookings")
         _logger.info(
-            f"  Previous Year (Jan-Dec 2024): {bookings_previous_year} bookings"
+            f"📈 Bookings YoY: cumulative {cumulative_yoy:+.1f}% "
+            f"({bookings_current_year} vs {bookings_previous_year}), "
+            f"monthly {monthly_yoy:+.1f}% ({bookings_current_month} vs {bookings_previous_month})"
         )
-        _logger.info(f"  Current Month (Oct 2025): {bookings_current_month} bookings")
-        _logger.info(f"  Previous Month (Oct 2024): {bookings_previous_month} bookings")
-
-        # === CALCULATE YEAR-OVER-YEAR CHANGES ===
-        # Calculate percentage change in booking volume
-        if bookings_previous_year > 0:
-            cumulative_yoy = (
-                (bookings_current_year - bookings_previous_year)
-                / bookings_previous_year
-            ) * 100
-        else:
-            cumulative_yoy = 0
-
-        if bookings_previous_month > 0:
-            monthly_yoy = (
-                (bookings_current_month - bookings_previous_month)
-                / bookings_previous_month
-            ) * 100
-        else:
-            monthly_yoy = 0
-
-        _logger.info(f"\n📈 YEAR-OVER-YEAR CHANGES:")
-        _logger.info(
-            f"  Cumulative YoY: {cumulative_yoy:+.1f}% ({bookings_current_year} vs {bookings_previous_year})"
-        )
-        _logger.info(
-            f"  Monthly YoY: {monthly_yoy:+.1f}% ({bookings_current_month} vs {bookings_previous_month})"
-        )
-        _logger.info("=" * 70)
 
         # === FORMAT FOR DISPLAY ===
         # Scale the booking counts to match your display format
@@ -740,8 +906,8 @@ class SalesStatusController(http.Controller):
         return {
             "current_weekly_capacity": self._format_number(float(cumulative_display)),
             "monthly_capacity": self._format_number(float(monthly_display)),
-            "current_trend": f"{'+' if cumulative_yoy >= 0 else ''}{int(round(cumulative_yoy))}%",
-            "monthly_trend": f"{'+' if monthly_yoy >= 0 else ''}{int(round(monthly_yoy))}%",
+            "current_trend": self._format_trend(cumulative_yoy),
+            "monthly_trend": self._format_trend(monthly_yoy),
             "current_trend_value": cumulative_yoy,
             "monthly_trend_value": monthly_yoy,
             "debug_info": {
@@ -760,11 +926,16 @@ class SalesStatusController(http.Controller):
 
     # Visitor Graph Data
     @http.route("/golfzon/visitor_data", type="json", auth="user", methods=["POST"])
-    def get_visitor_data(self, period="30days"):
+    @instrumented
+    @cached_endpoint("visitor_data", depends=("visit.customer", "time.table", "time.table.has.bookg.infos", "golfzon.daily.metrics", "golfzon.gender.counter", "golfzon.visitor.sketch"))
+    def get_visitor_data(self, period="30days", gender_scope="all"):
         """
         Fetch visitor data from visit_customers table with millisecond performance.
         Returns data for current year and previous year for comparison.
         Includes section-wise breakdown (Part 1, Part 2, Part 3) and gender ratio.
+
+        :param gender_scope: "all" for the gender ratio of every visit,
+            "period" for the visits of the selected period only
         """
         try:
             start_time = datetime.now()
@@ -776,18 +947,14 @@ class SalesStatusController(http.Controller):
                 f"Date range: {date_range['current_start']} to {date_range['current_end']}"
             )
 
-            # Fetch data for current year and previous year
-            current_year_data = self._fetch_visitors_by_period(
-                date_range["current_start"], date_range["current_end"]
-            )
-
-            previous_year_data = self._fetch_visitors_by_period(
-                date_range["previous_start"], date_range["previous_end"]
-            )
+            # Fetch aligned data for current year and previous year
+            series = self._fetch_visitors_by_period(date_range)
+            current_year_data = series["current"]
+            previous_year_data = series["previous"]
 
-            # Calculate total visitors
-            total_visitors_current = sum(day["count"] for day in current_year_data)
-            total_visitors_previous = sum(day["count"] for day in previous_year_data)
+            # Total visitors
+            total_visitors_current = series["current_total"]
+            total_visitors_previous = series["previous_total"]
 
             _logger.info(
                 f"Total visitors current: {total_visitors_current}, previous: {total_visitors_previous}"
@@ -806,8 +973,23 @@ class SalesStatusController(http.Controller):
                 date_range["current_start"], date_range["current_end"]
             )
 
-            # Fetch gender ratio for entire table
-            gender_ratio = self._fetch_gender_ratio()
+            # Unique visitors (distinct person codes), estimated from the
+            # daily sketches within unique_visitors_error (relative)
+            sketches = request.env["golfzon.visitor.sketch"].sudo()
+            unique_current, unique_error = sketches._unique_visitors(
+                date_range["current_start"], date_range["current_end"]
+            )
+            unique_previous, _error = sketches._unique_visitors(
+                date_range["previous_start"], date_range["previous_end"]
+            )
+
+            # Fetch gender ratio for all visits or the selected period
+            if gender_scope == "period":
+                gender_ratio = self._fetch_gender_ratio(
+                    date_range["current_start"], date_range["current_end"]
+                )
+            else:
+                gender_ratio = self._fetch_gender_ratio()
 
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
@@ -820,6 +1002,9 @@ class SalesStatusController(http.Controller):
                     "previous_year": previous_year_data,
                     "total_visitors": total_visitors_current,
                     "percentage_change": round(percentage_change, 1),
+                    "unique_visitors": unique_current,
+                    "unique_visitors_previous": unique_previous,
+                    "unique_visitors_error": round(unique_error, 4),
                     "sections": section_data,
                     "gender_ratio": gender_ratio,
                     "period": period,
@@ -885,165 +1070,55 @@ class SalesStatusController(http.Controller):
             "days": days,
         }
 
-    def _fetch_visitors_by_period(self, start_date, end_date):
-        """
-        Fetch aggregated visitor data using optimized SQL query.
-        Groups by date and counts visitors.
-        ✅ FIX: Removed CURRENT_DATE check to show data till today.
+    @sql_label("visitor.by_period")
+    def _fetch_visitors_by_period(self, date_range):
         """
-        # ✅ FIX: Removed "AND visit_date <= CURRENT_DATE" from query
-        query = """
-        SELECT
-            visit_date,
-            COUNT(*) as visitor_count
-        FROM visit_customers
-        WHERE visit_date >= %s
-            AND visit_date <= %s
-            AND account_id IS NOT NULL
-        GROUP BY visit_date
-        ORDER BY visit_date ASC
+        Aligned current and previous year daily visitor counts from the
+        golfzon_daily_metrics rollup, see _fetch_daily_series.
         """
+        return self._fetch_daily_series(date_range, "visitor_count", "count")
 
-        request.env.cr.execute(query, (start_date, end_date))
-        results = request.env.cr.dictfetchall()
-
-        _logger.info(
-            f"Fetched {len(results)} days with data between {start_date} and {end_date}"
-        )
-
-        # Create a complete date range with zero values for missing dates
-        date_dict = {}
-        current_date = start_date
-        while current_date <= end_date:
-            date_dict[current_date.strftime("%Y-%m-%d")] = {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "count": 0,
-            }
-            current_date += timedelta(days=1)
-
-        # Fill in actual data
-        for row in results:
-            date_key = row["visit_date"].strftime("%Y-%m-%d")
-            if date_key in date_dict:
-                date_dict[date_key]["count"] = row["visitor_count"]
-
-        # Convert to list maintaining order
-        result_list = list(date_dict.values())
-
-        # Log summary
-        total_count = sum(day["count"] for day in result_list)
-        days_with_data = len([day for day in result_list if day["count"] > 0])
-
-        _logger.info(
-            f"Total visitors for period: {total_count}, Days with data: {days_with_data}/{len(result_list)}"
-        )
-
-        return result_list
-
+    @sql_label("visitor.sections")
     def _fetch_visitor_sections(self, start_date, end_date):
         """
-        Fetch visitor counts by time sections for the given date range.
+        Fetch visitor counts by time sections for the given date range,
+        from the time part stored on each visit (see TIME_PARTS).
         Part 1: 5 AM - 12 PM (05:00 - 12:00)
         Part 2: 12 PM - 4 PM (12:00 - 16:00)
         Part 3: 4 PM - 7 PM (16:00 - 19:00)
         """
-        try:
-            # First check if time_table exists
-            request.env.cr.execute(
-                """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'time_table'
-                )
-            """
-            )
-            table_exists = request.env.cr.fetchone()[0]
-
-            if not table_exists:
-                _logger.warning(
-                    "time_table does not exist, using fallback distribution"
-                )
-                raise Exception("Table not found")
-
-            query = """
-                SELECT
-                    CASE 
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 5 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 12 THEN 'part1'
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 12 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 16 THEN 'part2'
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 16 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 19 THEN 'part3'
-                        ELSE 'other'
-                    END as section,
-                    COUNT(DISTINCT vc.customer_id) as visitor_count
-                FROM visit_customers vc
-                LEFT JOIN time_table_has_bookg_infos ttbi ON vc.bookg_info_id::integer = ttbi.bookg_info_id::integer
-                LEFT JOIN time_table tt ON ttbi.time_table_id = tt.time_table_id
-                WHERE vc.visit_date >= %s
-                    AND vc.visit_date <= %s
-                    AND tt.bookg_time IS NOT NULL
-                GROUP BY section
-            """
-
-            request.env.cr.execute(query, (start_date, end_date))
-            results = request.env.cr.dictfetchall()
-
-            sections = {"part1": 0, "part2": 0, "part3": 0}
-
-            for row in results:
-                if row["section"] in sections:
-                    sections[row["section"]] = row["visitor_count"]
-
-            _logger.info(f"Section breakdown: {sections}")
-            return sections
-
-        except Exception as e:
-            _logger.error(
-                f"Error fetching sections: {str(e)}, using fallback distribution"
-            )
-            # Rollback the failed transaction
-            request.env.cr.rollback()
+        query = """
+            SELECT
+                time_part AS section,
+                COUNT(DISTINCT customer_id) AS visitor_count
+            FROM visit_customers
+            WHERE visit_date >= %s
+                AND visit_date <= %s
+                AND time_part IN ('part1', 'part2', 'part3')
+            GROUP BY time_part
+        """
+        request.env.cr.execute(query, (start_date, end_date))
 
-            # Fallback: distribute evenly
-            total_query = """
-                SELECT COUNT(*) as total
-                FROM visit_customers
-                WHERE visit_date >= %s
-                    AND visit_date <= %s
-            """
-            request.env.cr.execute(total_query, (start_date, end_date))
-            total_result = request.env.cr.fetchone()
-            total = total_result[0] if total_result else 0
+        sections = {"part1": 0, "part2": 0, "part3": 0}
+        for row in request.env.cr.dictfetchall():
+            sections[row["section"]] = row["visitor_count"]
 
-            return {
-                "part1": int(total * 0.5),
-                "part2": int(total * 0.3),
-                "part3": int(total * 0.2),
-            }
+        _logger.info(f"Section breakdown: {sections}")
+        return sections
 
     # Gender Ratio Data
-    def _fetch_gender_ratio(self):
+    @sql_label("visitor.gender_ratio")
+    def _fetch_gender_ratio(self, start_date=None, end_date=None):
         """
-        Fetch gender ratio from entire visit_customers table.
+        Fetch gender ratio of all visits, or of the visits between start_date
+        and end_date, from the golfzon.gender.counter rollup.
         Returns percentage of male and female visitors.
-        Handles cases where gender_scd might be empty or null.
-        """
-        query = """
-            SELECT
-                gender_scd,
-                COUNT(*) as count
-            FROM visit_customers
-            WHERE gender_scd IS NOT NULL 
-                AND gender_scd != ''
-            GROUP BY gender_scd
+        Visits without gender_scd are not counted.
         """
-
-        request.env.cr.execute(query)
-        results = request.env.cr.dictfetchall()
-
-        # Calculate total count
-        total_count = sum(row["count"] for row in results)
+        counts = request.env["golfzon.gender.counter"].sudo()._gender_counts(start_date, end_date)
+        male_count = counts["male"]
+        female_count = counts["female"]
+        total_count = male_count + female_count + counts["other"]
 
         if total_count == 0:
             _logger.warning("No gender data found in visit_customers table")
@@ -1055,24 +1130,6 @@ class SalesStatusController(http.Controller):
                 "total_count": 0,
             }
 
-        # Initialize counts
-        male_count = 0
-        female_count = 0
-
-        # Map gender codes to male/female
-        # Adjust these mappings based on your actual gender_scd values
-        male_codes = ["M", "Male", "male", "1", "남", "남성"]
-        female_codes = ["F", "Female", "female", "2", "여", "여성"]
-
-        for row in results:
-            gender = row["gender_scd"]
-            count = row["count"]
-
-            if gender in male_codes:
-                male_count += count
-            elif gender in female_codes:
-                female_count += count
-
         # Calculate percentages
         male_percentage = (
             round((male_count / total_count) * 100, 1) if total_count > 0 else 0
@@ -1095,192 +1152,58 @@ class SalesStatusController(http.Controller):
 
     # Age Group Data
     @http.route("/golfzon/age_group_data", type="json", auth="user", methods=["POST"])
+    @instrumented
+    @cached_endpoint("age_group_data", depends=("golfzon.person",))
     def get_age_group_data(self):
         """Fetch age group distribution from golfzon_person table"""
         try:
             start_time = datetime.now()
-            _logger.info("=" * 60)
-            _logger.info("STARTING AGE GROUP DATA FETCH")
 
             age_distribution = self._fetch_age_group_distribution()
 
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
 
-            _logger.info(f"Age data fetch completed in {execution_time:.2f}ms")
-            _logger.info(f"Returning: {age_distribution}")
-            _logger.info("=" * 60)
+            _logger.info(f"Age data fetched in {execution_time:.2f}ms")
 
             return {
                 "success": True,
-                "data": age_distribution,
-                "execution_time_ms": round(execution_time, 2),
-            }
-
-        except Exception as e:
-            _logger.error(f"ERROR in get_age_group_data: {str(e)}", exc_info=True)
-            return {
-                "success": False,
-                "error": str(e),
-                "data": self._get_empty_age_data(),
-            }
-
-    def _fetch_age_group_distribution(self):
-        """
-        ✅ FIXED: Calculate age distribution from golfzon_person table.
-        Now properly handles birth_date as a Date field (not Char).
-        """
-        start_time = datetime.now()
-        
-        _logger.info("="*70)
-        _logger.info("=== FETCHING AGE DISTRIBUTION DATA ===")
-        _logger.info("="*70)
-        
-        # Step 1: Check if golfzon_person table has data
-        Person = request.env["golfzon.person"].sudo()
-        total_persons = Person.search_count([])
-        
-        _logger.info(f"Step 1: Total persons in golfzon_person table: {total_persons}")
-        
-        if total_persons == 0:
-            _logger.error("❌ NO DATA in golfzon_person table!")
-            return self._get_empty_age_data()
-        
-        # Step 2: Check how many have valid birth dates
-        persons_with_birthdate = Person.search_count([
-            ('birth_date', '!=', False)
-        ])
-        
-        _logger.info(f"Step 2: Persons with birth_date: {persons_with_birthdate}")
-        
-        if persons_with_birthdate == 0:
-            _logger.error("❌ NO birth_date data found!")
-            return self._get_empty_age_data()
-        
-        # ✅ FIX: Query for Date field (not Char field)
-        # When birth_date is fields.Date(), it's stored as DATE type in PostgreSQL
-        query = """
-        WITH age_calc AS (
-            SELECT
-                person_code,
-                birth_date,
-                CASE
-                    WHEN birth_date IS NULL THEN NULL
-                    ELSE DATE_PART('year', AGE(CURRENT_DATE, birth_date))
-                END as age
-            FROM golfzon_person
-            WHERE deleted_at IS NULL
-        ),
-        age_groups AS (
-            SELECT
-                CASE
-                    WHEN age IS NULL OR age < 0 OR age > 150 THEN 'unknown'
-                    WHEN age < 10 THEN 'under_10'
-                    WHEN age >= 10 AND age < 20 THEN '20s'
-                    WHEN age >= 20 AND age < 30 THEN '20s'
-                    WHEN age >= 30 AND age < 40 THEN '30s'
-                    WHEN age >= 40 AND age < 50 THEN '40s'
-                    WHEN age >= 50 AND age < 60 THEN '50s'
-                    WHEN age >= 60 THEN '60_plus'
-                    ELSE 'unknown'
-                END as age_group,
-                age,
-                person_code
-            FROM age_calc
-        )
-        SELECT 
-            age_group,
-            COUNT(*) as person_count,
-            MIN(age) as min_age,
-            MAX(age) as max_age
-        FROM age_groups
-        WHERE age_group != 'unknown'
-        GROUP BY age_group
-        ORDER BY
-            CASE age_group
-                WHEN '60_plus' THEN 1
-                WHEN '50s' THEN 2
-                WHEN '40s' THEN 3
-                WHEN '30s' THEN 4
-                WHEN '20s' THEN 5
-                WHEN 'under_10' THEN 6
-                ELSE 7
-            END
-        """
-        
-        try:
-            _logger.info("Step 3: Executing age distribution query (Date field version)...")
-            request.env.cr.execute(query)
-            results = request.env.cr.dictfetchall()
-            
-            _logger.info(f"✅ Query returned {len(results)} age groups")
-            
-            # Initialize all groups with zero
-            age_groups = {
-                "under_10": 0,
-                "20s": 0,
-                "30s": 0,
-                "40s": 0,
-                "50s": 0,
-                "60_plus": 0,
-            }
-            
-            total_count = 0
-            
-            # Process results
-            for row in results:
-                group = row["age_group"]
-                count = row["person_count"]
-                min_age = row.get("min_age")
-                max_age = row.get("max_age")
-                
-                _logger.info(f"  ✅ {group}: {count} people (ages {min_age}-{max_age})")
-                
-                if group in age_groups:
-                    age_groups[group] = count
-                    total_count += count
-            
-            _logger.info(f"📊 Total persons with valid age data: {total_count}")
-            
-            # If no valid data found, return empty structure
-            if total_count == 0:
-                _logger.error("❌ NO VALID AGE DATA after calculation!")
-                _logger.error("Possible issues:")
-                _logger.error("  1. All birth_date values are NULL")
-                _logger.error("  2. All ages fall outside valid ranges (0-150)")
-                _logger.error("  3. All records have deleted_at set")
-                _logger.error("  4. birth_date field type mismatch in database")
-                return self._get_empty_age_data()
-            
-            # Calculate percentages
-            age_percentages = {}
-            for group, count in age_groups.items():
-                percentage = round((count / total_count * 100), 1) if total_count > 0 else 0
-                age_percentages[group] = {
-                    "count": count,
-                    "percentage": percentage
-                }
-                _logger.info(f"  📊 {group}: {count} people ({percentage}%)")
-            
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds() * 1000
-            
-            result = {
-                "age_groups": age_percentages,
-                "total_count": total_count,
+                "data": age_distribution,
+                "execution_time_ms": round(execution_time, 2),
             }
-            
-            _logger.info(f"✅ Age distribution calculated in {execution_time:.2f}ms")
-            _logger.info(f"✅ FINAL RESULT: {result}")
-            _logger.info("="*70)
-            
-            return result
-            
+
         except Exception as e:
-            _logger.error(f"❌ SQL ERROR in age distribution: {str(e)}", exc_info=True)
-            request.env.cr.rollback()
+            _logger.error(f"ERROR in get_age_group_data: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "data": self._get_empty_age_data(),
+            }
+
+    @sql_label("age.distribution")
+    def _fetch_age_group_distribution(self):
+        """
+        Age distribution of the persons not deleted, from the in-memory
+        histogram: persons per birth date are loaded once, ages bucketed
+        once per day (see utils.age_histogram).
+        """
+        age_groups = request.env["golfzon.person"].sudo()._age_histogram()
+        total_count = sum(age_groups.values())
+
+        if total_count == 0:
             return self._get_empty_age_data()
 
+        return {
+            "age_groups": {
+                group: {
+                    "count": count,
+                    "percentage": round((count / total_count * 100), 1),
+                }
+                for group, count in age_groups.items()
+            },
+            "total_count": total_count,
+        }
+
     def _get_empty_age_data(self):
         """Return empty age data structure when no data is available"""
         _logger.warning("⚠️ Returning empty age data structure")
@@ -1296,47 +1219,155 @@ class SalesStatusController(http.Controller):
             "total_count": 0,
         }
 
-    # RESERVATION TREND DATA
-    @http.route("/golfzon/reservation_trend_data", type="json", auth="user", methods=["POST"])
-    def get_reservation_trend_data(self, period="30days"):
+    # Segment Cross-tab
+    @http.route("/golfzon/segments/crosstab", type="json", auth="user", methods=["POST"])
+    @instrumented
+    @cached_endpoint("segments_crosstab", ttl=SEGMENT_CACHE_TTL_SECONDS)
+    def get_segment_crosstab(self, start_date=None, end_date=None):
         """
-        Fetch reservation trend data from time_table with millisecond performance.
-        Returns ONLY HISTORICAL DATA - NO FUTURE DATES.
+        Persons and visits by age group, gender and visit count band, with
+        every subtotal ("all" in the collapsed dimensions), from a single
+        CUBE aggregation over golfzon_person and visit_customers.
+        Visits are counted over start_date..end_date when given, over all
+        visits otherwise. Cached for the day, whatever is written meanwhile.
         """
         try:
             start_time = datetime.now()
-            _logger.info(
-                f"=== Fetching Reservation Trend Data for period: {period} ==="
+            date_range = None
+            if start_date or end_date:
+                date_range = self._custom_date_range(start_date, end_date)
+
+            cells = self._fetch_segment_crosstab(
+                date_range and date_range["current_start"],
+                date_range and date_range["current_end"],
             )
 
-            # Calculate date range (NO FUTURE DATES)
-            date_range = self._calculate_reservation_date_range(period)
+            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            _logger.info(f"Segment cross-tab ({len(cells)} cells) fetched in {execution_time:.2f}ms")
+            return {
+                "success": True,
+                "data": {
+                    "dimensions": {
+                        "age_group": list(AGE_GROUPS) + ["unknown"],
+                        "gender": ["male", "female", "other"],
+                        "visit_band": list(VISIT_BANDS),
+                    },
+                    "cells": cells,
+                    "date_range": date_range and {
+                        "start": date_range["current_start"].strftime("%Y-%m-%d"),
+                        "end": date_range["current_end"].strftime("%Y-%m-%d"),
+                    },
+                    "execution_time_ms": round(execution_time, 2),
+                },
+            }
+        except ValueError as e:
+            _logger.warning(f"Invalid segment cross-tab request: {str(e)}")
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            _logger.error(f"Error fetching segment cross-tab: {str(e)}", exc_info=True)
+            return {"success": False, "error": str(e)}
 
-            # Fetch current and previous year data
-            current_year_data = self._fetch_reservations_by_period(
-                date_range["current_start"], date_range["current_end"]
+    @sql_label("segments.crosstab")
+    def _fetch_segment_crosstab(self, start_date=None, end_date=None):
+        """
+        Run the CUBE aggregation. Persons without visits in the range are in
+        the "none" band, persons without a plausible birth date in the
+        "unknown" age group. Age groups follow utils.age_histogram.
+        """
+        visit_filter = ""
+        if start_date and end_date:
+            visit_filter = "AND visit_date BETWEEN %(start)s AND %(end)s"
+        query = f"""
+            WITH visits AS (
+                SELECT person_code, COUNT(*) AS visit_count
+                FROM visit_customers
+                WHERE person_code IS NOT NULL
+                    AND person_code != ''
+                    {visit_filter}
+                GROUP BY person_code
+            ),
+            segments AS (
+                SELECT
+                    CASE
+                        WHEN age IS NULL OR age < 0 OR age > %(max_age)s THEN 'unknown'
+                        WHEN age < 10 THEN 'under_10'
+                        WHEN age < 30 THEN '20s'
+                        WHEN age < 40 THEN '30s'
+                        WHEN age < 50 THEN '40s'
+                        WHEN age < 60 THEN '50s'
+                        ELSE '60_plus'
+                    END AS age_group,
+                    gender,
+                    CASE
+                        WHEN visit_count = 0 THEN 'none'
+                        WHEN visit_count < 5 THEN '5_under'
+                        WHEN visit_count <= 10 THEN '5_10'
+                        ELSE '10_more'
+                    END AS visit_band,
+                    visit_count
+                FROM (
+                    SELECT
+                        DATE_PART('year', AGE(%(today)s, p.birth_date)) AS age,
+                        CASE
+                            WHEN p.gender_scd IS NULL OR p.gender_scd = '' THEN 'other'
+                            ELSE {GENDER_EXPRESSION}
+                        END AS gender,
+                        COALESCE(v.visit_count, 0) AS visit_count
+                    FROM golfzon_person p
+                    LEFT JOIN visits v ON v.person_code = p.person_code
+                    WHERE p.deleted_at IS NULL
+                ) persons
             )
+            SELECT
+                CASE WHEN GROUPING(age_group) = 1 THEN 'all' ELSE age_group END AS age_group,
+                CASE WHEN GROUPING(gender) = 1 THEN 'all' ELSE gender END AS gender,
+                CASE WHEN GROUPING(visit_band) = 1 THEN 'all' ELSE visit_band END AS visit_band,
+                COUNT(*) AS persons,
+                SUM(visit_count) AS visits
+            FROM segments
+            GROUP BY CUBE (age_group, gender, visit_band)
+        """
+        request.env.cr.execute(
+            query,
+            {
+                "start": start_date,
+                "end": end_date,
+                "today": date.today(),
+                "max_age": MAX_AGE,
+                "male_codes": list(MALE_CODES),
+                "female_codes": list(FEMALE_CODES),
+            },
+        )
+        return [
+            {**row, "visits": int(row["visits"] or 0)}
+            for row in request.env.cr.dictfetchall()
+        ]
 
-            previous_year_data = self._fetch_reservations_by_period(
-                date_range["previous_start"], date_range["previous_end"]
-            )
+    # RESERVATION TREND DATA
+    @http.route("/golfzon/reservation_trend_data", type="json", auth="user", methods=["POST"])
+    @instrumented
+    @cached_endpoint("reservation_trend_data", depends=("time.table", "golfzon.daily.metrics"))
+    def get_reservation_trend_data(self, period="30days"):
+        """
+        Fetch reservation trend data from time_table with millisecond performance.
+        Returns ONLY HISTORICAL DATA - NO FUTURE DATES.
+        The reference date, both daily series and the operation rate come
+        from one statement, see _fetch_reservation_trend.
+        """
+        try:
+            start_time = datetime.now()
+            _logger.info(f"Fetching reservation trend data for period: {period}")
 
-            # Calculate total reservations
-            total_current = sum(day["count"] for day in current_year_data)
-            total_previous = sum(day["count"] for day in previous_year_data)
+            days = 7 if period == "7days" else 30
+            trend = self._fetch_reservation_trend(days)
 
             # Calculate percentage change
             percentage_change = 0
-            if total_previous > 0:
+            if trend["previous_total"] > 0:
                 percentage_change = (
-                    (total_current - total_previous) / total_previous
+                    (trend["current_total"] - trend["previous_total"]) / trend["previous_total"]
                 ) * 100
 
-            # Calculate operation rate by time slots
-            operation_rate = self._calculate_operation_rate(
-                date_range["current_start"], date_range["current_end"]
-            )
-
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
 
@@ -1345,15 +1376,15 @@ class SalesStatusController(http.Controller):
             return {
                 "success": True,
                 "data": {
-                    "current_year": current_year_data,
-                    "previous_year": previous_year_data,
-                    "total_reservations": total_current,
+                    "current_year": trend["current"],
+                    "previous_year": trend["previous"],
+                    "total_reservations": trend["current_total"],
                     "percentage_change": round(percentage_change, 1),
-                    "operation_rate": operation_rate,
+                    "operation_rate": trend["operation_rate"],
                     "period": period,
                     "date_range": {
-                        "start": date_range["current_start"].strftime("%Y-%m-%d"),
-                        "end": date_range["current_end"].strftime("%Y-%m-%d"),
+                        "start": trend["current_start"].strftime("%Y-%m-%d"),
+                        "end": trend["current_end"].strftime("%Y-%m-%d"),
                     },
                     "execution_time_ms": round(execution_time, 2),
                 },
@@ -1365,235 +1396,174 @@ class SalesStatusController(http.Controller):
             )
             return {"success": False, "error": str(e)}
 
-    def _calculate_reservation_date_range(self, period):
-        """
-        Calculate date ranges for reservation data.
-        Uses ONLY historical data - NO FUTURE DATES.
-        """
-        TimeTable = request.env["time.table"].sudo()
-
-        # Get today's date (never use future dates)
-        today = datetime.now().date()
-        _logger.info(f"📅 Today's date: {today}")
-
-        # Get latest booking date from database that is NOT in the future
-        latest_record = TimeTable.search(
-            [
-                ("account_id", "!=", False),
-                ("bookg_date", "<=", today),  # ✅ CRITICAL: Only past and today
-            ],
-            order="bookg_date desc",
-            limit=1,
-        )
-
-        if latest_record and latest_record.bookg_date:
-            reference_date = latest_record.bookg_date
-            _logger.info(
-                f"✅ Using latest booking date from database: {reference_date}"
-            )
-        else:
-            reference_date = today
-            _logger.warning(f"⚠️  No booking data found, using today: {reference_date}")
-
-        # Calculate days based on period
-        days = 7 if period == "7days" else 30
-
-        # Current year range - STRICTLY HISTORICAL
-        current_end = reference_date
-        current_start = current_end - timedelta(days=days - 1)
-
-        # Ensure start date is not in the future
-        if current_start > today:
-            current_start = today - timedelta(days=days - 1)
-            current_end = today
-            _logger.warning(f"⚠️  Adjusted dates to prevent future dates")
-
-        # Previous year range (same dates, previous year)
-        try:
-            previous_end = datetime(
-                current_end.year - 1, current_end.month, current_end.day
-            ).date()
-            previous_start = datetime(
-                current_start.year - 1, current_start.month, current_start.day
-            ).date()
-        except ValueError:
-            # Handle Feb 29 in leap years
-            previous_end = datetime(
-                current_end.year - 1, current_end.month, current_end.day - 1
-            ).date()
-            previous_start = datetime(
-                current_start.year - 1, current_start.month, current_start.day - 1
-            ).date()
-
-        _logger.info(f"📊 Period: {period}, Days: {days}")
-        _logger.info(f"📅 Current Period: {current_start} to {current_end}")
-        _logger.info(f"📅 Previous Period: {previous_start} to {previous_end}")
-
-        # Final validation - ensure no future dates
-        if current_end > today:
-            _logger.error(
-                f"❌ ERROR: current_end ({current_end}) is in future! Adjusting..."
-            )
-            current_end = today
-            current_start = current_end - timedelta(days=days - 1)
-
-        if current_start > today:
-            _logger.error(
-                f"❌ ERROR: current_start ({current_start}) is in future! Adjusting..."
-            )
-            current_start = today - timedelta(days=days - 1)
-
-        return {
-            "current_start": current_start,
-            "current_end": current_end,
-            "previous_start": previous_start,
-            "previous_end": previous_end,
-            "days": days,
-        }
-
-    def _fetch_reservations_by_period(self, start_date, end_date):
-        """
-        Fetch reservation counts using optimized SQL query.
-        ONLY fetches historical data - NO FUTURE DATES.
-        """
-        # Additional safety check - ensure end_date is not in future
-        today = datetime.now().date()
-        if end_date > today:
-            _logger.warning(
-                f"⚠️  end_date ({end_date}) is in future, adjusting to today ({today})"
-            )
-            end_date = today
-
-        # Direct SQL with CURRENT_DATE check
-        query = """
-            SELECT 
-                bookg_date,
-                COUNT(*) as reservation_count
-            FROM time_table
-            WHERE bookg_date >= %s
-                AND bookg_date <= %s
-                AND bookg_date <= CURRENT_DATE
-                AND account_id IS NOT NULL
-            GROUP BY bookg_date
-            ORDER BY bookg_date ASC
-        """
-
-        request.env.cr.execute(query, (start_date, end_date))
-        results = request.env.cr.dictfetchall()
-
-        _logger.info(
-            f"📊 Fetched {len(results)} days with reservations between {start_date} and {end_date}"
-        )
-
-        # Create complete date range with zero values for missing dates
-        date_dict = {}
-        current_date = start_date
-        actual_end = min(end_date, today)  # Don't create entries for future dates
-
-        while current_date <= actual_end:
-            date_dict[current_date.strftime("%Y-%m-%d")] = {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "count": 0,
-            }
-            current_date += timedelta(days=1)
-
-        # Fill in actual reservation counts
-        for row in results:
-            date_key = row["bookg_date"].strftime("%Y-%m-%d")
-            if date_key in date_dict:
-                date_dict[date_key]["count"] = row["reservation_count"]
-
-        # Convert to list maintaining chronological order
-        result_list = list(date_dict.values())
-
-        total_count = sum(day["count"] for day in result_list)
-        days_with_data = len([day for day in result_list if day["count"] > 0])
-
-        _logger.info(
-            f"✅ Total reservations: {total_count}, Days with data: {days_with_data}/{len(result_list)}"
-        )
-
-        return result_list
-
-    def _calculate_operation_rate(self, start_date, end_date):
+    @sql_label("reservation.trend")
+    def _fetch_reservation_trend(self, days):
         """
-        Calculate operation rate by time slots.
+        One statement for the whole reservation trend:
+        - reference date: latest booking watermark of an account, never
+          after today (the previous year range moves Feb 29 to Feb 28);
+        - aligned current and previous year daily reservation counts from
+          golfzon_daily_metrics, with their totals;
+        - reservations per time part over the current range from time_table
+          (the operation rate), repeated on every row.
         ONLY HISTORICAL DATA - NO FUTURE DATES.
         """
-        # Safety check - ensure end_date is not in future
-        today = datetime.now().date()
-        if end_date > today:
-            _logger.warning(
-                f"⚠️  end_date ({end_date}) is in future, adjusting to today ({today})"
-            )
-            end_date = today
-
         query = """
-            SELECT
-                CASE
-                    WHEN EXTRACT(HOUR FROM bookg_time::time) >= 5
-                        AND EXTRACT(HOUR FROM bookg_time::time) < 12 THEN 'part1'
-                    WHEN EXTRACT(HOUR FROM bookg_time::time) >= 12
-                        AND EXTRACT(HOUR FROM bookg_time::time) < 16 THEN 'part2'
-                    WHEN EXTRACT(HOUR FROM bookg_time::time) >= 16
-                        AND EXTRACT(HOUR FROM bookg_time::time) < 19 THEN 'part3'
-                    ELSE 'other'
-                END as time_slot,
-                COUNT(*) as reservation_count
-            FROM time_table
-            WHERE bookg_date >= %s
-                AND bookg_date <= %s
-                AND bookg_date <= CURRENT_DATE
-                AND account_id IS NOT NULL
-                AND bookg_time IS NOT NULL
-            GROUP BY time_slot
-        """
-
-        request.env.cr.execute(query, (start_date, end_date))
-        results = request.env.cr.dictfetchall()
-
-        # Initialize counts
-        slot_counts = {"part1": 0, "part2": 0, "part3": 0}
-        total_count = 0
-
-        for row in results:
-            if row["time_slot"] in slot_counts:
-                slot_counts[row["time_slot"]] = row["reservation_count"]
-                total_count += row["reservation_count"]
-
-        # Calculate percentages
-        operation_data = {
-            "part1_percentage": (
-                round((slot_counts["part1"] / total_count * 100), 1)
-                if total_count > 0
-                else 0
+            WITH reference AS (
+                SELECT
+                    LEAST(COALESCE(MAX(latest_date), CURRENT_DATE), CURRENT_DATE) AS current_end
+                FROM golfzon_data_watermark
+                WHERE source = 'booking'
+                    AND account_id != 0
+            ),
+            ranges AS (
+                SELECT
+                    current_end - (%(days)s - 1) AS current_start,
+                    current_end,
+                    (current_end - (%(days)s - 1) - interval '1 year')::date AS previous_start,
+                    (current_end - interval '1 year')::date AS previous_end
+                FROM reference
             ),
-            "part2_percentage": (
-                round((slot_counts["part2"] / total_count * 100), 1)
-                if total_count > 0
-                else 0
+            current_days AS (
+                SELECT d::date AS day, n
+                FROM ranges, generate_series(current_start, current_end, interval '1 day')
+                    WITH ORDINALITY AS g(d, n)
             ),
-            "part3_percentage": (
-                round((slot_counts["part3"] / total_count * 100), 1)
-                if total_count > 0
-                else 0
+            previous_days AS (
+                SELECT d::date AS day, n
+                FROM ranges, generate_series(previous_start, previous_end, interval '1 day')
+                    WITH ORDINALITY AS g(d, n)
             ),
-            "part1_count": slot_counts["part1"],
-            "part2_count": slot_counts["part2"],
-            "part3_count": slot_counts["part3"],
+            daily AS (
+                SELECT metric_date, SUM(reservation_count) AS reservation_count
+                FROM golfzon_daily_metrics, ranges
+                WHERE metric_date BETWEEN current_start AND current_end
+                    OR metric_date BETWEEN previous_start AND previous_end
+                GROUP BY metric_date
+            ),
+            parts AS (
+                SELECT
+                    COUNT(*) FILTER (WHERE bookg_time >= 5 AND bookg_time < 12) AS part1_count,
+                    COUNT(*) FILTER (WHERE bookg_time >= 12 AND bookg_time < 16) AS part2_count,
+                    COUNT(*) FILTER (WHERE bookg_time >= 16 AND bookg_time < 19) AS part3_count
+                FROM time_table, ranges
+                WHERE bookg_date BETWEEN current_start AND current_end
+                    AND bookg_date <= CURRENT_DATE
+                    AND account_id IS NOT NULL
+                    AND bookg_time IS NOT NULL
+            )
+            SELECT
+                r.current_start,
+                r.current_end,
+                c.day AS current_date,
+                p.day AS previous_date,
+                COALESCE(dc.reservation_count, 0) AS current_count,
+                COALESCE(dp.reservation_count, 0) AS previous_count,
+                SUM(COALESCE(dc.reservation_count, 0)) OVER () AS current_total,
+                SUM(COALESCE(dp.reservation_count, 0)) OVER () AS previous_total,
+                parts.part1_count,
+                parts.part2_count,
+                parts.part3_count
+            FROM current_days c
+            FULL JOIN previous_days p USING (n)
+            LEFT JOIN daily dc ON dc.metric_date = c.day
+            LEFT JOIN daily dp ON dp.metric_date = p.day
+            CROSS JOIN ranges r
+            CROSS JOIN parts
+            ORDER BY n
+        """
+        request.env.cr.execute(query, {"days": days})
+
+        trend = {"current": [], "previous": [], "current_total": 0, "previous_total": 0}
+        slot_counts = {"part1": 0, "part2": 0, "part3": 0}
+        for row in request.env.cr.dictfetchall():
+            if "current_start" not in trend:
+                # Values repeated on every row
+                trend["current_start"] = row["current_start"]
+                trend["current_end"] = row["current_end"]
+                trend["current_total"] = int(row["current_total"])
+                trend["previous_total"] = int(row["previous_total"])
+                slot_counts = {part: row[f"{part}_count"] for part in slot_counts}
+            for side in ("current", "previous"):
+                if row[f"{side}_date"] is not None:
+                    trend[side].append({
+                        "date": row[f"{side}_date"].strftime("%Y-%m-%d"),
+                        "count": int(row[f"{side}_count"]),
+                    })
+
+        total_count = sum(slot_counts.values())
+        trend["operation_rate"] = {
+            **{
+                f"{part}_percentage": (
+                    round((count / total_count * 100), 1) if total_count > 0 else 0
+                )
+                for part, count in slot_counts.items()
+            },
+            **{f"{part}_count": count for part, count in slot_counts.items()},
             "total_operations": total_count,
         }
+        _logger.info(
+            f"Reservation trend {trend['current_start']} to {trend['current_end']}: "
+            f"{trend['current_total']} reservations, operation rate {trend['operation_rate']}"
+        )
+        return trend
+
+    # Reservation Forecast
+    @http.route("/golfzon/reservation/forecast", type="json", auth="user", methods=["POST"])
+    @instrumented
+    @cached_endpoint("reservation_forecast", depends=("golfzon.reservation.forecast",))
+    def get_reservation_forecast(self, horizon=MIN_FORECAST_HORIZON_DAYS):
+        """
+        Daily reservation forecast with its 95% confidence band, for the
+        next ``horizon`` days (14 to 30) after the reference date. Served
+        from the nightly fit of golfzon.reservation.forecast.
+        """
+        try:
+            start_time = datetime.now()
+            horizon = int(horizon)
+            if not MIN_FORECAST_HORIZON_DAYS <= horizon <= MAX_HORIZON_DAYS:
+                raise ValueError(
+                    f"The horizon must be between {MIN_FORECAST_HORIZON_DAYS} and {MAX_HORIZON_DAYS} days"
+                )
 
-        _logger.info(f"Operation rate breakdown: {operation_data}")
+            forecast = request.env["golfzon.reservation.forecast"].sudo()._latest()
+            points = json.loads(forecast.points)[:horizon]
 
-        return operation_data
+            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            return {
+                "success": True,
+                "data": {
+                    "points": points,
+                    "horizon": horizon,
+                    "reference_date": forecast.reference_date.strftime("%Y-%m-%d"),
+                    "fitted_at": forecast.fitted_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    "history_days": forecast.history_days,
+                    "residual_std": round(forecast.residual_std, 2),
+                    "coefficients": json.loads(forecast.coefficients),
+                    "confidence": 0.95,
+                    "execution_time_ms": round(execution_time, 2),
+                },
+            }
+        except (ValueError, ForecastUnavailable) as e:
+            _logger.warning(f"Reservation forecast unavailable: {str(e)}")
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            _logger.error(f"Error fetching reservation forecast: {str(e)}", exc_info=True)
+            return {"success": False, "error": str(e)}
 
     # Heatmap Data
     @http.route('/golfzon/heatmap/data', type='json', auth='user', methods=['POST'])
-    def get_heatmap_data(self, **kwargs):
+    @instrumented
+    @cached_endpoint("heatmap_data", depends=("time.table", "golfzon.booking.hour.cube"))
+    def get_heatmap_data(self, window="7days", start_date=None, end_date=None, account_id=None):
         """
         Fetch heatmap data for reservation trends with millisecond performance.
-        Returns team counts aggregated by day of week and time slots.
+        Returns team counts aggregated by day of week and time slots, summed
+        from the booking hour cube over the window.
+
+        :param window: one of HEATMAP_WINDOWS, or "custom" with start_date
+            and end_date (YYYY-MM-DD)
+        :param account_id: restrict the counts to one account
         
         Time Slots:
         - Early Morning: 5 AM - 7 AM (05:00 - 06:59)
@@ -1606,65 +1576,18 @@ class SalesStatusController(http.Controller):
             _logger.info("=" * 70)
             _logger.info("FETCHING HEATMAP DATA - RESERVATION TRENDS")
             
-            # Get date range for the current week (last 7 days from latest booking)
-            date_range = self._calculate_heatmap_date_range()
+            date_range = self._calculate_heatmap_date_range(window, start_date, end_date)
             start_date = date_range['start_date']
             end_date = date_range['end_date']
             
-            _logger.info(f"Date Range: {start_date} to {end_date}")
-            
-            # Execute optimized SQL query with proper joins and time slot grouping
-            query = """
-                WITH booking_data AS (
-                    SELECT 
-                        tt.bookg_date,
-                        tt.bookg_time,
-                        EXTRACT(DOW FROM tt.bookg_date) as day_of_week,
-                        EXTRACT(HOUR FROM tt.bookg_time::time) as hour_of_day,
-                        COALESCE(bi.play_team_cnt, 0) as team_count,
-                        CASE 
-                            WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 5 
-                                AND EXTRACT(HOUR FROM tt.bookg_time::time) < 8 THEN 'early morning'
-                            WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 8 
-                                AND EXTRACT(HOUR FROM tt.bookg_time::time) < 13 THEN 'morning'
-                            WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 13 
-                                AND EXTRACT(HOUR FROM tt.bookg_time::time) < 17 THEN 'afternoon'
-                            WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 17 
-                                AND EXTRACT(HOUR FROM tt.bookg_time::time) < 20 THEN 'night'
-                            ELSE NULL
-                        END as time_slot
-                    FROM time_table tt
-                    INNER JOIN time_table_has_bookg_infos ttbi 
-                        ON tt.time_table_id = ttbi.time_table_id
-                    INNER JOIN booking_info bi 
-                        ON ttbi.bookg_info_id::integer = bi.bookg_info_id
-                    WHERE 
-                        tt.bookg_date >= %s 
-                        AND tt.bookg_date <= %s
-                        AND tt.bookg_date IS NOT NULL
-                        AND tt.bookg_time IS NOT NULL
-                        AND bi.play_team_cnt > 0
-                )
-                SELECT 
-                    day_of_week,
-                    time_slot,
-                    SUM(team_count) as total_teams
-                FROM booking_data
-                WHERE time_slot IS NOT NULL
-                GROUP BY day_of_week, time_slot
-                ORDER BY day_of_week, time_slot;
-            """
-            
-            request.env.cr.execute(query, (start_date, end_date))
-            results = request.env.cr.dictfetchall()
-            
-            _logger.info(f"Query returned {len(results)} aggregated rows")
-            
-            # Process results into heatmap structure
-            heatmap_data = self._process_heatmap_results(results, start_date)
+            _logger.info(f"Window: {window}, Date Range: {start_date} to {end_date}")
             
-            # Calculate hourly breakdown for sidebar details
-            hourly_data = self._fetch_hourly_breakdown(start_date, end_date)
+            # One day x hour aggregation, both views are folded from it
+            hourly_counts = self._fetch_heatmap_hourly_counts(
+                start_date, end_date, None if account_id is None else int(account_id)
+            )
+            heatmap_data = self._process_heatmap_results(hourly_counts)
+            hourly_data = self._fold_hourly_breakdown(hourly_counts)
             
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
@@ -1676,6 +1599,7 @@ class SalesStatusController(http.Controller):
                 'success': True,
                 'heatmap': heatmap_data,
                 'hourly_breakdown': hourly_data,
+                'window': window,
                 'date_range': {
                     'start': start_date.strftime('%Y-%m-%d'),
                     'end': end_date.strftime('%Y-%m-%d')
@@ -1692,27 +1616,35 @@ class SalesStatusController(http.Controller):
                 'hourly_breakdown': {}
             }
 
-    def _calculate_heatmap_date_range(self):
+    @sql_label("heatmap.latest_date")
+    def _calculate_heatmap_date_range(self, window="7days", start_date=None, end_date=None):
         """
-        Calculate the date range for heatmap (last 7 days from latest booking).
-        Uses ONLY historical data.
+        Calculate the date range for heatmap, ending on the latest booking
+        date shifted back as the window says. Uses ONLY historical data.
+        A "custom" window uses start_date and end_date as given.
         """
-        TimeTable = request.env['time.table'].sudo()
+        if window == "custom":
+            date_range = self._custom_date_range(start_date, end_date)
+            return {
+                'start_date': date_range['current_start'],
+                'end_date': date_range['current_end'],
+            }
+        if window not in HEATMAP_WINDOWS:
+            raise ValueError(f"Unknown heatmap window: {window}")
+        days, shift_days = HEATMAP_WINDOWS[window]
+
         today = datetime.now().date()
         
-        # Get the latest booking date (not in the future)
-        latest_record = TimeTable.search([
-            ('bookg_date', '<=', today),
-            ('bookg_date', '!=', False)
-        ], order='bookg_date desc', limit=1)
+        # Get the latest booking date (not in the future) from the watermarks
+        latest_date = request.env['golfzon.data.watermark'].sudo()._latest_date('booking')
         
-        if latest_record and latest_record.bookg_date:
-            end_date = latest_record.bookg_date
+        if latest_date:
+            end_date = min(latest_date, today)
         else:
             end_date = today
         
-        # Calculate start date (7 days before end_date)
-        start_date = end_date - timedelta(days=6)  # 7 days total including end_date
+        end_date -= timedelta(days=shift_days)
+        start_date = end_date - timedelta(days=days - 1)
         
         _logger.info(f"Heatmap Range: {start_date} to {end_date}")
         
@@ -1721,131 +1653,61 @@ class SalesStatusController(http.Controller):
             'end_date': end_date
         }
 
-    def _process_heatmap_results(self, results, start_date):
+    @sql_label("heatmap.hourly_counts")
+    def _fetch_heatmap_hourly_counts(self, start_date, end_date, account_id=None):
         """
-        Process SQL results into the heatmap structure expected by frontend.
-        Returns data organized by time slots (rows) and days of week (columns).
+        Teams per day of week (0=Sunday) and tee hour, over the hours of the
+        heatmap slots (05:00 - 19:59), summed from the booking hour cube.
+        :return: [(day_of_week, hour, teams)]
         """
-        # Initialize empty structure: 4 time slots x 7 days
-        time_slots = ['early morning', 'morning', 'afternoon', 'night']
-        slot_labels = {
-            'early morning': 'Early Morning(5 AM -7 AM)',
-            'morning': 'Morning(8 AM -12 PM)',
-            'afternoon': 'Afternoon(13 PM -16 PM)',
-            'night': 'Night(17 PM -19 PM)'
-        }
-        
-        # Create a mapping from day_of_week (0=Sunday) to column index
-        # PostgreSQL: 0=Sunday, 1=Monday, ..., 6=Saturday
-        heatmap_matrix = {
-            slot: [0] * 7 for slot in time_slots
-        }
-        
-        # Fill in actual data from query results
-        for row in results:
-            day_index = int(row['day_of_week'])  # 0-6 (Sun-Sat)
-            time_slot = row['time_slot']
-            team_count = int(row['total_teams'])
-            
-            if time_slot in heatmap_matrix:
-                heatmap_matrix[time_slot][day_index] = team_count
-        
-        # Format for frontend
-        headers = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-        rows = []
-        
-        for slot in time_slots:
-            rows.append({
-                'label': slot_labels[slot],
-                'slot_key': slot,
-                'data': heatmap_matrix[slot]
-            })
-        
-        _logger.info(f"Processed heatmap data: {len(rows)} rows x {len(headers)} columns")
-        
+        return request.env['golfzon.booking.hour.cube'].sudo()._hourly_counts(
+            start_date,
+            end_date,
+            first_hour=HEATMAP_SLOTS[0][1],
+            end_hour=HEATMAP_SLOTS[-1][2],
+            account_id=account_id,
+        )
+
+    def _heatmap_slot(self, hour):
+        """Heatmap slot key of a tee hour, None outside the slots"""
+        for slot, start_hour, end_hour, _label in HEATMAP_SLOTS:
+            if start_hour <= hour < end_hour:
+                return slot
+        return None
+
+    def _process_heatmap_results(self, hourly_counts):
+        """
+        Fold the day x hour counts into the heatmap structure expected by
+        frontend: time slots (rows) by days of week (columns, Sunday first).
+        """
+        heatmap_matrix = {slot: [0] * 7 for slot, _start, _end, _label in HEATMAP_SLOTS}
+        for day, hour, count in hourly_counts:
+            slot = self._heatmap_slot(hour)
+            if slot:
+                heatmap_matrix[slot][day] += count
+
         return {
-            'headers': headers,
-            'rows': rows
+            'headers': ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'],
+            'rows': [
+                {'label': label, 'slot_key': slot, 'data': heatmap_matrix[slot]}
+                for slot, _start, _end, label in HEATMAP_SLOTS
+            ],
         }
 
-    def _fetch_hourly_breakdown(self, start_date, end_date):
-        """
-        Fetch detailed hourly breakdown for sidebar display.
-        Returns hourly data organized by day and time slot for accurate display.
+    def _fold_hourly_breakdown(self, hourly_counts):
         """
-        query = """
-            WITH hourly_bookings AS (
-                SELECT 
-                    EXTRACT(DOW FROM tt.bookg_date) as day_of_week,
-                    EXTRACT(HOUR FROM tt.bookg_time::time) as hour,
-                    CASE 
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 5 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 8 THEN 'early morning'
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 8 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 13 THEN 'morning'
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 13 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 17 THEN 'afternoon'
-                        WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 17 
-                            AND EXTRACT(HOUR FROM tt.bookg_time::time) < 20 THEN 'night'
-                        ELSE NULL
-                    END as time_slot,
-                    COALESCE(bi.play_team_cnt, 0) as team_count
-                FROM time_table tt
-                INNER JOIN time_table_has_bookg_infos ttbi 
-                    ON tt.time_table_id = ttbi.time_table_id
-                INNER JOIN booking_info bi 
-                    ON ttbi.bookg_info_id::integer = bi.bookg_info_id
-                WHERE 
-                    tt.bookg_date >= %s 
-                    AND tt.bookg_date <= %s
-                    AND tt.bookg_date IS NOT NULL
-                    AND tt.bookg_time IS NOT NULL
-                    AND bi.play_team_cnt > 0
-                    AND EXTRACT(HOUR FROM tt.bookg_time::time) >= 5
-                    AND EXTRACT(HOUR FROM tt.bookg_time::time) < 20
-            )
-            SELECT 
-                day_of_week,
-                hour,
-                time_slot,
-                SUM(team_count) as total_count
-            FROM hourly_bookings
-            WHERE time_slot IS NOT NULL
-            GROUP BY day_of_week, hour, time_slot
-            ORDER BY day_of_week, hour;
+        Fold the day x hour counts into the sidebar breakdown:
+        {"<day>_<slot>": {hour: teams}} for every day and slot.
         """
-        
-        request.env.cr.execute(query, (start_date, end_date))
-        results = request.env.cr.dictfetchall()
-        
-        # Organize by day and time slot with proper hour grouping
-        hourly_data = {}
-        
-        # Initialize structure for all combinations
-        for day in range(7):  # 0-6 (Sunday-Saturday)
-            for slot_key in ['early morning', 'morning', 'afternoon', 'night']:
-                key = f"{day}_{slot_key}"
-                hourly_data[key] = {}
-        
-        # Fill in actual data from query results
-        for row in results:
-            day = int(row['day_of_week'])
-            hour = int(row['hour'])
-            slot = row['time_slot']
-            count = int(row['total_count'])
-            
+        hourly_data = {
+            f"{day}_{slot}": {}
+            for day in range(7)
+            for slot, _start, _end, _label in HEATMAP_SLOTS
+        }
+        for day, hour, count in hourly_counts:
+            slot = self._heatmap_slot(hour)
             if slot:
-                key = f"{day}_{slot}"
-                if key in hourly_data:
-                    # Accumulate counts for the same hour (if multiple records)
-                    if hour in hourly_data[key]:
-                        hourly_data[key][hour] += count
-                    else:
-                        hourly_data[key][hour] = count
-        
-        _logger.info(f"Fetched hourly breakdown - {len(results)} records processed")
-        _logger.info(f"Hourly data keys: {list(hourly_data.keys())[:10]}...")  # Show first 10 keys
-        
+                hourly_data[f"{day}_{slot}"][hour] = count
         return hourly_data
 
     def _get_empty_heatmap_data(self):
@@ -1862,6 +1724,8 @@ class SalesStatusController(http.Controller):
 
     # Today's Reservations data
     @http.route('/golfzon/dashboard/golfinfo', type='json', auth='user', methods=['POST'])
+    @instrumented
+    @cached_endpoint("golf_info", depends=("time.table", "time.table.has.bookg.infos", "booking.info"))
     def get_golf_info(self, **kwargs):
         """
         Fetch today's reservation data with millisecond performance.
@@ -1912,6 +1776,7 @@ class SalesStatusController(http.Controller):
                 'reservationDetails': []
             }
 
+    @sql_label("golfinfo.total_today")
     def _fetch_total_reservations_today(self, today):
         """
         Fetch total reservation count for today.
@@ -1923,7 +1788,7 @@ class SalesStatusController(http.Controller):
             INNER JOIN time_table_has_bookg_infos ttbi 
                 ON tt.time_table_id = ttbi.time_table_id
             INNER JOIN booking_info bi 
-                ON ttbi.bookg_info_id::integer = bi.bookg_info_id
+                ON ttbi.bookg_info_id = bi.bookg_info_id
             WHERE 
                 tt.bookg_date = %s
                 AND tt.bookg_date IS NOT NULL
@@ -1943,6 +1808,7 @@ class SalesStatusController(http.Controller):
             'total': 80  # Fixed capacity
         }
 
+    @sql_label("golfinfo.tee_time")
     def _fetch_tee_time_breakdown(self, today):
         """
         Fetch tee time breakdown by time slots for today.
@@ -1953,12 +1819,12 @@ class SalesStatusController(http.Controller):
         query = """
             SELECT 
                 CASE 
-                    WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 5 
-                        AND EXTRACT(HOUR FROM tt.bookg_time::time) < 12 THEN 'part1'
-                    WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 12 
-                        AND EXTRACT(HOUR FROM tt.bookg_time::time) < 16 THEN 'part2'
-                    WHEN EXTRACT(HOUR FROM tt.bookg_time::time) >= 16 
-                        AND EXTRACT(HOUR FROM tt.bookg_time::time) < 20 THEN 'part3'
+                    WHEN tt.bookg_time >= 5 
+                        AND tt.bookg_time < 12 THEN 'part1'
+                    WHEN tt.bookg_time >= 12 
+                        AND tt.bookg_time < 16 THEN 'part2'
+                    WHEN tt.bookg_time >= 16 
+                        AND tt.bookg_time < 20 THEN 'part3'
                     ELSE 'other'
                 END as time_part,
                 COUNT(*) as count
@@ -1966,7 +1832,7 @@ class SalesStatusController(http.Controller):
             INNER JOIN time_table_has_bookg_infos ttbi 
                 ON tt.time_table_id = ttbi.time_table_id
             INNER JOIN booking_info bi 
-                ON ttbi.bookg_info_id::integer = bi.bookg_info_id
+                ON ttbi.bookg_info_id = bi.bookg_info_id
             WHERE 
                 tt.bookg_date = %s
                 AND tt.bookg_date IS NOT NULL
@@ -1997,6 +1863,7 @@ class SalesStatusController(http.Controller):
         
         return breakdown
 
+    @sql_label("golfinfo.details")
     def _fetch_reservation_details(self, today):
         """
         Fetch detailed reservation holder information for today.
@@ -2013,7 +1880,7 @@ class SalesStatusController(http.Controller):
             INNER JOIN time_table_has_bookg_infos ttbi 
                 ON tt.time_table_id = ttbi.time_table_id
             INNER JOIN booking_info bi 
-                ON ttbi.bookg_info_id::integer = bi.bookg_info_id
+                ON ttbi.bookg_info_id = bi.bookg_info_id
             WHERE 
                 tt.bookg_date = %s
                 AND tt.bookg_date IS NOT NULL
@@ -2033,13 +1900,8 @@ class SalesStatusController(http.Controller):
         reservation_details = []
         
         for row in results:
-            # Format tee time (remove seconds if present)
-            tee_time = row['tee_time']
-            if isinstance(tee_time, str):
-                # Handle format like "HH:MM:SS" or "HH:MM"
-                time_parts = tee_time.split(':')
-                if len(time_parts) >= 2:
-                    tee_time = f"{time_parts[0]}:{time_parts[1]}"
+            # Format tee time (stored as hours) as HH:MM
+            tee_time = self._format_float_time(row['tee_time'])
             
             # Format reservation date
             res_date = row['reservation_date']
@@ -2058,8 +1920,15 @@ class SalesStatusController(http.Controller):
         
         return reservation_details
 
+    def _format_float_time(self, value):
+        """Format a float_time value (hours) as HH:MM"""
+        hours, minutes = divmod(round(float(value or 0) * 60), 60)
+        return f"{int(hours):02d}:{int(minutes):02d}"
+
     # Pie Charts Data
     @http.route('/golfzon/member_composition/data', type='json', auth='user', methods=['POST'])
+    @instrumented
+    @cached_endpoint("member_composition", depends=("time.table", "booking.info"))
     def get_member_composition_data(self, **kwargs):
         """
         Fetch reservation member composition data from bookg_infos table.
@@ -2108,6 +1977,7 @@ class SalesStatusController(http.Controller):
                 }
             }
 
+    @sql_label("member_composition.by_type")
     def _fetch_reservation_by_type(self):
         """
         Fetch reservation proportion by type.
@@ -2181,6 +2051,7 @@ class SalesStatusController(http.Controller):
             _logger.error(f"Error fetching reservation by type: {str(e)}", exc_info=True)
             return self._get_default_type_data()
 
+    @sql_label("member_composition.by_time")
     def _fetch_reservation_by_time(self):
         """
         Fetch reservation proportion by advance booking time.
@@ -2293,6 +2164,7 @@ class SalesStatusController(http.Controller):
             _logger.error(f"Error fetching advance bookings: {str(e)}", exc_info=True)
             return self._get_default_time_data()
 
+    @sql_label("member_composition.by_channel")
     def _fetch_reservation_by_channel(self):
         """
         Fetch reservation proportion by channel.
@@ -2422,10 +2294,45 @@ class SalesStatusController(http.Controller):
         }
 
 
+    # =============================================
+    # ADMIN / DIAGNOSTICS
+    # =============================================
+    @http.route('/golfzon/dashboard/cache_stats', type='json', auth='user', methods=['POST'])
+    def get_cache_stats(self, **kwargs):
+        """Hit/miss counters of the server-side result cache (administrators only)"""
+        if not request.env.user.has_group('base.group_system'):
+            return {"success": False, "error": "Access denied"}
+        return {"success": True, "cache": dashboard_cache.stats()}
+
+    @http.route('/golfzon/dashboard/_stats', type='json', auth='user', methods=['POST'])
+    def get_endpoint_stats(self, **kwargs):
+        """Latency, SQL and cache statistics of the dashboard routes (administrators only)"""
+        if not request.env.user.has_group('base.group_system'):
+            return {"success": False, "error": "Access denied"}
+        return {
+            "success": True,
+            "window_minutes": WINDOW_MINUTES,
+            "endpoints": endpoint_stats.snapshot(),
+            "cache": dashboard_cache.stats(),
+        }
+
+    @http.route('/golfzon/dashboard/_indexes', type='json', auth='user', methods=['POST'])
+    def get_index_report(self, **kwargs):
+        """Declared dashboard indexes that are missing, and indexes never scanned (administrators only)"""
+        if not request.env.user.has_group('base.group_system'):
+            return {"success": False, "error": "Access denied"}
+        try:
+            report = request.env["golfzon.dashboard.source.mixin"]._dashboard_index_report()
+            return {"success": True, **report}
+        except Exception as e:
+            _logger.error(f"❌ Error building index report: {str(e)}")
+            return {"success": False, "error": str(e)}
+
     # =============================================
     # WEATHER API PROXY (CORS-FREE SOLUTION)
     # =============================================
     @http.route('/golfzon/weather/current', type='json', auth='user', methods=['POST'], csrf=False)
+    @instrumented
     def get_weather_current(self, lat=None, lon=None):
         """
         Proxy endpoint for current weather data.
@@ -2468,6 +2375,7 @@ class SalesStatusController(http.Controller):
             }
 
     @http.route('/golfzon/weather/forecast', type='json', auth='user', methods=['POST'], csrf=False)
+    @instrumented
     def get_weather_forecast(self, lat=None, lon=None):
         """
         Proxy endpoint for weather forecast data.
@@ -7,9 +7,17 @@ from datetime import datetime
 from typing import Any, List, Dict, Optional
 from urllib.parse import quote
 import logging
+import time
+
+from ..utils.instrumentation import instrumented, sql_label
+from ..utils.xlsx_export import FileStream, iter_query, open_workbook, remove_file
 
 _logger = logging.getLogger(__name__)
 
+UPLOAD_HEADERS = ["Membership number", "name", "Date of joining", "contact", "email", "Residence", "Number of times built-in", "Recent interior date"]
+UPLOAD_BATCH_SIZE = 1000
+UPLOAD_MAX_REJECTED_REPORTED = 100
+
 
 class MemberGroupController(http.Controller):
 
@@ -56,6 +64,7 @@ class MemberGroupController(http.Controller):
 
     # 1. SEARCH MEMBER GROUPS
     @http.route("/golfzon/member_group/search", type="json", auth="user")
+    @instrumented
     def search_member_groups(self, start_date, end_date, group_name="", **kwargs):
         try:
             domain = [
@@ -66,7 +75,8 @@ class MemberGroupController(http.Controller):
                 domain.append(("group_name", "ilike", group_name))
 
             GroupInfo = request.env["golf.group.info"].sudo()
-            groups = GroupInfo.search(domain, order="created_at desc")
+            with sql_label("member_group.search"):
+                groups = GroupInfo.search(domain, order="created_at desc")
 
             data = []
             for group in groups:
@@ -91,10 +101,21 @@ class MemberGroupController(http.Controller):
 
     # 2. DOWNLOAD EXCEL
     @http.route("/golfzon/member_group/download_excel", type="http", auth="user", csrf=False)
-    def download_excel(self, group_id=None, **kwargs):
+    @instrumented
+    def download_excel(self, group_id=None, include_members=None, **kwargs):
+        """
+        Export the group list (a single group, or every group when no
+        group_id is given) with a second sheet listing the group members.
+        The members sheet is always written for a single group, and for
+        all groups when include_members is "1", "true" or "yes".
+        Rows are paged from the database and the workbook is built on disk,
+        so exports of any size run in constant memory.
+        """
+        path = None
+        # Query string flag: "0" or "false" must not export every member
+        include_members = str(include_members).lower() in ("1", "true", "yes")
         try:
-            output = io.BytesIO()
-            workbook = xlsxwriter.Workbook(output, {"in_memory": True})
+            workbook, path = open_workbook()
             worksheet = workbook.add_worksheet("Group List")
 
             header_format = workbook.add_format({
@@ -111,70 +132,129 @@ class MemberGroupController(http.Controller):
             for col, h in enumerate(headers):
                 worksheet.write(0, col, h, header_format)
 
-            GroupInfo = request.env["golf.group.info"].sudo()
-            groups = None
-            group_name_for_file = "group_list"
-
+            group_ids = None
+            group_name_for_file = "all_groups"
             if group_id:
-                try:
-                    gid = int(group_id)
-                    groups = GroupInfo.search([("id", "=", gid)]) or GroupInfo.search([("group_id", "=", gid)])
-                    if groups:
-                        group_name_for_file = groups[0].group_name or "group"
-                except:
-                    groups = GroupInfo.search([("group_code", "=", str(group_id))])
-                    if groups:
-                        group_name_for_file = groups[0].group_name or "group"
-            else:
-                groups = GroupInfo.search([], order="created_at desc", limit=100)
-                group_name_for_file = "all_groups"
-
-            if not groups:
-                worksheet.merge_range(1, 0, 1, 4, "No data found", cell_format_center)
-            else:
-                row = 1
-                for group in groups:
-                    division_name = "-"
-                    if hasattr(group, "division") and group.division:
-                        division_name = str(group.division)
-                    worksheet.write(row, 0, division_name, cell_format_center)
-                    worksheet.write(row, 1, group.group_name or "-", cell_format)
-                    worksheet.write(row, 2, str(group.member_count or 0), cell_format_center)
-                    worksheet.write(row, 3, group.created_at.strftime("%Y.%m.%d") if group.created_at else "-", cell_format_center)
-                    worksheet.write(row, 4, group.updated_at.strftime("%Y.%m.%d") if group.updated_at else "-", cell_format_center)
-                    row += 1
+                GroupInfo = request.env["golf.group.info"].sudo()
+                with sql_label("member_group.export_resolve_group"):
+                    try:
+                        gid = int(group_id)
+                        groups = GroupInfo.search([("id", "=", gid)]) or GroupInfo.search([("group_id", "=", gid)])
+                    except ValueError:
+                        groups = GroupInfo.search([("group_code", "=", str(group_id))])
+                group_ids = groups.ids
+                group_name_for_file = (groups[:1].group_name or "group") if groups else "group_list"
+
+            group_filter = "" if group_ids is None else "WHERE id = ANY(%(group_ids)s)"
+            row = 0
+            with sql_label("member_group.export_groups"):
+                for row, group in enumerate(iter_query(
+                    request.cr,
+                    "golfzon_export_groups",
+                    f"""
+                        SELECT group_scd, state_scd, group_name, member_count, created_at, updated_at
+                        FROM golf_group_info
+                        {group_filter}
+                        ORDER BY created_at DESC, id DESC
+                    """,
+                    {"group_ids": group_ids},
+                ), 1):
+                    worksheet.write(row, 0, self._get_division_label(group["group_scd"] or group["state_scd"]), cell_format_center)
+                    worksheet.write(row, 1, group["group_name"] or "-", cell_format)
+                    worksheet.write(row, 2, str(group["member_count"] or 0), cell_format_center)
+                    worksheet.write(row, 3, group["created_at"].strftime("%Y.%m.%d") if group["created_at"] else "-", cell_format_center)
+                    worksheet.write(row, 4, group["updated_at"].strftime("%Y.%m.%d") if group["updated_at"] else "-", cell_format_center)
+            if not row:
+                worksheet.write(1, 0, "No data found", cell_format_center)
+
+            if group_ids or (group_ids is None and include_members):
+                self._write_members_sheet(workbook, group_ids, header_format, cell_format, cell_format_center)
 
             workbook.close()
-            output.seek(0)
+            stream = FileStream(path)
+            path = None
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename_ascii = f"member_group_{timestamp}.xlsx"
             filename_utf8 = f"{group_name_for_file[:30]}_{timestamp}.xlsx"
             filename_encoded = quote(filename_utf8.encode("utf-8"))
 
-            return request.make_response(
-                output.getvalue(),
+            return Response(
+                stream,
                 headers=[
                     ("Content-Type", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
                     ("Content-Disposition", f"attachment; filename=\"{filename_ascii}\"; filename*=UTF-8''{filename_encoded}"),
-                    ("Content-Length", str(len(output.getvalue()))),
+                    ("Content-Length", str(stream.size)),
                 ],
+                direct_passthrough=True,
             )
         except Exception as e:
             _logger.error("Excel download error: %s", e, exc_info=True)
             return request.make_response(f"Error: {str(e)}", headers=[("Content-Type", "text/plain")], status=500)
+        finally:
+            if path:
+                remove_file(path)
+
+    def _write_members_sheet(self, workbook, group_ids, header_format, cell_format, cell_format_center):
+        """Members of the exported groups (all groups when group_ids is None), one row per member"""
+        worksheet = workbook.add_worksheet("Members")
+        headers = ["Member Group Name", "Membership number", "name", "Date of joining", "contact", "email"]
+        widths = [30, 20, 15, 18, 18, 25]
+        for i, w in enumerate(widths):
+            worksheet.set_column(i, i, w)
+        for col, h in enumerate(headers):
+            worksheet.write(0, col, h, header_format)
+
+        group_filter = "" if group_ids is None else "AND gm.group_id = ANY(%(group_ids)s)"
+        with sql_label("member_group.export_members"):
+            for row, member in enumerate(iter_query(
+                request.cr,
+                "golfzon_export_members",
+                f"""
+                    SELECT
+                        gi.group_name,
+                        gm.person_code,
+                        COALESCE(gp.member_name, gm.group_member_name) AS name,
+                        mm.member_no,
+                        mm.entry_date,
+                        COALESCE(gm.mobile_phone, gp.mobile_phone) AS contact,
+                        COALESCE(gm.email, gp.email) AS email
+                    FROM golf_group_member gm
+                    JOIN golf_group_info gi ON gi.id = gm.group_id
+                    LEFT JOIN golfzon_person gp ON gp.person_code = gm.person_code
+                    LEFT JOIN LATERAL (
+                        SELECT member_no, entry_date
+                        FROM members_members
+                        WHERE person_code = gm.person_code AND deleted_at IS NULL
+                        ORDER BY id DESC
+                        LIMIT 1
+                    ) mm ON TRUE
+                    WHERE gm.deleted_at IS NULL
+                        {group_filter}
+                    ORDER BY gi.created_at DESC, gi.id DESC, gm.id
+                """,
+                {"group_ids": group_ids},
+            ), 1):
+                worksheet.write(row, 0, member["group_name"] or "-", cell_format)
+                worksheet.write(row, 1, member["member_no"] or member["person_code"] or "", cell_format_center)
+                worksheet.write(row, 2, member["name"] or "", cell_format)
+                worksheet.write(row, 3, self.format_date_field(member["entry_date"]), cell_format_center)
+                worksheet.write(row, 4, member["contact"] or "", cell_format_center)
+                worksheet.write(row, 5, member["email"] or "", cell_format)
 
     # 3. GET STATISTICS (GLOBAL)
     @http.route("/golfzon/member_group/get_statistics", type="json", auth="user")
+    @instrumented
     def get_statistics(self, **kwargs):
         try:
             GroupInfo = request.env["golf.group.info"].sudo()
             GroupMember = request.env["golf.group.member"].sudo()
 
-            total_groups = GroupInfo.search_count([])
-            total_members = GroupMember.search_count([])
             today = datetime.now()
             first_day = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            groups_this_month = GroupInfo.search_count([("created_at", ">=", first_day)])
+            with sql_label("member_group.statistics"):
+                total_groups = GroupInfo.search_count([])
+                total_members = GroupMember.search_count([])
+                groups_this_month = GroupInfo.search_count([("created_at", ">=", first_day)])
 
             return {
                 "status": "success",
@@ -190,73 +270,167 @@ class MemberGroupController(http.Controller):
 
     # 4. UPLOAD MEMBER LIST
     @http.route("/golfzon/member_group/upload_member_list", type="http", auth="user", methods=["POST"], csrf=False)
+    @instrumented
     def upload_member_list(self, group_title: Optional[str] = None, member_list_file: Optional[Any] = None, **kwargs):
+        """
+        Register a member group from an uploaded member list.
+        The sheet is read row by row (openpyxl read-only mode), validated and
+        inserted UPLOAD_BATCH_SIZE rows at a time. Invalid rows are skipped
+        and reported back with their row number.
+        """
+        workbook = None
         try:
             import openpyxl
-            from io import BytesIO
 
             if not group_title or not member_list_file:
                 return self._json_response({"status": "error", "message": "Group title and file required"})
 
-            file_content = member_list_file.read()
-            workbook = openpyxl.load_workbook(BytesIO(file_content))
+            started = time.perf_counter()
+            workbook = openpyxl.load_workbook(
+                getattr(member_list_file, "stream", member_list_file), read_only=True, data_only=True
+            )
             sheet = workbook.active
             if not sheet:
                 return self._json_response({"status": "error", "message": "Cannot read Excel"})
 
-            required_headers = ["Membership number", "name", "Date of joining", "contact", "email", "Residence", "Number of times built-in", "Recent interior date"]
-            actual_headers = [cell.value for cell in sheet[1]]
-            missing = [h for h in required_headers if h not in actual_headers]
+            rows = sheet.iter_rows(values_only=True)
+            actual_headers = [str(h).strip() if h is not None else "" for h in next(rows, ())]
+            missing = [h for h in UPLOAD_HEADERS if h not in actual_headers]
             if missing:
                 return self._json_response({"status": "error", "message": f"Missing columns: {', '.join(missing)}"})
-
-            members = []
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if row[0]:
-                    members.append({
-                        "membership_number": row[0], "name": row[1], "date_of_joining": row[2],
-                        "contact": row[3], "email": row[4], "residence": row[5],
-                        "built_in_times": row[6], "recent_date": row[7],
-                    })
-
-            if not members:
-                return self._json_response({"status": "error", "message": "No member data"})
+            columns = {h: actual_headers.index(h) for h in UPLOAD_HEADERS}
 
             GroupInfo = request.env["golf.group.info"].sudo()
-            new_group = GroupInfo.create({
-                "group_name": group_title,
-                "member_count": len(members),
-                "group_scd": "register",
-                "state_scd": "active",
-                "created_at": datetime.now(),
-            })
-
-            GroupMember = request.env["golf.group.member"].sudo()
-            for m in members:
-                GroupMember.create({
-                    "group_id": new_group.id,
-                    "person_code": m["membership_number"],
-                    "group_member_name": m["name"],
-                    "mobile_phone": m["contact"],
-                    "email": m["email"],
+            with sql_label("member_group.upload_group"):
+                new_group = GroupInfo.create({
+                    "group_name": group_title,
+                    "member_count": 0,
+                    "group_scd": "register",
+                    "state_scd": "active",
                     "created_at": datetime.now(),
                 })
 
+            GroupMember = request.env["golf.group.member"].sudo()
+            first_member_id = GroupMember._next_group_member_id()
+            seen = set()
+            rejected = []
+            rows_read = inserted = 0
+            chunk = []
+            for row_number, row in enumerate(rows, 2):
+                if not any(value not in (None, "") for value in row):
+                    continue
+                rows_read += 1
+                chunk.append((row_number, row))
+                if len(chunk) >= UPLOAD_BATCH_SIZE:
+                    inserted += self._insert_member_chunk(
+                        GroupMember, new_group.id, chunk, columns, seen, rejected, first_member_id + inserted
+                    )
+                    chunk = []
+            if chunk:
+                inserted += self._insert_member_chunk(
+                    GroupMember, new_group.id, chunk, columns, seen, rejected, first_member_id + inserted
+                )
+
+            elapsed = time.perf_counter() - started
+            report = {
+                "rows_read": rows_read,
+                "inserted": inserted,
+                "rejected_count": len(rejected),
+                "rejected": rejected[:UPLOAD_MAX_REJECTED_REPORTED],
+                "elapsed_ms": round(elapsed * 1000, 2),
+                "rows_per_second": round(rows_read / elapsed, 1) if elapsed else rows_read,
+            }
+            _logger.info(
+                f"📤 Member list '{group_title}': {inserted}/{rows_read} rows inserted, "
+                f"{len(rejected)} rejected, {report['rows_per_second']} rows/s"
+            )
+
+            if not inserted:
+                new_group.unlink()
+                return self._json_response({"status": "error", "message": "No member data", **report})
+
+            with sql_label("member_group.upload_group"):
+                new_group.write({"member_count": inserted})
+
+            message = f"Registered {inserted} members"
+            if rejected:
+                message += f" ({len(rejected)} rows rejected)"
             return self._json_response({
                 "status": "success",
-                "message": f"Registered {len(members)} members",
+                "message": message,
                 "group_id": new_group.id,
+                **report,
             })
 
         except Exception as e:
             _logger.error("upload_member_list error: %s", e, exc_info=True)
             return self._json_response({"status": "error", "message": str(e)})
+        finally:
+            if workbook is not None:
+                workbook.close()
+
+    def _insert_member_chunk(self, GroupMember, group_id, chunk, columns, seen, rejected, next_member_id):
+        """
+        Validate one chunk of (row number, row values) and insert the valid
+        rows with a single multi-row create. Rejected rows are appended to
+        ``rejected``, ``seen`` holds the membership numbers already taken.
+        Inserted rows are numbered from ``next_member_id`` on.
+        Return the number of inserted rows.
+        """
+        now = datetime.now()
+        vals_list = []
+        for row_number, row in chunk:
+            membership_number = self._upload_cell(row, columns, "Membership number")
+            name = self._upload_cell(row, columns, "name")
+            email = self._upload_cell(row, columns, "email")
+            reason = None
+            if not membership_number:
+                reason = "Membership number is missing"
+            elif not name:
+                reason = "Name is missing"
+            elif email and "@" not in email:
+                reason = f"Invalid email: {email}"
+            elif membership_number in seen:
+                reason = f"Duplicate membership number: {membership_number}"
+            if reason:
+                rejected.append({"row": row_number, "membership_number": membership_number, "reason": reason})
+                continue
+
+            seen.add(membership_number)
+            vals_list.append({
+                "group_member_id": next_member_id + len(vals_list),
+                "group_id": group_id,
+                "person_code": membership_number,
+                "group_member_name": name,
+                "mobile_phone": self._upload_cell(row, columns, "contact") or False,
+                "email": email or False,
+                "created_at": now,
+            })
+
+        if vals_list:
+            with sql_label("member_group.upload_members"):
+                GroupMember.create(vals_list)
+            # Keep the ORM cache from growing with every inserted record
+            GroupMember.env.invalidate_all()
+        return len(vals_list)
+
+    def _upload_cell(self, row, columns, header):
+        """Cell of an uploaded row as a stripped string ("" when empty)"""
+        index = columns[header]
+        value = row[index] if index < len(row) else None
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            # Numeric codes typed in Excel come back as floats
+            value = int(value)
+        return str(value).strip()
 
     def _json_response(self, data):
         return request.make_response(json.dumps(data), headers=[("Content-Type", "application/json")])
 
     # 5. DOWNLOAD TEMPLATE
     @http.route("/golfzon/member_group/download_template", type="http", auth="user", csrf=False)
+    @instrumented
     def download_template(self, **kwargs):
         try:
             output = io.BytesIO()
@@ -301,6 +475,7 @@ class MemberGroupController(http.Controller):
     # 6. CONDITION INQUIRY (FILTERED GROUP + INDICATORS)
 
     @http.route("/golfzon/member_group/condition_inquiry", type="json", auth="user")
+    @instrumented
     def condition_inquiry(self, **kwargs):
         """
         Fetch detailed member info for selected group, supporting all filters.
@@ -321,8 +496,9 @@ class MemberGroupController(http.Controller):
                     "number_of_members": 0,
                 }
             
-            cr.execute("SELECT id FROM golf_group_info WHERE group_name = %s LIMIT 1", (group_title,))
-            row = cr.fetchone()
+            with sql_label("member_group.inquiry_group"):
+                cr.execute("SELECT id FROM golf_group_info WHERE group_name = %s LIMIT 1", (group_title,))
+                row = cr.fetchone()
             if not row:
                 return {
                     "status": "error",
@@ -401,10 +577,12 @@ class MemberGroupController(http.Controller):
                 ORDER BY gm.group_member_name ASC
             """
 
-            cr.execute(query, tuple(params))
+            with sql_label("member_group.inquiry_members"):
+                cr.execute(query, tuple(params))
+                rows = cr.fetchall()
             members = []
             number_of_times_builtin_sum = 0  # Track total count
-            for row in cr.fetchall():
+            for row in rows:
                 builtin_count = int(row[6] or 0)
                 number_of_times_builtin_sum += builtin_count
                 members.append({
@@ -446,6 +624,7 @@ class MemberGroupController(http.Controller):
         
     # 7. GET MEMBERS (PAGINATED)
     @http.route("/golfzon/member_group/get_members", type="json", auth="user")
+    @instrumented
     def get_members(self, group_id=None, offset=0, limit=10, **kwargs):
         try:
             query = """
@@ -471,8 +650,9 @@ class MemberGroupController(http.Controller):
             """
             params.extend([limit, offset])
 
-            request.cr.execute(query, tuple(params))
-            records = request.cr.dictfetchall()
+            with sql_label("member_group.members_page"):
+                request.cr.execute(query, tuple(params))
+                records = request.cr.dictfetchall()
 
             # Total count
             count_query = "SELECT COUNT(DISTINCT gp.person_code) FROM golfzon_person gp WHERE gp.deleted_at IS NULL"
@@ -480,8 +660,9 @@ class MemberGroupController(http.Controller):
             if group_id:
                 count_query += " AND EXISTS (SELECT 1 FROM golf_group_member gm WHERE gm.person_code = gp.person_code AND gm.group_id = %s)"
                 count_params.append(int(group_id))
-            request.cr.execute(count_query, tuple(count_params))
-            total = request.cr.fetchone()[0] or 0
+            with sql_label("member_group.members_count"):
+                request.cr.execute(count_query, tuple(count_params))
+                total = request.cr.fetchone()[0] or 0
 
             members = []
             for r in records:
@@ -535,8 +716,9 @@ class MemberGroupController(http.Controller):
                 FROM booking_bookings
                 WHERE person_code IN %s AND deleted_at IS NULL
             """
-            request.cr.execute(query, (person_codes,))
-            data = request.cr.dictfetchone() or {}
+            with sql_label("member_group.key_indicators"):
+                request.cr.execute(query, (person_codes,))
+                data = request.cr.dictfetchone() or {}
 
             return {
                 "number_of_members": f"{count:,} people",
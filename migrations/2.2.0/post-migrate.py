@@ -0,0 +1,22 @@
+"""
+Build the net sales ledger from the existing payments, on their original
+dates, then the daily and monthly rollups whose sales are summed from it.
+Runs after the data files: whatever the install-time first runs built is
+replaced, in that order.
+"""
+import logging
+
+from odoo import SUPERUSER_ID, api
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env["golfzon.sales.ledger"]._rebuild()
+    env["golfzon.daily.metrics"]._resync()
+    env["golfzon.monthly.kpi"]._rebuild()
+    _logger.info("Sales ledger built, sales rollups rebuilt from it")
@@ -0,0 +1,144 @@
+"""
+Convert the text id, time and amount columns of time_table,
+time_table_has_bookg_infos and visit_customers to their real types, before
+the ORM sees the new field definitions (the ORM would otherwise move the
+text columns aside and start from empty ones).
+
+Every column is copied into a typed shadow column in id-range batches, so
+no single UPDATE rewrites a whole large table, then swapped in place of the
+text column. Values that cannot be converted are kept in
+golfzon_column_migration_backup instead of being silently dropped.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50000
+
+# (postgres type, pattern of convertible values, conversion expression)
+INTEGER = ("int4", r"^\s*-?[0-9]{1,9}\s*$", "btrim({col})::int4")
+FLOAT = ("float8", r"^\s*-?[0-9]+(\.[0-9]+)?\s*$", "btrim({col})::float8")
+# "07:30", "07:30:00" or "0730" become hours as a float (float_time widget)
+TIME = (
+    "float8",
+    r"^\s*([01]?[0-9]|2[0-3]):?[0-5][0-9](:[0-5][0-9])?\s*$",
+    """CASE WHEN position(':' IN {col}) > 0
+            THEN EXTRACT(EPOCH FROM btrim({col})::time) / 3600.0
+            ELSE left(lpad(btrim({col}), 4, '0'), 2)::int4
+                + right(btrim({col}), 2)::int4 / 60.0
+       END""",
+)
+
+COLUMNS = {
+    "time_table": [
+        ("time_table_id", INTEGER),
+        ("work_calendar_id", INTEGER),
+        ("account_id", INTEGER),
+        ("course_cd_id", INTEGER),
+        ("min_person", INTEGER),
+        ("bookg_time", TIME),
+    ],
+    "time_table_has_bookg_infos": [
+        ("time_table_has_bookg_info_id", INTEGER),
+        ("time_table_id", INTEGER),
+        ("bookg_info_id", INTEGER),
+        ("play_persons", INTEGER),
+        ("apply_greenfee_amt", FLOAT),
+        ("prepayed_amt", FLOAT),
+        ("org_greenfee_amt", FLOAT),
+        ("agent_preamt", FLOAT),
+    ],
+    "visit_customers": [
+        ("customer_id", INTEGER),
+        ("visit_team_id", INTEGER),
+        ("bookg_info_id", INTEGER),
+        ("account_id", INTEGER),
+        ("member_cd_id", INTEGER),
+        ("visit_seq", INTEGER),
+    ],
+}
+
+
+def _column_type(cr, table, column):
+    cr.execute(
+        """
+        SELECT udt_name
+        FROM information_schema.columns
+        WHERE table_name = %s AND column_name = %s
+        """,
+        (table, column),
+    )
+    row = cr.fetchone()
+    return row[0] if row else None
+
+
+def _convert_table(cr, table, columns):
+    pending = [
+        (column, spec)
+        for column, spec in columns
+        if _column_type(cr, table, column) not in (None, spec[0])
+    ]
+    if not pending:
+        return
+
+    for column, (sql_type, pattern, _expression) in pending:
+        cr.execute(f"ALTER TABLE {table} ADD COLUMN {column}__typed {sql_type}")
+        cr.execute(
+            f"""
+            INSERT INTO golfzon_column_migration_backup (table_name, column_name, row_id, value)
+            SELECT %s, %s, id, {column}
+            FROM {table}
+            WHERE {column} IS NOT NULL
+                AND btrim({column}) <> ''
+                AND {column} !~ %s
+            """,
+            (table, column, pattern),
+        )
+        if cr.rowcount:
+            _logger.warning(
+                f"{table}.{column}: {cr.rowcount} unconvertible values saved in "
+                f"golfzon_column_migration_backup"
+            )
+
+    assignments = ", ".join(
+        f"{column}__typed = CASE WHEN {column} ~ %s THEN {expression.format(col=column)} END"
+        for column, (_sql_type, _pattern, expression) in pending
+    )
+    patterns = [pattern for _column, (_sql_type, pattern, _expression) in pending]
+
+    cr.execute(f"SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM {table}")
+    min_id, max_id = cr.fetchone()
+    for start in range(min_id, max_id + 1, BATCH_SIZE):
+        cr.execute(
+            f"UPDATE {table} SET {assignments} WHERE id >= %s AND id < %s",
+            patterns + [start, start + BATCH_SIZE],
+        )
+
+    for column, _spec in pending:
+        cr.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        cr.execute(f"ALTER TABLE {table} RENAME COLUMN {column}__typed TO {column}")
+
+    _logger.info(
+        f"{table}: converted {', '.join(column for column, _spec in pending)} "
+        f"({max_id - min_id + 1 if max_id else 0} ids in batches of {BATCH_SIZE})"
+    )
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    cr.execute(
+        """
+        CREATE TABLE IF NOT EXISTS golfzon_column_migration_backup (
+            id SERIAL PRIMARY KEY,
+            table_name VARCHAR NOT NULL,
+            column_name VARCHAR NOT NULL,
+            row_id INTEGER NOT NULL,
+            value TEXT,
+            migrated_at TIMESTAMP DEFAULT (NOW() AT TIME ZONE 'UTC')
+        )
+        """
+    )
+    for table, columns in COLUMNS.items():
+        _convert_table(cr, table, columns)
@@ -1,3 +1,4 @@
+from . import dashboard_source_mixin
 from . import booking_info
 from . import persons
 from . import visit_customer
@@ -8,3 +9,14 @@ from . import time_table
 from . import group_info
 from . import group_details
 from . import group_members
+# After the source models, its init() creates triggers on their tables
+from . import dashboard_dirty_date
+from . import daily_metrics
+from . import daily_sales_breakdown
+from . import monthly_kpi
+from . import data_watermark
+from . import sales_ledger
+from . import gender_counter
+from . import visitor_sketch
+from . import reservation_forecast
+from . import booking_hour_cube
@@ -0,0 +1,209 @@
+import json
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+SYNC_PARAM = "golfzon_dashboard.booking_hour_cube_sync"
+
+# Same margin as the daily metrics sync, for transactions committing late
+SYNC_OVERLAP_MINUTES = 5
+
+REFRESH_QUERY = """
+    INSERT INTO golfzon_booking_hour_cube (
+        bookg_date, account_id, hour, team_count,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        tt.bookg_date,
+        COALESCE(tt.account_id, 0),
+        FLOOR(tt.bookg_time)::integer,
+        SUM(bi.play_team_cnt),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM time_table tt
+    INNER JOIN time_table_has_bookg_infos ttbi
+        ON tt.time_table_id = ttbi.time_table_id
+    INNER JOIN booking_info bi
+        ON ttbi.bookg_info_id = bi.bookg_info_id
+    WHERE tt.bookg_date IS NOT NULL
+        AND tt.bookg_time IS NOT NULL
+        AND bi.play_team_cnt > 0
+        {date_filter}
+    GROUP BY 1, 2, 3
+"""
+
+# Booking days touched by the rows written since the last sync, per table:
+# (table, query returning the days, given the id mark and the since date)
+DIRTY_DATES_QUERIES = [
+    (
+        "time_table",
+        """
+        SELECT DISTINCT bookg_date
+        FROM time_table
+        WHERE bookg_date IS NOT NULL
+            AND (id > %(mark)s OR write_date >= %(since)s)
+        """,
+    ),
+    (
+        "time_table_has_bookg_infos",
+        """
+        SELECT DISTINCT tt.bookg_date
+        FROM time_table_has_bookg_infos ttbi
+        JOIN time_table tt ON tt.time_table_id = ttbi.time_table_id
+        WHERE tt.bookg_date IS NOT NULL
+            AND (ttbi.id > %(mark)s OR ttbi.write_date >= %(since)s)
+        """,
+    ),
+    (
+        "booking_info",
+        """
+        SELECT DISTINCT tt.bookg_date
+        FROM booking_info bi
+        JOIN time_table_has_bookg_infos ttbi ON ttbi.bookg_info_id = bi.bookg_info_id
+        JOIN time_table tt ON tt.time_table_id = ttbi.time_table_id
+        WHERE tt.bookg_date IS NOT NULL
+            AND (bi.id > %(mark)s OR bi.write_date >= %(since)s)
+        """,
+    ),
+]
+
+
+class BookingHourCube(models.Model):
+    """
+    Booked teams per booking day, account and tee hour.
+    The heatmap sums these rows over any window instead of joining
+    time_table, time_table_has_bookg_infos and booking_info: a quarter
+    costs a few thousand rows. Days touched by inserted or updated source
+    rows are recomputed by the refresh cron, with the days slots and
+    bookings leave (golfzon.dashboard.dirty.date).
+    """
+
+    _name = "golfzon.booking.hour.cube"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Booking Hour Cube"
+    _order = "bookg_date desc, account_id, hour"
+    _dashboard_indexes = [
+        ("golfzon_booking_hour_cube_date_idx", "(bookg_date) INCLUDE (hour, team_count)"),
+    ]
+
+    bookg_date = fields.Date("Booking Date", required=True)
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    hour = fields.Integer("Tee Hour", required=True)
+    team_count = fields.Integer("Teams")
+
+    _sql_constraints = [
+        (
+            "cube_uniq",
+            "unique(bookg_date, account_id, hour)",
+            "Only one cube row is allowed per day, account and hour.",
+        ),
+    ]
+
+    @api.model
+    def _refresh_dates(self, dates):
+        """Recompute the rows of the given days from the raw tables"""
+        dates = sorted(set(d for d in dates if d))
+        if not dates:
+            return
+        cr = self.env.cr
+        cr.execute(
+            "DELETE FROM golfzon_booking_hour_cube WHERE bookg_date = ANY(%s)",
+            (dates,),
+        )
+        cr.execute(
+            REFRESH_QUERY.format(date_filter="AND tt.bookg_date = ANY(%(dates)s)"),
+            {"uid": self.env.uid, "dates": dates},
+        )
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Booking hour cube refreshed for {len(dates)} day(s)")
+
+    @api.model
+    def _rebuild(self):
+        """Recompute the whole cube from scratch"""
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_booking_hour_cube")
+        cr.execute(REFRESH_QUERY.format(date_filter=""), {"uid": self.env.uid})
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Booking hour cube rebuilt: {cr.rowcount} rows")
+
+    @api.model
+    def _collect_sync_marks(self):
+        """Return the current max id of every source table"""
+        marks = {}
+        for table, _query in DIRTY_DATES_QUERIES:
+            self.env.cr.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            marks[table] = self.env.cr.fetchone()[0]
+        return marks
+
+    @api.model
+    def _save_sync_state(self, started_at, marks):
+        self.env["ir.config_parameter"].sudo().set_param(
+            SYNC_PARAM,
+            json.dumps({
+                "synced_at": fields.Datetime.to_string(started_at),
+                "marks": marks,
+            }),
+        )
+
+    @api.model
+    def _cron_refresh(self):
+        """
+        Incrementally refresh the cube: only the booking days touched since
+        the previous run are recomputed, plus the days slots and bookings
+        were moved away from or deleted on (golfzon.dashboard.dirty.date).
+        The very first run builds the cube.
+        """
+        started_at = fields.Datetime.now()
+        state = json.loads(self.env["ir.config_parameter"].sudo().get_param(SYNC_PARAM) or "{}")
+        marks = self._collect_sync_marks()
+        left_dates = self.env["golfzon.dashboard.dirty.date"].sudo()._take(self._name)
+
+        if not state.get("synced_at"):
+            self._rebuild()
+        else:
+            since = fields.Datetime.from_string(state["synced_at"])
+            since = fields.Datetime.subtract(since, minutes=SYNC_OVERLAP_MINUTES)
+            dirty_dates = set(left_dates)
+            for table, query in DIRTY_DATES_QUERIES:
+                self.env.cr.execute(
+                    query, {"mark": state.get("marks", {}).get(table, 0), "since": since}
+                )
+                dirty_dates.update(row[0] for row in self.env.cr.fetchall())
+            self._refresh_dates(dirty_dates)
+
+        self._save_sync_state(started_at, marks)
+
+    @api.model
+    def _resync(self):
+        """Rebuild the whole cube and restart the incremental sync from now"""
+        marks = self._collect_sync_marks()
+        started_at = fields.Datetime.now()
+        self.env["golfzon.dashboard.dirty.date"].sudo()._take(self._name)
+        self._rebuild()
+        self._save_sync_state(started_at, marks)
+
+    @api.model
+    def _hourly_counts(self, start_date, end_date, first_hour=0, end_hour=24, account_id=None):
+        """
+        Teams per day of week (0=Sunday) and tee hour over the booking days
+        between start_date and end_date (of one account when given).
+        :return: [(day_of_week, hour, teams)]
+        """
+        query = """
+            SELECT
+                EXTRACT(DOW FROM bookg_date)::integer,
+                hour,
+                SUM(team_count)
+            FROM golfzon_booking_hour_cube
+            WHERE bookg_date BETWEEN %s AND %s
+                AND hour >= %s
+                AND hour < %s
+        """
+        params = [start_date, end_date, first_hour, end_hour]
+        if account_id is not None:
+            query += " AND account_id = %s"
+            params.append(account_id)
+        query += " GROUP BY 1, 2"
+        self.env.cr.execute(query, params)
+        return [(day, hour, int(teams)) for day, hour, teams in self.env.cr.fetchall()]
@@ -2,10 +2,17 @@ from odoo import models, fields
 
 class BookingInfo(models.Model):
     _name = "booking.info"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _dashboard_indexes = [
+        # Live bookings, grouped by type/state for the composition charts
+        ("booking_info_live_idx", "(bookg_info_id) INCLUDE (bookg_state_scd, bookg_type_scd, play_team_cnt) WHERE deleted_at IS NULL"),
+        # Incremental refresh of the booking hour cube
+        ("booking_info_write_date_idx", "(write_date)"),
+    ]
     _description = "Booking Information"
 
     # Fields WITHOUT column parameter - let Odoo use default naming
-    bookg_info_id = fields.Integer("Booking Info ID")
+    bookg_info_id = fields.Integer("Booking Info ID", index=True)
     account_id = fields.Integer("Account ID")
     bookg_type_scd = fields.Char("Booking Type Code")
     bookg_state_scd = fields.Char("Booking State Code")
@@ -0,0 +1,218 @@
+import json
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+SYNC_PARAM = "golfzon_dashboard.daily_metrics_sync"
+
+# Rows written within this margin before the last sync are re-scanned, so a
+# transaction that committed late with an older write_date is not missed.
+SYNC_OVERLAP_MINUTES = 5
+
+# Source tables feeding the rollup and the date column each one is bucketed by.
+# Sales come from the append-only ledger: a closed day never gets new entries.
+SOURCE_TABLES = [
+    ("golfzon_sales_ledger", "entry_date"),
+    ("visit_customers", "visit_date"),
+    ("time_table", "bookg_date"),
+]
+
+REFRESH_QUERY = """
+    INSERT INTO golfzon_daily_metrics (
+        metric_date, account_id, sales_amount, transaction_count,
+        visitor_count, reservation_count,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        metric_date,
+        account_id,
+        SUM(sales_amount),
+        SUM(transaction_count),
+        SUM(visitor_count),
+        SUM(reservation_count),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM (
+        SELECT
+            entry_date AS metric_date,
+            account_id,
+            COALESCE(SUM(amount), 0) AS sales_amount,
+            COALESCE(SUM(transaction_count), 0) AS transaction_count,
+            0 AS visitor_count,
+            0 AS reservation_count
+        FROM golfzon_sales_ledger
+        WHERE TRUE
+            {ledger_filter}
+        GROUP BY 1, 2
+
+        UNION ALL
+
+        SELECT
+            visit_date,
+            account_id,
+            0, 0,
+            COUNT(*),
+            0
+        FROM visit_customers
+        WHERE account_id IS NOT NULL
+            AND visit_date IS NOT NULL
+            {visit_filter}
+        GROUP BY 1, 2
+
+        UNION ALL
+
+        SELECT
+            bookg_date,
+            account_id,
+            0, 0, 0,
+            COUNT(*)
+        FROM time_table
+        WHERE account_id IS NOT NULL
+            AND bookg_date IS NOT NULL
+            {booking_filter}
+        GROUP BY 1, 2
+    ) facts
+    GROUP BY metric_date, account_id
+"""
+
+
+class DailyMetrics(models.Model):
+    """
+    Per day and account totals of the sales, visitor and reservation charts.
+    Sales are the net of golfzon.sales.ledger entries: a late cancellation
+    lands on its cancel day, so the sales of a closed day never need to be
+    recomputed. Visits and bookings moved to another day or deleted leave
+    their previous day in golfzon.dashboard.dirty.date.
+    """
+
+    _name = "golfzon.daily.metrics"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Daily Dashboard Metrics"
+    _order = "metric_date desc, account_id"
+
+    metric_date = fields.Date("Metric Date", required=True)
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    sales_amount = fields.Float("Sales Amount", digits=(16, 2))
+    transaction_count = fields.Integer("Transaction Count")
+    visitor_count = fields.Integer("Visitor Count")
+    reservation_count = fields.Integer("Reservation Count")
+
+    _sql_constraints = [
+        (
+            "metric_date_account_uniq",
+            "unique(metric_date, account_id)",
+            "Only one metrics row is allowed per day and account.",
+        ),
+    ]
+
+    @api.model
+    def _refresh_dates(self, dates):
+        """Recompute the rollup rows of the given days from the raw tables"""
+        dates = sorted(set(d for d in dates if d))
+        if not dates:
+            return
+        cr = self.env.cr
+        cr.execute(
+            "DELETE FROM golfzon_daily_metrics WHERE metric_date = ANY(%s)",
+            (dates,),
+        )
+        cr.execute(
+            REFRESH_QUERY.format(
+                ledger_filter="AND entry_date = ANY(%(dates)s)",
+                visit_filter="AND visit_date = ANY(%(dates)s)",
+                booking_filter="AND bookg_date = ANY(%(dates)s)",
+            ),
+            {"uid": self.env.uid, "dates": dates},
+        )
+        self.env["golfzon.daily.sales.breakdown"]._refresh_dates(dates)
+        self.env["golfzon.visitor.sketch"]._refresh_dates(dates)
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Daily metrics refreshed for {len(dates)} day(s)")
+
+    @api.model
+    def _rebuild(self):
+        """Recompute the whole rollup from scratch"""
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_daily_metrics")
+        cr.execute(
+            REFRESH_QUERY.format(
+                ledger_filter="",
+                visit_filter="",
+                booking_filter="",
+            ),
+            {"uid": self.env.uid},
+        )
+        _logger.info(f"Daily metrics rebuilt: {cr.rowcount} rows")
+        self.env["golfzon.daily.sales.breakdown"]._rebuild()
+        self.env["golfzon.visitor.sketch"]._rebuild()
+        self._invalidate_dashboard_cache()
+
+    @api.model
+    def _collect_sync_marks(self):
+        """Return the current max id of every source table"""
+        marks = {}
+        for table, _date_column in SOURCE_TABLES:
+            self.env.cr.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            marks[table] = self.env.cr.fetchone()[0]
+        return marks
+
+    @api.model
+    def _cron_refresh(self):
+        """
+        Incrementally refresh the rollup.
+        Only the days touched by rows inserted (higher id) or updated (newer
+        write_date) since the previous run are recomputed, plus the days rows
+        were moved away from or deleted on (golfzon.dashboard.dirty.date).
+        The very first run builds the whole table.
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        started_at = fields.Datetime.now()
+        state = json.loads(ICP.get_param(SYNC_PARAM) or "{}")
+        marks = self._collect_sync_marks()
+        left_dates = self.env["golfzon.dashboard.dirty.date"].sudo()._take(self._name)
+
+        if not state.get("synced_at"):
+            self._rebuild()
+        else:
+            since = fields.Datetime.from_string(state["synced_at"])
+            since = fields.Datetime.subtract(since, minutes=SYNC_OVERLAP_MINUTES)
+            dirty_dates = set(left_dates)
+            for table, date_column in SOURCE_TABLES:
+                self.env.cr.execute(
+                    f"""
+                    SELECT DISTINCT {date_column}
+                    FROM {table}
+                    WHERE {date_column} IS NOT NULL
+                        AND (id > %s OR write_date >= %s)
+                    """,
+                    (state.get("marks", {}).get(table, 0), since),
+                )
+                dirty_dates.update(row[0] for row in self.env.cr.fetchall())
+            self._refresh_dates(dirty_dates)
+
+        ICP.set_param(
+            SYNC_PARAM,
+            json.dumps({
+                "synced_at": fields.Datetime.to_string(started_at),
+                "marks": marks,
+            }),
+        )
+
+    @api.model
+    def _resync(self):
+        """
+        Rebuild the whole rollup and restart the incremental sync from now,
+        after bulk loads the sync marks do not follow (TRUNCATE, COPY)
+        """
+        marks = self._collect_sync_marks()
+        started_at = fields.Datetime.now()
+        self.env["golfzon.dashboard.dirty.date"].sudo()._take(self._name)
+        self._rebuild()
+        self.env["ir.config_parameter"].sudo().set_param(
+            SYNC_PARAM,
+            json.dumps({
+                "synced_at": fields.Datetime.to_string(started_at),
+                "marks": marks,
+            }),
+        )
@@ -0,0 +1,76 @@
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+REFRESH_QUERY = """
+    INSERT INTO golfzon_daily_sales_breakdown (
+        sale_date, store_cd_id, payment_cd_id, cal_type_cd_id,
+        sales_amount, transaction_count,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        entry_date,
+        store_cd_id,
+        payment_cd_id,
+        cal_type_cd_id,
+        COALESCE(SUM(amount), 0),
+        COALESCE(SUM(transaction_count), 0),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM golfzon_sales_ledger
+    WHERE TRUE
+        {ledger_filter}
+    GROUP BY 1, 2, 3, 4
+"""
+
+
+class DailySalesBreakdown(models.Model):
+    """
+    Net sales (golfzon.sales.ledger entries) per day, store, payment method
+    and calculation type. Refreshed together with golfzon.daily.metrics,
+    from the same dirty days.
+    """
+
+    _name = "golfzon.daily.sales.breakdown"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Daily Sales Breakdown"
+    _order = "sale_date desc"
+
+    sale_date = fields.Date("Sale Date", required=True)
+    store_cd_id = fields.Integer("Store Code ID", required=True, default=0)
+    payment_cd_id = fields.Integer("Payment Code ID", required=True, default=0)
+    cal_type_cd_id = fields.Integer("Calculation Type Code ID", required=True, default=0)
+    sales_amount = fields.Float("Sales Amount", digits=(16, 2))
+    transaction_count = fields.Integer("Transaction Count")
+
+    _sql_constraints = [
+        (
+            "breakdown_uniq",
+            "unique(sale_date, store_cd_id, payment_cd_id, cal_type_cd_id)",
+            "Only one breakdown row is allowed per day, store, payment method and calculation type.",
+        ),
+    ]
+
+    @api.model
+    def _refresh_dates(self, dates):
+        """Recompute the rows of the given days from the sales ledger"""
+        cr = self.env.cr
+        cr.execute(
+            "DELETE FROM golfzon_daily_sales_breakdown WHERE sale_date = ANY(%s)",
+            (dates,),
+        )
+        cr.execute(
+            REFRESH_QUERY.format(ledger_filter="AND entry_date = ANY(%(dates)s)"),
+            {"uid": self.env.uid, "dates": dates},
+        )
+        self._invalidate_dashboard_cache()
+
+    @api.model
+    def _rebuild(self):
+        """Recompute the whole breakdown from scratch"""
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_daily_sales_breakdown")
+        cr.execute(REFRESH_QUERY.format(ledger_filter=""), {"uid": self.env.uid})
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Daily sales breakdown rebuilt: {cr.rowcount} rows")
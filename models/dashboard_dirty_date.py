@@ -0,0 +1,121 @@
+from odoo import api, fields, models
+
+# Source tables whose rows can leave a day, per table:
+# (table, column moving the rows to another day, query returning the days
+# of the ``changed`` rows, rollups recomputing those days)
+DIRTY_DATE_SOURCES = [
+    (
+        "visit_customers",
+        "visit_date",
+        "SELECT visit_date FROM changed",
+        ["golfzon.daily.metrics", "golfzon.gender.counter"],
+    ),
+    (
+        "time_table",
+        "bookg_date",
+        "SELECT bookg_date FROM changed",
+        ["golfzon.daily.metrics", "golfzon.booking.hour.cube"],
+    ),
+    (
+        "time_table_has_bookg_infos",
+        "time_table_id",
+        """
+        SELECT tt.bookg_date
+        FROM changed
+        JOIN time_table tt ON tt.time_table_id = changed.time_table_id
+        """,
+        ["golfzon.booking.hour.cube"],
+    ),
+    (
+        "booking_info",
+        None,
+        """
+        SELECT tt.bookg_date
+        FROM changed
+        JOIN time_table_has_bookg_infos ttbi ON ttbi.bookg_info_id = changed.bookg_info_id
+        JOIN time_table tt ON tt.time_table_id = ttbi.time_table_id
+        """,
+        ["golfzon.booking.hour.cube"],
+    ),
+]
+
+# Statement level trigger function marking the days of the changed rows
+TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION {function}() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        WITH changed AS ({changed})
+        INSERT INTO golfzon_dashboard_dirty_date (rollup, dirty_date, create_date, write_date)
+        SELECT rollup, days.dirty_date, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+        FROM (SELECT DISTINCT dirty_date FROM ({days}) AS source_days (dirty_date)) AS days
+        CROSS JOIN unnest(ARRAY[{rollups}]::varchar[]) AS rollup
+        WHERE days.dirty_date IS NOT NULL;
+        RETURN NULL;
+    END
+    $$
+"""
+
+
+class DashboardDirtyDate(models.Model):
+    """
+    Days a rollup must recompute although no source row is dated on them
+    any more: the previous date of a row moved to another day, or the date
+    of a deleted row. The incremental crons only see the current date of
+    the rows written since their last run; triggers on the source tables
+    record the other days here, whether the rows are changed through the
+    ORM or by SQL, and each cron takes its own.
+    """
+
+    _name = "golfzon.dashboard.dirty.date"
+    _description = "Dashboard Dirty Date"
+
+    rollup = fields.Char("Rollup", required=True, help="Model name of the rollup to refresh")
+    dirty_date = fields.Date("Date", required=True)
+
+    def init(self):
+        super().init()
+        cr = self.env.cr
+        for table, moved_column, days, rollups in DIRTY_DATE_SOURCES:
+            rollups = ", ".join(f"'{rollup}'" for rollup in rollups)
+            triggers = [("delete", "DELETE", "OLD TABLE AS old_rows", "SELECT * FROM old_rows")]
+            if moved_column:
+                # Transition tables cannot be combined with a column list:
+                # keep the moved rows, with both their previous and new day
+                # (an update by SQL does not always set write_date)
+                moved = f"new_rows.{moved_column} IS DISTINCT FROM old_rows.{moved_column}"
+                triggers.append((
+                    "update",
+                    "UPDATE",
+                    "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+                    f"""
+                    SELECT old_rows.* FROM old_rows JOIN new_rows USING (id) WHERE {moved}
+                    UNION ALL
+                    SELECT new_rows.* FROM new_rows JOIN old_rows USING (id) WHERE {moved}
+                    """,
+                ))
+            for suffix, event, referencing, changed in triggers:
+                function = f"golfzon_dashboard_dirty_{table}_{suffix}"
+                cr.execute(TRIGGER_FUNCTION.format(
+                    function=function, changed=changed, days=days, rollups=rollups,
+                ))
+                cr.execute(f"DROP TRIGGER IF EXISTS {function} ON {table}")
+                cr.execute(
+                    f"""
+                    CREATE TRIGGER {function}
+                    AFTER {event} ON {table}
+                    REFERENCING {referencing}
+                    FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+                    """
+                )
+
+    @api.model
+    def _take(self, rollup):
+        """
+        Remove and return the dirty dates of ``rollup``. Rows are only
+        deleted with the caller's transaction, a failed refresh keeps them.
+        """
+        self.env.cr.execute(
+            "DELETE FROM golfzon_dashboard_dirty_date WHERE rollup = %s RETURNING dirty_date",
+            (rollup,),
+        )
+        return {row[0] for row in self.env.cr.fetchall()}
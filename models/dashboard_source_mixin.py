@@ -0,0 +1,132 @@
+from odoo import api, models
+
+from ..utils.result_cache import dashboard_cache
+
+POSTCOMMIT_KEY = "golfzon_dashboard.invalidated_models"
+
+
+class DashboardSourceMixin(models.AbstractModel):
+    """
+    Inherited by every model the dashboard aggregates.
+    Writes through the ORM drop the cached dashboard results computed from
+    the model once the transaction commits, and the indexes the dashboard
+    queries rely on are declared here per model.
+    """
+
+    _name = "golfzon.dashboard.source.mixin"
+    _description = "Dashboard Source Mixin"
+
+    # (index name, definition following "ON <table>"), created by init().
+    # Indexes are created IF NOT EXISTS: rename an index when its
+    # definition changes so the new one gets built.
+    _dashboard_indexes = []
+
+    # (source, date column, SQL condition) of the golfzon.data.watermark
+    # kept for the model, None when the dashboard needs no watermark
+    _dashboard_watermark = None
+
+    def init(self):
+        super().init()
+        for name, definition in self._dashboard_indexes:
+            self.env.cr.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {self._table} {definition}"
+            )
+
+    @api.model
+    def _dashboard_index_report(self):
+        """
+        Compare the declared indexes with the database: declared indexes
+        that do not exist, and indexes on the dashboard tables that were
+        never scanned since the statistics were last reset.
+        """
+        declared = {}
+        for model in self.env.registry.values():
+            if model._abstract or not model._auto:
+                continue
+            for name, definition in getattr(model, "_dashboard_indexes", []):
+                declared[name] = (model._table, definition)
+        tables = sorted({table for table, _definition in declared.values()})
+
+        cr = self.env.cr
+        cr.execute(
+            """
+            SELECT
+                s.relname AS table_name,
+                s.indexrelname AS index_name,
+                s.idx_scan,
+                pg_relation_size(s.indexrelid) AS size_bytes,
+                i.indisprimary OR i.indisunique AS is_constraint
+            FROM pg_stat_user_indexes s
+            JOIN pg_index i ON i.indexrelid = s.indexrelid
+            WHERE s.relname = ANY(%s)
+            ORDER BY s.relname, s.indexrelname
+            """,
+            (tables,),
+        )
+        existing = {row["index_name"]: row for row in cr.dictfetchall()}
+
+        cr.execute(
+            "SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()"
+        )
+        stats_reset = cr.fetchone()[0]
+
+        return {
+            "declared": len(declared),
+            "stats_reset": stats_reset and stats_reset.isoformat(),
+            "missing": [
+                {"index": name, "table": table, "definition": definition}
+                for name, (table, definition) in sorted(declared.items())
+                if name not in existing
+            ],
+            "unused": [
+                {
+                    "index": row["index_name"],
+                    "table": row["table_name"],
+                    "size_bytes": row["size_bytes"],
+                    "declared": row["index_name"] in declared,
+                }
+                for row in existing.values()
+                if not row["idx_scan"] and not row["is_constraint"]
+            ],
+        }
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self._invalidate_dashboard_cache()
+        records._bump_dashboard_watermark()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._invalidate_dashboard_cache()
+        self._bump_dashboard_watermark()
+        return res
+
+    def unlink(self):
+        self._invalidate_dashboard_cache()
+        return super().unlink()
+
+    def _bump_dashboard_watermark(self):
+        """Watermarks only move forward here, the refresh cron handles deletions"""
+        if not self._dashboard_watermark or not self:
+            return
+        self.flush_recordset()
+        self.env["golfzon.data.watermark"].sudo()._bump(self)
+
+    def _invalidate_dashboard_cache(self):
+        """
+        Schedule the invalidation after commit: dropping the entries right
+        away would let a concurrent request re-cache the pre-commit data.
+        """
+        cr = self.env.cr
+        pending = cr.postcommit.data.setdefault(POSTCOMMIT_KEY, set())
+        if not pending:
+            dbname = cr.dbname
+
+            @cr.postcommit.add
+            def invalidate():
+                models_ = cr.postcommit.data.pop(POSTCOMMIT_KEY, set())
+                dashboard_cache.invalidate({(dbname, model) for model in models_})
+
+        pending.add(self._name)
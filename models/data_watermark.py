@@ -0,0 +1,140 @@
+import logging
+
+from odoo import api, fields, models
+
+from ..utils.watermarks import data_watermarks
+
+_logger = logging.getLogger(__name__)
+
+POSTCOMMIT_KEY = "golfzon_dashboard.watermarks_moved"
+
+UPSERT_QUERY = """
+    INSERT INTO golfzon_data_watermark (
+        source, account_id, latest_date,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        %(source)s,
+        COALESCE(account_id, 0),
+        MAX({date_column}),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM {table}
+    WHERE {date_column} IS NOT NULL
+        AND {condition}
+        {extra_filter}
+    GROUP BY COALESCE(account_id, 0)
+    ON CONFLICT (source, account_id) DO UPDATE
+    SET latest_date = EXCLUDED.latest_date,
+        write_date = EXCLUDED.write_date
+    WHERE EXCLUDED.latest_date > golfzon_data_watermark.latest_date
+"""
+
+
+class DataWatermark(models.Model):
+    """
+    Latest date with data per source table and account.
+    The dashboard resolves its reference dates from these rows (through the
+    in-memory registry) instead of sorting the source tables per request.
+    Source models declare their watermark in ``_dashboard_watermark``.
+    """
+
+    _name = "golfzon.data.watermark"
+    _description = "Dashboard Data Watermark"
+    _order = "source, account_id"
+
+    source = fields.Char("Source", required=True)
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    latest_date = fields.Date("Latest Date", required=True)
+
+    _sql_constraints = [
+        (
+            "source_account_uniq",
+            "unique(source, account_id)",
+            "Only one watermark is allowed per source and account.",
+        ),
+    ]
+
+    @api.model
+    def _watermark_sources(self):
+        """(model, (source, date column, SQL condition)) of every declaring model"""
+        return [
+            (model, model._dashboard_watermark)
+            for model in self.env.registry.values()
+            if not model._abstract and getattr(model, "_dashboard_watermark", None)
+        ]
+
+    @api.model
+    def _bump(self, records):
+        """Move the watermarks of ``records``' model forward to their dates"""
+        source, date_column, condition = records._dashboard_watermark
+        self.env.cr.execute(
+            UPSERT_QUERY.format(
+                table=records._table,
+                date_column=date_column,
+                condition=condition,
+                extra_filter="AND id = ANY(%(ids)s)",
+            ),
+            {"source": source, "uid": self.env.uid, "ids": records.ids},
+        )
+        if self.env.cr.rowcount:
+            self._reload_after_commit()
+
+    @api.model
+    def _refresh(self):
+        """
+        Recompute every watermark from the source tables. Catches deleted
+        rows and, for conditions relative to the current date, the rows the
+        day change made eligible.
+        """
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_data_watermark")
+        for model, (source, date_column, condition) in self._watermark_sources():
+            cr.execute(
+                UPSERT_QUERY.format(
+                    table=model._table,
+                    date_column=date_column,
+                    condition=condition,
+                    extra_filter="",
+                ),
+                {"source": source, "uid": self.env.uid},
+            )
+        self._reload_after_commit()
+        _logger.info("Dashboard data watermarks refreshed")
+
+    @api.model
+    def _cron_refresh(self):
+        self._refresh()
+
+    def _reload_after_commit(self):
+        cr = self.env.cr
+        if not cr.postcommit.data.get(POSTCOMMIT_KEY):
+            cr.postcommit.data[POSTCOMMIT_KEY] = True
+            dbname = cr.dbname
+
+            @cr.postcommit.add
+            def reload():
+                cr.postcommit.data.pop(POSTCOMMIT_KEY, None)
+                data_watermarks.invalidate(dbname)
+
+    @api.model
+    def _load(self):
+        self.env.cr.execute("SELECT source, account_id, latest_date FROM golfzon_data_watermark")
+        marks = {}
+        for source, account_id, latest_date in self.env.cr.fetchall():
+            marks.setdefault(source, {})[account_id] = latest_date
+        return marks
+
+    @api.model
+    def _latest_date(self, source, with_account=False):
+        """
+        Latest date of ``source`` over all accounts, None without data.
+
+        :param with_account: ignore rows without account (account_id 0)
+        """
+        marks = data_watermarks.get(self.env.cr.dbname, self._load).get(source, {})
+        dates = [
+            latest_date
+            for account_id, latest_date in marks.items()
+            if account_id or not with_account
+        ]
+        return max(dates) if dates else None
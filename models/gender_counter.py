@@ -0,0 +1,233 @@
+import json
+import logging
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+SYNC_PARAM = "golfzon_dashboard.gender_counter_sync"
+
+# Same margin as the daily metrics sync, for transactions committing late
+SYNC_OVERLAP_MINUTES = 5
+
+MALE_CODES = ("M", "Male", "male", "1", "남", "남성")
+FEMALE_CODES = ("F", "Female", "female", "2", "여", "여성")
+
+# Month of the visits without visit date (the unique key needs a value)
+UNDATED_MONTH = date(1900, 1, 1)
+
+GENDER_EXPRESSION = """
+    CASE
+        WHEN gender_scd = ANY(%(male_codes)s) THEN 'male'
+        WHEN gender_scd = ANY(%(female_codes)s) THEN 'female'
+        ELSE 'other'
+    END
+"""
+
+# Adds sign * visit count to the counters of the matching visits
+UPSERT_QUERY = f"""
+    INSERT INTO golfzon_gender_counter (
+        account_id, gender, month, visit_count,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        COALESCE(account_id, 0),
+        {GENDER_EXPRESSION},
+        COALESCE(date_trunc('month', visit_date)::date, %(undated)s),
+        %(sign)s * COUNT(*),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM visit_customers
+    WHERE gender_scd IS NOT NULL
+        AND gender_scd != ''
+        {{visit_filter}}
+    GROUP BY 1, 2, 3
+    ON CONFLICT (account_id, gender, month) DO UPDATE
+    SET visit_count = golfzon_gender_counter.visit_count + EXCLUDED.visit_count,
+        write_date = EXCLUDED.write_date
+"""
+
+# Visits of the partial months at the edges of a range
+EDGE_QUERY = f"""
+    SELECT {GENDER_EXPRESSION} AS gender, COUNT(*) AS visit_count
+    FROM visit_customers
+    WHERE gender_scd IS NOT NULL
+        AND gender_scd != ''
+        AND visit_date BETWEEN %(start)s AND %(end)s
+    GROUP BY 1
+"""
+
+
+class GenderCounter(models.Model):
+    """
+    Visits per account, normalized gender and visit month.
+    Kept up to date by the visit.customer create/write/unlink hooks, so the
+    gender ratio sums a few counter rows instead of scanning visit_customers.
+    The refresh cron recounts the months of the visits written by SQL, and
+    the months visits left (golfzon.dashboard.dirty.date).
+    """
+
+    _name = "golfzon.gender.counter"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Visit Gender Counter"
+    _order = "month desc, account_id, gender"
+
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    gender = fields.Selection(
+        [("male", "Male"), ("female", "Female"), ("other", "Other")],
+        string="Gender",
+        required=True,
+    )
+    month = fields.Date("Month", required=True, help="First day of the visit month")
+    visit_count = fields.Integer("Visits")
+
+    _sql_constraints = [
+        (
+            "counter_uniq",
+            "unique(account_id, gender, month)",
+            "Only one counter is allowed per account, gender and month.",
+        ),
+    ]
+
+    def _query_params(self, **params):
+        return {
+            "male_codes": list(MALE_CODES),
+            "female_codes": list(FEMALE_CODES),
+            "undated": UNDATED_MONTH,
+            "uid": self.env.uid,
+            **params,
+        }
+
+    @api.model
+    def _count_visits(self, visits, sign):
+        """Add (sign 1) or remove (sign -1) ``visits`` from the counters"""
+        if not visits:
+            return
+        visits.flush_recordset()
+        self.env.cr.execute(
+            UPSERT_QUERY.format(visit_filter="AND id = ANY(%(ids)s)"),
+            self._query_params(sign=sign, ids=visits.ids),
+        )
+        self._invalidate_dashboard_cache()
+
+    @api.model
+    def _rebuild(self):
+        """Recompute every counter from visit_customers"""
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_gender_counter")
+        cr.execute(UPSERT_QUERY.format(visit_filter=""), self._query_params(sign=1))
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Gender counters rebuilt: {cr.rowcount} rows")
+
+    @api.model
+    def _refresh_months(self, months):
+        """Recount the counters of the given visit months from visit_customers"""
+        months = sorted(set(months))
+        if not months:
+            return
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_gender_counter WHERE month = ANY(%s)", (months,))
+        for month in months:
+            if month == UNDATED_MONTH:
+                visit_filter = "AND visit_date IS NULL"
+            else:
+                visit_filter = "AND visit_date >= %(start)s AND visit_date < %(end)s"
+            cr.execute(
+                UPSERT_QUERY.format(visit_filter=visit_filter),
+                self._query_params(sign=1, start=month, end=month + relativedelta(months=1)),
+            )
+        self._invalidate_dashboard_cache()
+        _logger.info(f"Gender counters recounted for {len(months)} month(s)")
+
+    @api.model
+    def _cron_refresh(self):
+        """
+        Recount the months of the visits inserted (higher id) or updated
+        (newer write_date) since the previous run, plus the months visits
+        were moved away from or deleted on. The very first run counts
+        every visit.
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        started_at = fields.Datetime.now()
+        state = json.loads(ICP.get_param(SYNC_PARAM) or "{}")
+        cr = self.env.cr
+        cr.execute("SELECT COALESCE(MAX(id), 0) FROM visit_customers")
+        mark = cr.fetchone()[0]
+        left_dates = self.env["golfzon.dashboard.dirty.date"].sudo()._take(self._name)
+
+        if not state.get("synced_at"):
+            self._rebuild()
+        else:
+            since = fields.Datetime.from_string(state["synced_at"])
+            since = fields.Datetime.subtract(since, minutes=SYNC_OVERLAP_MINUTES)
+            cr.execute(
+                """
+                SELECT DISTINCT COALESCE(date_trunc('month', visit_date)::date, %s)
+                FROM visit_customers
+                WHERE id > %s OR write_date >= %s
+                """,
+                (UNDATED_MONTH, state.get("mark", 0), since),
+            )
+            months = {row[0] for row in cr.fetchall()}
+            months.update(day.replace(day=1) for day in left_dates)
+            self._refresh_months(months)
+
+        ICP.set_param(
+            SYNC_PARAM,
+            json.dumps({"synced_at": fields.Datetime.to_string(started_at), "mark": mark}),
+        )
+
+    @api.model
+    def _resync(self):
+        """Recount every counter and restart the incremental sync from now"""
+        self.env["ir.config_parameter"].sudo().set_param(SYNC_PARAM, False)
+        self._cron_refresh()
+
+    @api.model
+    def _gender_counts(self, start_date=None, end_date=None):
+        """
+        {male, female, other} visit counts, over all visits or over the
+        visit dates between start_date and end_date. Whole months come from
+        the counters, the partial months at the edges from visit_customers.
+        """
+        cr = self.env.cr
+        counts = {"male": 0, "female": 0, "other": 0}
+        if start_date is None or end_date is None:
+            cr.execute("SELECT gender, SUM(visit_count) FROM golfzon_gender_counter GROUP BY gender")
+            for gender, visit_count in cr.fetchall():
+                counts[gender] += visit_count
+            return counts
+
+        first_month = start_date.replace(day=1)
+        if first_month < start_date:
+            first_month += relativedelta(months=1)
+        end_month = (end_date + relativedelta(days=1)).replace(day=1)
+
+        edges = []
+        if first_month >= end_month:
+            # No whole month in the range
+            edges.append((start_date, end_date))
+        else:
+            if start_date < first_month:
+                edges.append((start_date, first_month - relativedelta(days=1)))
+            if end_month <= end_date:
+                edges.append((end_month, end_date))
+            cr.execute(
+                """
+                SELECT gender, SUM(visit_count)
+                FROM golfzon_gender_counter
+                WHERE month >= %s AND month < %s
+                GROUP BY gender
+                """,
+                (first_month, end_month),
+            )
+            for gender, visit_count in cr.fetchall():
+                counts[gender] += visit_count
+
+        for start, end in edges:
+            cr.execute(EDGE_QUERY, self._query_params(start=start, end=end))
+            for gender, visit_count in cr.fetchall():
+                counts[gender] += visit_count
+        return counts
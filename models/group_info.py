@@ -3,6 +3,11 @@ from odoo import models, fields, api
 
 class GroupInfo(models.Model):
     _name = "golf.group.info"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _dashboard_indexes = [
+        ("golf_group_info_group_name_idx", "(group_name)"),
+        ("golf_group_info_created_at_idx", "(created_at)"),
+    ]
     _description = "Group Information"
 
     group_id = fields.Integer("Group ID")
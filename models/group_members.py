@@ -1,7 +1,15 @@
-from odoo import models, fields
+from odoo import api, models, fields
+
+# Serializes the numbering of new group members
+GROUP_MEMBER_ID_LOCK = 0x474D4944
 
 class GroupMember(models.Model):
     _name = 'golf.group.member'
+    _inherit = ['golfzon.dashboard.source.mixin']
+    _dashboard_indexes = [
+        ('golf_group_member_group_person_idx', '(group_id, person_code)'),
+        ('golf_group_member_member_id_idx', '(group_member_id)'),
+    ]
     _description = 'Group Members'
 
     group_member_id = fields.Integer('Group Member ID', required=True)
@@ -21,4 +29,15 @@ class GroupMember(models.Model):
     updated_id = fields.Char('Updated ID')
     updated_at = fields.Datetime('Updated At')
     deleted_id = fields.Char('Deleted ID')
-    deleted_at = fields.Datetime('Deleted At')
\ No newline at end of file
+    deleted_at = fields.Datetime('Deleted At')
+
+    @api.model
+    def _next_group_member_id(self):
+        """
+        First free Group Member ID. The lock is held until the end of the
+        transaction, so concurrent uploads number their members one after
+        the other instead of reusing the same ids.
+        """
+        self.env.cr.execute("SELECT pg_advisory_xact_lock(%s)", (GROUP_MEMBER_ID_LOCK,))
+        self.env.cr.execute("SELECT COALESCE(MAX(group_member_id), 0) + 1 FROM golf_group_member")
+        return self.env.cr.fetchone()[0]
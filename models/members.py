@@ -2,6 +2,10 @@ from odoo import models, fields
 
 class Members(models.Model):
     _name = 'members.members'
+    _inherit = ['golfzon.dashboard.source.mixin']
+    _dashboard_indexes = [
+        ('members_members_person_code_idx', '(person_code) INCLUDE (member_no, entry_date)'),
+    ]
     _description = 'Members'
     _order = 'created_at desc'
 
@@ -0,0 +1,289 @@
+import json
+import logging
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+SYNC_PARAM = "golfzon_dashboard.monthly_kpi_sync"
+
+# Same margin as the daily metrics sync, for transactions committing late
+SYNC_OVERLAP_MINUTES = 5
+
+# Closed months kept in the rollup by the refresh cron
+RETAINED_MONTHS = 24
+
+REFRESH_QUERY = """
+    INSERT INTO golfzon_monthly_kpi (
+        month, account_id, sales_amount, sales_count, sales_amount_sq,
+        booking_count, closed,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        month,
+        account_id,
+        SUM(sales_amount),
+        SUM(sales_count),
+        SUM(sales_amount_sq),
+        SUM(booking_count),
+        month < %(open_month)s,
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM (
+        -- One row per month even without data, so an empty closed month
+        -- is not recomputed over and over
+        SELECT month, 0 AS account_id, 0 AS sales_amount, 0 AS sales_count,
+            0 AS sales_amount_sq, 0 AS booking_count
+        FROM unnest(%(months)s::date[]) AS month
+
+        UNION ALL
+
+        SELECT
+            date_trunc('month', entry_date)::date,
+            account_id,
+            COALESCE(SUM(amount), 0),
+            COALESCE(SUM(transaction_count), 0),
+            COALESCE(SUM(amount_squared), 0),
+            0
+        FROM golfzon_sales_ledger
+        WHERE entry_date >= %(first_month)s AND entry_date < %(end_month)s
+            AND date_trunc('month', entry_date)::date = ANY(%(months)s::date[])
+        GROUP BY 1, 2
+
+        UNION ALL
+
+        SELECT
+            date_trunc('month', bookg_date)::date,
+            account_id,
+            0, 0, 0,
+            COUNT(*)
+        FROM time_table
+        WHERE account_id IS NOT NULL
+            AND bookg_date >= %(first_month)s AND bookg_date < %(end_month)s
+            AND date_trunc('month', bookg_date)::date = ANY(%(months)s::date[])
+        GROUP BY 1, 2
+    ) facts
+    GROUP BY month, account_id
+    ON CONFLICT (month, account_id) DO NOTHING
+"""
+
+
+class MonthlyKpi(models.Model):
+    """
+    Per month and account totals of the performance cards, sales being
+    summed from golfzon.sales.ledger. Months before the current one are
+    closed: computed once, then frozen. Only the open month is recomputed
+    by the refresh cron, and the cards read it live from the ledger anyway,
+    except for the closed months a late payment was posted on.
+    """
+
+    _name = "golfzon.monthly.kpi"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Monthly Dashboard KPI"
+    _order = "month desc, account_id"
+
+    month = fields.Date("Month", required=True, help="First day of the month")
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    sales_amount = fields.Float("Sales Amount", digits=(16, 2))
+    sales_count = fields.Integer("Sales Count")
+    sales_amount_sq = fields.Float("Sum of Squared Sales Amounts")
+    booking_count = fields.Integer("Booking Count")
+    closed = fields.Boolean("Closed", help="Closed months are not recomputed")
+
+    _sql_constraints = [
+        (
+            "month_account_uniq",
+            "unique(month, account_id)",
+            "Only one KPI row is allowed per month and account.",
+        ),
+    ]
+
+    @api.model
+    def _open_month(self):
+        return fields.Date.today().replace(day=1)
+
+    @api.model
+    def _compute_months(self, months):
+        """
+        (Re)compute the rows of the given months. Rows of closed months
+        are kept as they are, only missing or open months are written.
+        """
+        months = sorted(set(months))
+        if not months:
+            return
+        cr = self.env.cr
+        cr.execute(
+            "DELETE FROM golfzon_monthly_kpi WHERE month = ANY(%s) AND NOT closed",
+            (months,),
+        )
+        cr.execute(REFRESH_QUERY, {
+            "uid": self.env.uid,
+            "months": months,
+            "first_month": months[0],
+            "end_month": months[-1] + relativedelta(months=1),
+            "open_month": self._open_month(),
+        })
+
+    @api.model
+    def _ensure_months(self, months):
+        """Compute the given past months that are not closed yet"""
+        months = sorted(set(months))
+        if not months:
+            return
+        self.env.cr.execute(
+            "SELECT DISTINCT month FROM golfzon_monthly_kpi WHERE month = ANY(%s) AND closed",
+            (months,),
+        )
+        present = {row[0] for row in self.env.cr.fetchall()}
+        missing = [month for month in months if month not in present]
+        if missing:
+            self._compute_months(missing)
+            _logger.info(f"Monthly KPI closed {len(missing)} month(s)")
+
+    @api.model
+    def _reopen_months(self, months):
+        """Recompute the given closed months"""
+        months = sorted(set(months))
+        if not months:
+            return
+        self.env.cr.execute("DELETE FROM golfzon_monthly_kpi WHERE month = ANY(%s)", (months,))
+        self._compute_months(months)
+        _logger.info(f"Monthly KPI reopened {len(months)} month(s)")
+
+    @api.model
+    def _closed_totals(self, windows):
+        """
+        Totals of closed months over several windows in one pass. Read only:
+        past months not closed in the rollup yet (cold or rebuilt rollup)
+        are listed under "missing", for the caller to aggregate them live
+        with the open month. Closing them is left to the refresh cron.
+
+        :param windows: {name: (first month, end month excluded)}
+        :return: {name: {"sales_amount", "sales_count", "booking_count",
+            "missing": [first day of month]}}
+        """
+        open_month = self._open_month()
+        window_months = {}
+        for name, (start, end) in windows.items():
+            window_months[name] = []
+            month = start
+            while month < min(end, open_month):
+                window_months[name].append(month)
+                month += relativedelta(months=1)
+        all_months = sorted({month for months in window_months.values() for month in months})
+        self.env.cr.execute(
+            "SELECT DISTINCT month FROM golfzon_monthly_kpi WHERE month = ANY(%s) AND closed",
+            (all_months,),
+        )
+        closed_months = {row[0] for row in self.env.cr.fetchall()}
+
+        filters = {
+            name: f"month >= %({name}_start)s AND month < %({name}_end)s"
+            for name in windows
+        }
+        params = {"open_month": open_month}
+        for name, (start, end) in windows.items():
+            params[f"{name}_start"] = start
+            params[f"{name}_end"] = end
+        columns = ",\n".join(
+            f"COALESCE(SUM(sales_amount) FILTER (WHERE {where}), 0) AS {name}_sales_amount,\n"
+            f"COALESCE(SUM(sales_count) FILTER (WHERE {where}), 0) AS {name}_sales_count,\n"
+            f"COALESCE(SUM(booking_count) FILTER (WHERE {where}), 0) AS {name}_booking_count"
+            for name, where in filters.items()
+        )
+        self.env.cr.execute(
+            f"""
+            SELECT {columns}
+            FROM golfzon_monthly_kpi
+            WHERE closed AND month < %(open_month)s
+            """,
+            params,
+        )
+        row = self.env.cr.dictfetchone()
+        return {
+            name: {
+                "sales_amount": float(row[f"{name}_sales_amount"]),
+                "sales_count": int(row[f"{name}_sales_count"]),
+                "booking_count": int(row[f"{name}_booking_count"]),
+                "missing": [month for month in window_months[name] if month not in closed_months],
+            }
+            for name in windows
+        }
+
+    @api.model
+    def _rebuild(self):
+        """Drop every row, frozen ones included, and recompute all months with data"""
+        started_at = fields.Datetime.now()
+        mark = self._ledger_mark()
+        cr = self.env.cr
+        cr.execute("DELETE FROM golfzon_monthly_kpi")
+        cr.execute(
+            """
+            SELECT LEAST(
+                (SELECT MIN(entry_date) FROM golfzon_sales_ledger),
+                (SELECT MIN(bookg_date) FROM time_table WHERE account_id IS NOT NULL)
+            )
+            """
+        )
+        first_date = cr.fetchone()[0]
+        open_month = self._open_month()
+        months = []
+        month = first_date.replace(day=1) if first_date else open_month
+        while month <= open_month:
+            months.append(month)
+            month += relativedelta(months=1)
+        self._compute_months(months)
+        self._invalidate_dashboard_cache()
+        self._save_sync_state(started_at, mark)
+        _logger.info(f"Monthly KPI rebuilt: {len(months)} month(s)")
+
+    @api.model
+    def _ledger_mark(self):
+        self.env.cr.execute("SELECT COALESCE(MAX(id), 0) FROM golfzon_sales_ledger")
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _save_sync_state(self, started_at, mark):
+        self.env["ir.config_parameter"].sudo().set_param(
+            SYNC_PARAM,
+            json.dumps({"synced_at": fields.Datetime.to_string(started_at), "mark": mark}),
+        )
+
+    @api.model
+    def _cron_refresh(self):
+        """
+        Recompute the open month, close the months left open by the previous
+        run (month rollover), reopen the closed months ledger entries were
+        posted on since the previous run and fill in missing months of the
+        retention.
+        """
+        started_at = fields.Datetime.now()
+        state = json.loads(self.env["ir.config_parameter"].sudo().get_param(SYNC_PARAM) or "{}")
+        mark = self._ledger_mark()
+        cr = self.env.cr
+        open_month = self._open_month()
+
+        if state.get("synced_at"):
+            since = fields.Datetime.from_string(state["synced_at"])
+            since = fields.Datetime.subtract(since, minutes=SYNC_OVERLAP_MINUTES)
+            cr.execute(
+                """
+                SELECT DISTINCT date_trunc('month', entry_date)::date
+                FROM golfzon_sales_ledger
+                WHERE (id > %s OR write_date >= %s) AND entry_date < %s
+                """,
+                (state.get("mark", 0), since, open_month),
+            )
+            self._reopen_months(row[0] for row in cr.fetchall())
+
+        cr.execute("SELECT DISTINCT month FROM golfzon_monthly_kpi WHERE NOT closed")
+        months = {row[0] for row in cr.fetchall()}
+        months.add(open_month)
+        self._compute_months(months)
+        self._ensure_months(
+            open_month - relativedelta(months=offset)
+            for offset in range(1, RETAINED_MONTHS + 1)
+        )
+        self._invalidate_dashboard_cache()
+        self._save_sync_state(started_at, mark)
@@ -2,6 +2,13 @@ from odoo import models, fields, api
 
 class PaymentInfos(models.Model):
     _name = "payment.infos"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _dashboard_watermark = ("payment", "pay_date", "cancel_yn = 'N' AND pay_amt > 0")
+    _dashboard_indexes = [
+        # Sales sums over a date range, answered from the index alone
+        ("payment_infos_paid_pay_date_idx", "(pay_date) INCLUDE (pay_amt, account_id) WHERE cancel_yn = 'N'"),
+        ("payment_infos_write_date_idx", "(write_date)"),
+    ]
     _description = "Payment Information"
 
     # Map to existing database columns with proper indexing
@@ -51,3 +58,22 @@ class PaymentInfos(models.Model):
 
     # Add composite index for optimal performance
     _sql_constraints = []
+
+    # Fields changing the net amount posted to golfzon.sales.ledger
+    _LEDGER_FIELDS = {"pay_amt", "pay_date", "cancel_yn", "cancel_date"}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["golfzon.sales.ledger"].sudo()._post(records)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if self._LEDGER_FIELDS.intersection(vals):
+            self.env["golfzon.sales.ledger"].sudo()._post(self)
+        return res
+
+    def unlink(self):
+        self.env["golfzon.sales.ledger"].sudo()._post(self, void=True)
+        return super().unlink()
@@ -1,7 +1,16 @@
-from odoo import models, fields
+from odoo import api, models, fields
+
+from ..utils.age_histogram import age_histograms
+
+POSTCOMMIT_KEY = "golfzon_dashboard.age_histogram_stale"
 
 class Person(models.Model):
     _name = "golfzon.person"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _dashboard_indexes = [
+        ("golfzon_person_person_code_idx", "(person_code)"),
+        ("golfzon_person_live_birth_date_idx", "(birth_date) WHERE deleted_at IS NULL"),
+    ]
     _description = "Person Information"
 
     person_code = fields.Char(string="Person Code")
@@ -66,5 +75,53 @@ class Person(models.Model):
     biometrics_agree_yn = fields.Char(string="Biometrics Agree")
     biometrics_agree_date = fields.Datetime(string="Biometrics Agree Date")
 
+    # Fields the age histogram is computed from
+    _AGE_HISTOGRAM_FIELDS = {"birth_date", "deleted_at"}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self._reload_age_histogram_after_commit()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if self._AGE_HISTOGRAM_FIELDS.intersection(vals):
+            self._reload_age_histogram_after_commit()
+        return res
+
+    def unlink(self):
+        self._reload_age_histogram_after_commit()
+        return super().unlink()
+
+    def _reload_age_histogram_after_commit(self):
+        cr = self.env.cr
+        if not cr.postcommit.data.get(POSTCOMMIT_KEY):
+            cr.postcommit.data[POSTCOMMIT_KEY] = True
+            dbname = cr.dbname
+
+            @cr.postcommit.add
+            def reload():
+                cr.postcommit.data.pop(POSTCOMMIT_KEY, None)
+                age_histograms.invalidate(dbname)
+
+    @api.model
+    def _birth_date_counts(self):
+        """{birth_date: persons} of the persons not deleted"""
+        self.env.cr.execute(
+            """
+            SELECT birth_date, COUNT(*)
+            FROM golfzon_person
+            WHERE deleted_at IS NULL
+                AND birth_date IS NOT NULL
+            GROUP BY birth_date
+            """
+        )
+        return dict(self.env.cr.fetchall())
 
-    
+    @api.model
+    def _age_histogram(self):
+        """{age group: persons} today, see utils.age_histogram"""
+        return age_histograms.get(
+            self.env.cr.dbname, fields.Date.context_today(self), self._birth_date_counts
+        )
@@ -0,0 +1,101 @@
+import json
+import logging
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models
+
+from ..utils.forecast import ForecastUnavailable, fit_seasonal
+
+_logger = logging.getLogger(__name__)
+
+# Days projected by every fit, the endpoint serves 14 to MAX_HORIZON_DAYS
+MAX_HORIZON_DAYS = 30
+
+# History the model is fitted on
+HISTORY_YEARS = 5
+
+# Fits kept for comparison, older ones are deleted by the cron
+RETAINED_FITS = 30
+
+
+class ReservationForecast(models.Model):
+    """
+    Daily reservation forecast fitted nightly on the reservation counts of
+    golfzon.daily.metrics (see utils.forecast). The endpoint serves the
+    latest fit, it never fits on request unless no fit exists yet.
+    """
+
+    _name = "golfzon.reservation.forecast"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Reservation Forecast"
+    _order = "fitted_at desc, id desc"
+
+    fitted_at = fields.Datetime("Fitted At", required=True)
+    reference_date = fields.Date("Reference Date", required=True, help="Last day of the history")
+    history_days = fields.Integer("History Days")
+    horizon_days = fields.Integer("Horizon Days")
+    residual_std = fields.Float("Residual Std. Dev.")
+    fit_ms = fields.Float("Fit Time (ms)")
+    coefficients = fields.Text("Coefficients", help="JSON")
+    points = fields.Text("Points", help="JSON list of {date, forecast, lower, upper}")
+
+    @api.model
+    def _history(self):
+        """(first date, daily reservation counts) up to the booking watermark"""
+        reference_date = min(
+            self.env["golfzon.data.watermark"]._latest_date("booking", with_account=True)
+            or fields.Date.context_today(self),
+            fields.Date.context_today(self),
+        )
+        first_date = reference_date - relativedelta(years=HISTORY_YEARS) + relativedelta(days=1)
+        self.env.cr.execute(
+            """
+            SELECT COALESCE(SUM(m.reservation_count), 0)
+            FROM generate_series(%s::date, %s::date, interval '1 day') AS d
+            LEFT JOIN golfzon_daily_metrics m ON m.metric_date = d::date
+            GROUP BY d
+            ORDER BY d
+            """,
+            (first_date, reference_date),
+        )
+        values = [row[0] for row in self.env.cr.fetchall()]
+
+        # Leading days before the first reservation are no history
+        first_data = next((i for i, value in enumerate(values) if value), len(values))
+        return first_date + relativedelta(days=first_data), values[first_data:]
+
+    @api.model
+    def _fit(self):
+        """Fit the model and store the projection, return the new record"""
+        first_date, values = self._history()
+        result = fit_seasonal(first_date, values, MAX_HORIZON_DAYS)
+        forecast = self.create({
+            "fitted_at": fields.Datetime.now(),
+            "reference_date": first_date + relativedelta(days=len(values) - 1),
+            "history_days": result["history_days"],
+            "horizon_days": MAX_HORIZON_DAYS,
+            "residual_std": result["residual_std"],
+            "fit_ms": result["fit_ms"],
+            "coefficients": json.dumps(result["coefficients"]),
+            "points": json.dumps(result["points"]),
+        })
+        _logger.info(
+            f"Reservation forecast fitted on {result['history_days']} days in {result['fit_ms']}ms"
+        )
+        return forecast
+
+    @api.model
+    def _cron_fit(self):
+        try:
+            self._fit()
+        except ForecastUnavailable as e:
+            _logger.warning(f"Reservation forecast not fitted: {e}")
+            return
+        stale = self.search([], offset=RETAINED_FITS)
+        stale.unlink()
+
+    @api.model
+    def _latest(self):
+        """The latest fit, fitted now when there is none"""
+        return self.search([], limit=1) or self._fit()
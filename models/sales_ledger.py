@@ -0,0 +1,277 @@
+import json
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+SYNC_PARAM = "golfzon_dashboard.sales_ledger_sync"
+
+# Same margin as the daily metrics sync, for transactions committing late
+SYNC_OVERLAP_MINUTES = 5
+
+# Advisory lock key of the postings, so two transactions never post the
+# same difference. Postings of a few payments lock each payment (sharing the
+# ledger lock), the bigger ones lock the whole ledger, keeping the lock
+# table small.
+POSTING_LOCK = 0x474C4544
+MAX_PAYMENT_LOCKS = 1000
+
+# First entry of every payment: the gross sale on its payment date, also
+# for a payment loaded late (the sales of its day are reopened)
+SALE_QUERY = """
+    INSERT INTO golfzon_sales_ledger (
+        entry_date, payment_id, account_id, store_cd_id, payment_cd_id, cal_type_cd_id,
+        entry_type, amount, transaction_count, amount_squared,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        p.pay_date,
+        p.id, COALESCE(p.account_id, 0), COALESCE(p.store_cd_id, 0),
+        COALESCE(p.payment_cd_id, 0), COALESCE(p.cal_type_cd_id, 0),
+        'sale', COALESCE(p.pay_amt, 0), 1, COALESCE(p.pay_amt * p.pay_amt, 0),
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM payment_infos p
+    WHERE p.pay_date IS NOT NULL
+        AND NOT %(void)s
+        {payment_filter}
+        AND NOT EXISTS (SELECT 1 FROM golfzon_sales_ledger l WHERE l.payment_id = p.id)
+"""
+
+# Then whatever brings the posted net to the payment's current net amount
+# (and the posted count to 1 for a payment that counts, 0 otherwise):
+# a cancellation on the cancel date, a void when the payment is deleted,
+# an adjustment when the amount changed or a cancellation was undone
+CORRECTION_QUERY = """
+    INSERT INTO golfzon_sales_ledger (
+        entry_date, payment_id, account_id, store_cd_id, payment_cd_id, cal_type_cd_id,
+        entry_type, amount, transaction_count, amount_squared,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        CASE
+            WHEN entry_type = 'adjust' THEN GREATEST(pay_date, %(closed_before)s)
+            ELSE GREATEST(COALESCE(cancel_date, CURRENT_DATE), %(closed_before)s)
+        END,
+        id, account_id, store_cd_id, payment_cd_id, cal_type_cd_id,
+        entry_type, expected - posted, expected_count - posted_count,
+        expected * expected - posted * posted,
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM (
+        SELECT
+            p.id, p.pay_date, p.cancel_date,
+            COALESCE(p.account_id, 0) AS account_id,
+            COALESCE(p.store_cd_id, 0) AS store_cd_id,
+            COALESCE(p.payment_cd_id, 0) AS payment_cd_id,
+            COALESCE(p.cal_type_cd_id, 0) AS cal_type_cd_id,
+            CASE
+                WHEN %(void)s THEN 'void'
+                WHEN p.cancel_yn = 'Y' THEN 'cancel'
+                ELSE 'adjust'
+            END AS entry_type,
+            CASE
+                WHEN %(void)s OR p.cancel_yn = 'Y' THEN 0
+                ELSE COALESCE(p.pay_amt, 0)
+            END AS expected,
+            CASE WHEN %(void)s OR p.cancel_yn = 'Y' THEN 0 ELSE 1 END AS expected_count,
+            l.posted,
+            l.posted_count
+        FROM payment_infos p
+        JOIN (
+            SELECT payment_id, SUM(amount) AS posted, SUM(transaction_count) AS posted_count
+            FROM golfzon_sales_ledger
+            {ledger_filter}
+            GROUP BY payment_id
+        ) l ON l.payment_id = p.id
+        WHERE TRUE
+            {payment_filter}
+    ) balances
+    WHERE expected <> posted OR expected_count <> posted_count
+"""
+
+# Voids the payments deleted by SQL, which the unlink hook does not see.
+# Payments deleted through the ORM are already voided: their net is 0.
+VOID_TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION golfzon_sales_ledger_void() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF (SELECT COUNT(*) FROM old_rows) > {max_locks} THEN
+            PERFORM pg_advisory_xact_lock({lock});
+        ELSE
+            PERFORM pg_advisory_xact_lock_shared({lock});
+            PERFORM pg_advisory_xact_lock({lock}, id) FROM (SELECT id FROM old_rows ORDER BY id) AS ids;
+        END IF;
+        INSERT INTO golfzon_sales_ledger (
+            entry_date, payment_id, account_id, store_cd_id, payment_cd_id, cal_type_cd_id,
+            entry_type, amount, transaction_count, amount_squared, create_date, write_date
+        )
+        SELECT
+            CURRENT_DATE, o.id, COALESCE(o.account_id, 0), COALESCE(o.store_cd_id, 0),
+            COALESCE(o.payment_cd_id, 0), COALESCE(o.cal_type_cd_id, 0),
+            'void', -l.posted, -l.posted_count, -l.posted * l.posted,
+            NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+        FROM old_rows o
+        JOIN (
+            SELECT payment_id, SUM(amount) AS posted, SUM(transaction_count) AS posted_count
+            FROM golfzon_sales_ledger
+            WHERE payment_id IN (SELECT id FROM old_rows)
+            GROUP BY payment_id
+        ) l ON l.payment_id = o.id
+        WHERE l.posted <> 0 OR l.posted_count <> 0;
+        RETURN NULL;
+    END
+    $$
+"""
+
+
+class SalesLedger(models.Model):
+    """
+    Append-only net sales ledger of payment_infos.
+    A payment is posted once as a sale on its payment date, even when it
+    is loaded days later. A later cancellation is posted as a negative
+    entry on the cancel date, instead of rewriting the day the payment was
+    made. Entries are never updated or deleted. Incremental cancellations,
+    adjustments and voids never go before the current day (closed_before),
+    only the initial build posts them on past days: a closed day only
+    changes when a late payment is posted on it.
+
+    Entries also carry the change of the payment count and of the squared
+    amount, so the daily and monthly sales rollups are sums of entries.
+    """
+
+    _name = "golfzon.sales.ledger"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Net Sales Ledger"
+    _order = "entry_date desc, id desc"
+    _dashboard_indexes = [
+        ("golfzon_sales_ledger_entry_date_idx", "(entry_date) INCLUDE (amount, account_id)"),
+        ("golfzon_sales_ledger_payment_count_idx", "(payment_id) INCLUDE (amount, transaction_count)"),
+        # Entries posted since the last monthly KPI refresh
+        ("golfzon_sales_ledger_write_date_idx", "(write_date)"),
+    ]
+
+    entry_date = fields.Date("Entry Date", required=True)
+    payment_id = fields.Integer("Payment", required=True, help="Database id of the payment_infos row")
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    store_cd_id = fields.Integer("Store Code ID", required=True, default=0)
+    payment_cd_id = fields.Integer("Payment Code ID", required=True, default=0)
+    cal_type_cd_id = fields.Integer("Calculation Type Code ID", required=True, default=0)
+    entry_type = fields.Selection(
+        [("sale", "Sale"), ("cancel", "Cancellation"), ("adjust", "Adjustment"), ("void", "Void")],
+        string="Entry Type",
+        required=True,
+    )
+    amount = fields.Float("Amount", digits=(16, 2))
+    transaction_count = fields.Integer(
+        "Transaction Count", help="+1 when the payment starts counting, -1 when it stops"
+    )
+    amount_squared = fields.Float("Squared Amount Change", help="Change of the squared payment amount")
+
+    def init(self):
+        super().init()
+        cr = self.env.cr
+        cr.execute(VOID_TRIGGER_FUNCTION.format(lock=POSTING_LOCK, max_locks=MAX_PAYMENT_LOCKS))
+        cr.execute("DROP TRIGGER IF EXISTS golfzon_sales_ledger_void ON payment_infos")
+        cr.execute(
+            """
+            CREATE TRIGGER golfzon_sales_ledger_void
+            AFTER DELETE ON payment_infos
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION golfzon_sales_ledger_void()
+            """
+        )
+
+    @api.model
+    def _post(self, payments=None, void=False, incremental=True):
+        """
+        Post the entries bringing the ledger in line with ``payments``
+        (every payment when None). Idempotent: a payment whose posted net
+        already matches gets no entry.
+
+        :param void: the payments are being deleted, post their net back to 0
+        :param incremental: never post on a day before today
+        """
+        if payments is not None:
+            if not payments:
+                return 0
+            payments.flush_recordset()
+        cr = self.env.cr
+        self._lock_postings(payments.ids if payments is not None else None)
+        params = {
+            "uid": self.env.uid,
+            "void": void,
+            "closed_before": fields.Date.context_today(self) if incremental else None,
+            "ids": payments.ids if payments is not None else None,
+        }
+        payment_filter = "AND p.id = ANY(%(ids)s)" if payments is not None else ""
+        ledger_filter = "WHERE payment_id = ANY(%(ids)s)" if payments is not None else ""
+
+        cr.execute(SALE_QUERY.format(payment_filter=payment_filter), params)
+        posted = cr.rowcount
+        cr.execute(
+            CORRECTION_QUERY.format(payment_filter=payment_filter, ledger_filter=ledger_filter),
+            params,
+        )
+        posted += cr.rowcount
+        if posted:
+            self._invalidate_dashboard_cache()
+        return posted
+
+    @api.model
+    def _lock_postings(self, payment_ids=None):
+        """
+        Lock the postings of ``payment_ids`` (of every payment when None)
+        until the end of the transaction. Transactions posting different
+        payments do not wait for each other.
+        """
+        cr = self.env.cr
+        if payment_ids is None or len(payment_ids) > MAX_PAYMENT_LOCKS:
+            cr.execute("SELECT pg_advisory_xact_lock(%s)", (POSTING_LOCK,))
+            return
+        cr.execute("SELECT pg_advisory_xact_lock_shared(%s)", (POSTING_LOCK,))
+        # Always in the same order, so two postings cannot deadlock
+        cr.execute(
+            "SELECT pg_advisory_xact_lock(%s, id) FROM unnest(%s::integer[]) AS id",
+            (POSTING_LOCK, sorted(set(payment_ids))),
+        )
+
+    @api.model
+    def _cron_post(self):
+        """
+        Catch up with payments changed outside the ORM hooks (imports, SQL).
+        The first run posts the whole history on the original dates.
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        started_at = fields.Datetime.now()
+        state = json.loads(ICP.get_param(SYNC_PARAM) or "{}")
+        self.env.cr.execute("SELECT COALESCE(MAX(id), 0) FROM payment_infos")
+        mark = self.env.cr.fetchone()[0]
+
+        if not state.get("synced_at"):
+            posted = self._post(incremental=False)
+        else:
+            since = fields.Datetime.from_string(state["synced_at"])
+            since = fields.Datetime.subtract(since, minutes=SYNC_OVERLAP_MINUTES)
+            self.env.cr.execute(
+                "SELECT id FROM payment_infos WHERE id > %s OR write_date >= %s",
+                (state.get("mark", 0), since),
+            )
+            ids = [row[0] for row in self.env.cr.fetchall()]
+            posted = self._post(self.env["payment.infos"].browse(ids)) if ids else 0
+
+        ICP.set_param(
+            SYNC_PARAM,
+            json.dumps({"synced_at": fields.Datetime.to_string(started_at), "mark": mark}),
+        )
+        _logger.info(f"Sales ledger: {posted} entries posted")
+
+    @api.model
+    def _rebuild(self):
+        """
+        Repost the whole history on the original dates. Only for bulk loads
+        replacing the payments: the closed days of the ledger change.
+        """
+        self.env.cr.execute("DELETE FROM golfzon_sales_ledger")
+        self.env["ir.config_parameter"].sudo().set_param(SYNC_PARAM, False)
+        self._invalidate_dashboard_cache()
+        self._cron_post()
@@ -2,20 +2,28 @@ from odoo import models, fields
 
 class TimeTable(models.Model):
     _name = "time.table"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    # Future slots are bookable, the reference date is the latest past one
+    _dashboard_watermark = ("booking", "bookg_date", "bookg_date <= CURRENT_DATE")
+    _dashboard_indexes = [
+        ("time_table_bookg_date_account_idx", "(bookg_date, account_id)"),
+        ("time_table_live_bookg_date_idx", "(bookg_date) INCLUDE (bookg_time, time_table_id) WHERE deleted_at IS NULL"),
+        ("time_table_write_date_idx", "(write_date)"),
+    ]
     _description = "Time Table"
 
-    time_table_id = fields.Char(string="Time Table ID")
-    work_calendar_id = fields.Char(string="Work Calendar ID")
-    account_id = fields.Char(string="Account ID")
+    time_table_id = fields.Integer(string="Time Table ID", index=True)
+    work_calendar_id = fields.Integer(string="Work Calendar ID")
+    account_id = fields.Integer(string="Account ID")
     bookg_date = fields.Date(string="Booking Date")
-    bookg_time = fields.Char(string="Booking Time")
-    course_cd_id = fields.Char(string="Course Code ID")
+    bookg_time = fields.Float(string="Booking Time")  # hours, e.g. 7.5 = 07:30
+    course_cd_id = fields.Integer(string="Course Code ID")
     hole_scd = fields.Char(string="Hole SCD")
     time_part_scd = fields.Char(string="Time Part SCD")
     flag_scd = fields.Char(string="Flag SCD")
     round_scd = fields.Integer(string="Round SCD")
     time_scd = fields.Char(string="Time SCD")
-    min_person = fields.Char(string="Min Person")
+    min_person = fields.Integer(string="Min Person")
     caddie_s_scd = fields.Char(string="Caddie S SCD")
     prepay_time_yn = fields.Char(string="Prepay Time Y/N")
     member_time_yn = fields.Char(string="Member Time Y/N")
@@ -38,4 +46,16 @@ class TimeTable(models.Model):
     time_base_amt_id = fields.Char(string="Time Base Amount ID")
     time_base_amt_id_old = fields.Char(string="Time Base Amount ID Old")
 
-    
+    def write(self, vals):
+        res = super().write(vals)
+        if "bookg_time" in vals or "time_table_id" in vals:
+            # Moved slots: refresh the tee hour stored on their visits
+            self.flush_recordset()
+            self.env.cr.execute(
+                "SELECT DISTINCT bookg_info_id FROM time_table_has_bookg_infos WHERE time_table_id = ANY(%s)",
+                (self.mapped("time_table_id"),),
+            )
+            bookg_info_ids = [row[0] for row in self.env.cr.fetchall()]
+            if bookg_info_ids:
+                self.env["visit.customer"].sudo()._resolve_tee_times_of_bookings(bookg_info_ids)
+        return res
@@ -1,21 +1,26 @@
-from odoo import models, fields
+from odoo import api, models, fields
 
 class TimeTableHasBookgInfos(models.Model):
     _name = 'time.table.has.bookg.infos'
+    _inherit = ['golfzon.dashboard.source.mixin']
+    _dashboard_indexes = [
+        ('time_table_has_bookg_infos_link_idx', '(time_table_id, bookg_info_id)'),
+        ('time_table_has_bookg_infos_write_date_idx', '(write_date)'),
+    ]
     _description = 'Time Table Has Booking Infos'
     _table = 'time_table_has_bookg_infos'  # actual DB table
 
-    time_table_has_bookg_info_id = fields.Char(string='Time Table Has Bookg Info ID')
-    time_table_id = fields.Char(string='Time Table ID')
-    bookg_info_id = fields.Char(string='Booking Info ID')
+    time_table_has_bookg_info_id = fields.Integer(string='Time Table Has Bookg Info ID')
+    time_table_id = fields.Integer(string='Time Table ID')
+    bookg_info_id = fields.Integer(string='Booking Info ID', index=True)
     green_fee_cd_id = fields.Char(string='Green Fee Code ID')
     green_fee_cd_id_2 = fields.Char(string='Green Fee Code ID 2')
     green_fee_cd_id_3 = fields.Char(string='Green Fee Code ID 3')
     greenfee_discount_id = fields.Char(string='Greenfee Discount ID')
-    apply_greenfee_amt = fields.Char(string='Apply Greenfee Amount')
-    play_persons = fields.Char(string='Play Persons')
+    apply_greenfee_amt = fields.Float(string='Apply Greenfee Amount')
+    play_persons = fields.Integer(string='Play Persons')
     caddie_s_yn = fields.Char(string='Caddie Service?')
-    prepayed_amt = fields.Char(string='Prepaid Amount')
+    prepayed_amt = fields.Float(string='Prepaid Amount')
     prepayments_id = fields.Char(string='Prepayments ID')
     package_id = fields.Char(string='Package ID')
     rain_cancel_yn = fields.Char(string='Rain Cancel?')
@@ -25,8 +30,27 @@ class TimeTableHasBookgInfos(models.Model):
     updated_id = fields.Char(string='Updated By')
     updated_at = fields.Char(string='Updated At')
     kiosk_pay_yn = fields.Char(string='Kiosk Pay?')
-    org_greenfee_amt = fields.Char(string='Org Greenfee Amount')
-    agent_preamt = fields.Char(string='Agent Pre-Amount')
+    org_greenfee_amt = fields.Float(string='Org Greenfee Amount')
+    agent_preamt = fields.Float(string='Agent Pre-Amount')
     sms_yn = fields.Char(string='SMS Sent?')
     no_show_yn = fields.Char(string='No Show?')
     member_has_packages_id = fields.Char(string='Member Packages ID')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._resolve_visit_tee_times()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "time_table_id" in vals or "bookg_info_id" in vals:
+            self._resolve_visit_tee_times()
+        return res
+
+    def _resolve_visit_tee_times(self):
+        """Visits checked in before their booking was linked to a slot"""
+        bookg_info_ids = [bookg_info_id for bookg_info_id in set(self.mapped("bookg_info_id")) if bookg_info_id]
+        if bookg_info_ids:
+            self.flush_recordset()
+            self.env["visit.customer"].sudo()._resolve_tee_times_of_bookings(bookg_info_ids)
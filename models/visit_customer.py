@@ -1,22 +1,77 @@
-from odoo import models, fields
+import logging
+
+from odoo import api, models, fields
+
+_logger = logging.getLogger(__name__)
+
+# Tee time parts of the day, [start hour, end hour)
+TIME_PARTS = [("part1", 5, 12), ("part2", 12, 16), ("part3", 16, 19)]
+
+# Sets the tee hour and time part of visits from their booked time slot
+RESOLVE_TEE_TIME_QUERY = """
+    UPDATE visit_customers vc
+    SET tee_hour = slot.tee_hour,
+        time_part = CASE
+            {part_cases}
+            ELSE 'other'
+        END
+    FROM (
+        SELECT DISTINCT ON (ttbi.bookg_info_id)
+            ttbi.bookg_info_id,
+            FLOOR(tt.bookg_time)::integer AS tee_hour
+        FROM time_table_has_bookg_infos ttbi
+        JOIN time_table tt ON tt.time_table_id = ttbi.time_table_id
+        WHERE tt.bookg_time IS NOT NULL
+            AND ttbi.bookg_info_id = ANY(%(bookg_info_ids)s)
+        ORDER BY ttbi.bookg_info_id, tt.bookg_time
+    ) slot
+    WHERE vc.bookg_info_id = slot.bookg_info_id
+        AND vc.tee_hour IS DISTINCT FROM slot.tee_hour
+        {visit_filter}
+""".replace("{part_cases}", "\n            ".join(
+    f"WHEN slot.tee_hour >= {start} AND slot.tee_hour < {end} THEN '{part}'"
+    for part, start, end in TIME_PARTS
+))
+
+# Visits resolved per backfill batch
+BACKFILL_BATCH_SIZE = 50000
+
+
+def time_part_of(hour):
+    """Time part code of a tee hour"""
+    for part, start, end in TIME_PARTS:
+        if start <= hour < end:
+            return part
+    return "other"
+
 
 class VisitCustomer(models.Model):
     _name = "visit.customer"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _dashboard_watermark = ("visit", "visit_date", "visit_date <= CURRENT_DATE")
+    _dashboard_indexes = [
+        ("visit_customers_visit_date_cover_idx", "(visit_date) INCLUDE (account_id, bookg_info_id, customer_id)"),
+        ("visit_customers_person_code_idx", "(person_code) INCLUDE (visit_date, visit_seq)"),
+        ("visit_customers_write_date_idx", "(write_date)"),
+        ("visit_customers_visit_date_part_idx", "(visit_date, time_part) INCLUDE (customer_id)"),
+        # Visits left for the tee time backfill
+        ("visit_customers_unresolved_tee_idx", "(id) INCLUDE (bookg_info_id) WHERE tee_hour IS NULL AND bookg_info_id IS NOT NULL"),
+    ]
     _description = "Visit Customer"
     _table = 'visit_customers'
 
-    customer_id = fields.Char(string="Customer ID")
-    visit_team_id = fields.Char(string="Visit Team ID")
-    bookg_info_id = fields.Char(string="Booking Info ID")
-    account_id = fields.Char(string="Account ID")
+    customer_id = fields.Integer(string="Customer ID")
+    visit_team_id = fields.Integer(string="Visit Team ID")
+    bookg_info_id = fields.Integer(string="Booking Info ID", index=True)
+    account_id = fields.Integer(string="Account ID")
     visit_date = fields.Date(
         string="Visit Date", index=True
     )  # Add index for date queries
     visit_name = fields.Char(string="Visit Name")
     person_code = fields.Char(string="Person Code")
-    member_cd_id = fields.Char(string="Member Code ID")
+    member_cd_id = fields.Integer(string="Member Code ID")
     member_no = fields.Char(string="Member No")
-    visit_seq = fields.Char(string="Visit Seq")
+    visit_seq = fields.Integer(string="Visit Seq")
     locker_no = fields.Char(string="Locker No")
     gender_scd = fields.Char(
         string="Gender SCD", index=True
@@ -51,3 +106,95 @@ class VisitCustomer(models.Model):
     coupon_discount_amt = fields.Float(string="Coupon Discount Amount")
     spc_yn = fields.Char(string="Special Y/N")
 
+    # Resolved from the booked time slot on create, so the visitor sections
+    # need no join to time_table
+    tee_hour = fields.Integer(string="Tee Hour")
+    time_part = fields.Selection(
+        [("part1", "Part 1"), ("part2", "Part 2"), ("part3", "Part 3"), ("other", "Other")],
+        string="Time Part",
+    )
+
+    # Fields keying golfzon.gender.counter
+    _GENDER_COUNTER_FIELDS = {"gender_scd", "visit_date", "account_id"}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["golfzon.gender.counter"].sudo()._count_visits(records, 1)
+        records._resolve_tee_times()
+        return records
+
+    def write(self, vals):
+        counters = self.env["golfzon.gender.counter"].sudo()
+        recount = bool(self._GENDER_COUNTER_FIELDS.intersection(vals))
+        if recount:
+            counters._count_visits(self, -1)
+        res = super().write(vals)
+        if recount:
+            counters._count_visits(self, 1)
+        if "bookg_info_id" in vals:
+            self._resolve_tee_times()
+        return res
+
+    def unlink(self):
+        self.env["golfzon.gender.counter"].sudo()._count_visits(self, -1)
+        return super().unlink()
+
+    def _resolve_tee_times(self):
+        """Store the tee hour and time part of the visits' booked slot"""
+        visits = self.filtered("bookg_info_id")
+        if not visits:
+            return
+        visits.flush_recordset()
+        self._resolve_tee_times_of_bookings(
+            list(set(visits.mapped("bookg_info_id"))), visit_ids=visits.ids
+        )
+
+    @api.model
+    def _resolve_tee_times_of_bookings(self, bookg_info_ids, visit_ids=None):
+        """
+        Resolve the visits of the given bookings (all of them, or only
+        ``visit_ids``), e.g. after their time slot moved.
+        """
+        self.env.cr.execute(
+            RESOLVE_TEE_TIME_QUERY.format(
+                visit_filter="AND vc.id = ANY(%(visit_ids)s)" if visit_ids is not None else ""
+            ),
+            {"bookg_info_ids": bookg_info_ids, "visit_ids": visit_ids},
+        )
+        if self.env.cr.rowcount:
+            self.invalidate_model(["tee_hour", "time_part"])
+            self._invalidate_dashboard_cache()
+        return self.env.cr.rowcount
+
+    @api.model
+    def _cron_resolve_tee_times(self):
+        """
+        Backfill visits without tee hour: rows loaded by SQL, and visits
+        whose booking was linked to its time slot after check-in.
+        """
+        cr = self.env.cr
+        resolved = 0
+        last_id = 0
+        while True:
+            cr.execute(
+                """
+                SELECT id, bookg_info_id
+                FROM visit_customers
+                WHERE tee_hour IS NULL
+                    AND bookg_info_id IS NOT NULL
+                    AND id > %s
+                ORDER BY id
+                LIMIT %s
+                """,
+                (last_id, BACKFILL_BATCH_SIZE),
+            )
+            rows = cr.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            resolved += self._resolve_tee_times_of_bookings(
+                list({bookg_info_id for _id, bookg_info_id in rows}),
+                visit_ids=[visit_id for visit_id, _bookg_info_id in rows],
+            )
+        _logger.info(f"Tee times resolved for {resolved} visits")
@@ -0,0 +1,128 @@
+import logging
+
+import psycopg2
+
+from odoo import api, fields, models
+
+from ..utils import hyperloglog
+
+_logger = logging.getLogger(__name__)
+
+RANKS_QUERY = f"""
+    SELECT visit_date, COALESCE(account_id, 0), register, MAX(rank)
+    FROM (
+        SELECT
+            visit_date,
+            account_id,
+            {hyperloglog.REGISTER_SQL.format(hash="h.hash")} AS register,
+            {hyperloglog.RANK_SQL.format(hash="h.hash")} AS rank
+        FROM visit_customers
+        CROSS JOIN LATERAL (SELECT {hyperloglog.HASH_SQL.format(value="person_code")} AS hash) h
+        WHERE visit_date IS NOT NULL
+            AND person_code IS NOT NULL
+            AND person_code != ''
+            {{visit_filter}}
+    ) ranks
+    GROUP BY 1, 2, 3
+    ORDER BY 1, 2
+"""
+
+INSERT_QUERY = """
+    INSERT INTO golfzon_visitor_sketch (
+        visit_date, account_id, registers,
+        create_uid, create_date, write_uid, write_date
+    )
+    SELECT
+        visit_date, account_id, registers,
+        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+    FROM unnest(%(dates)s::date[], %(accounts)s::integer[], %(sketches)s::bytea[])
+        AS sketch(visit_date, account_id, registers)
+"""
+
+
+class VisitorSketch(models.Model):
+    """
+    HyperLogLog sketch of the person codes visiting per day and account.
+    Merging the daily sketches of a range estimates its unique visitors
+    within utils.hyperloglog.RELATIVE_ERROR, without COUNT(DISTINCT) over
+    the visits. Refreshed together with golfzon.daily.metrics, from the same
+    dirty days.
+    """
+
+    _name = "golfzon.visitor.sketch"
+    _inherit = ["golfzon.dashboard.source.mixin"]
+    _description = "Daily Visitor Sketch"
+    _order = "visit_date desc, account_id"
+
+    visit_date = fields.Date("Visit Date", required=True)
+    account_id = fields.Integer("Account ID", required=True, default=0)
+    registers = fields.Binary("Registers", attachment=False)
+
+    _sql_constraints = [
+        (
+            "sketch_uniq",
+            "unique(visit_date, account_id)",
+            "Only one sketch is allowed per day and account.",
+        ),
+    ]
+
+    @api.model
+    def _build(self, visit_filter, params):
+        """Insert the sketches of the visits matching ``visit_filter``"""
+        cr = self.env.cr
+        cr.execute(RANKS_QUERY.format(visit_filter=visit_filter), params)
+        sketches = {}
+        for visit_date, account_id, register, rank in cr.fetchall():
+            sketches.setdefault((visit_date, account_id), []).append((register, rank))
+        if sketches:
+            keys = list(sketches)
+            cr.execute(
+                INSERT_QUERY,
+                {
+                    "uid": self.env.uid,
+                    "dates": [visit_date for visit_date, _account_id in keys],
+                    "accounts": [account_id for _visit_date, account_id in keys],
+                    "sketches": [
+                        psycopg2.Binary(hyperloglog.from_ranks(sketches[key])) for key in keys
+                    ],
+                },
+            )
+        self._invalidate_dashboard_cache()
+        return len(sketches)
+
+    @api.model
+    def _refresh_dates(self, dates):
+        """Rebuild the sketches of the given days from visit_customers"""
+        self.env.cr.execute(
+            "DELETE FROM golfzon_visitor_sketch WHERE visit_date = ANY(%s)",
+            (dates,),
+        )
+        self._build("AND visit_date = ANY(%(dates)s)", {"dates": dates})
+
+    @api.model
+    def _rebuild(self):
+        """Rebuild every sketch from scratch"""
+        self.env.cr.execute("DELETE FROM golfzon_visitor_sketch")
+        count = self._build("", {})
+        _logger.info(f"Visitor sketches rebuilt: {count} rows")
+
+    @api.model
+    def _unique_visitors(self, start_date, end_date, account_id=None):
+        """
+        Estimated distinct person codes visiting between start_date and
+        end_date (of one account when given).
+
+        :return: (estimate, relative standard error)
+        """
+        query = """
+            SELECT registers
+            FROM golfzon_visitor_sketch
+            WHERE visit_date BETWEEN %s AND %s
+        """
+        params = [start_date, end_date]
+        if account_id is not None:
+            query += " AND account_id = %s"
+            params.append(account_id)
+        self.env.cr.execute(query, params)
+        sketch = hyperloglog.merge(row[0] for row in self.env.cr.fetchall())
+        return round(hyperloglog.estimate(sketch)), hyperloglog.RELATIVE_ERROR
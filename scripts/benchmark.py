@@ -0,0 +1,205 @@
+"""
+Benchmark runner for the dashboard and member group controllers.
+
+Calls every data endpoint the way the router would (a request bound to the
+shell environment is pushed on Odoo's request stack) and reports latency and
+query count per endpoint, cold (result cache cleared before each call) and
+warm. Load a data set with ``data_generator`` first:
+
+    $ odoo-bin shell -d golfzon_bench
+    >>> from odoo.addons.golfzon_dashboard.scripts import benchmark
+    >>> benchmark.run(env, repeat=5, output="/tmp/bench.csv")
+"""
+import csv
+import io
+import logging
+import statistics
+import threading
+import time
+from datetime import date, timedelta
+
+import xlsxwriter
+
+from odoo.http import Response, _request_stack
+
+from ..controllers.main import SalesStatusController
+from ..controllers.member_group import MemberGroupController
+from ..utils.result_cache import dashboard_cache
+
+_logger = logging.getLogger(__name__)
+
+UPLOAD_ROWS = 1000
+
+
+class BenchmarkRequest:
+    """Just enough of odoo.http.Request for the controllers to run"""
+
+    def __init__(self, env):
+        self.env = env
+        self.session = {}
+
+    @property
+    def cr(self):
+        return self.env.cr
+
+    def make_response(self, data, headers=None, cookies=None, status=200):
+        return Response(data, headers=headers, status=status)
+
+
+class UploadedFile(io.BytesIO):
+    filename = "benchmark_members.xlsx"
+
+
+def _member_list_file(env, rows):
+    """Build an upload workbook in the template layout from existing persons"""
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {"in_memory": True})
+    sheet = workbook.add_worksheet("Member List")
+    sheet.write_row(0, 0, [
+        "Membership number", "name", "Date of joining", "contact", "email",
+        "Residence", "Number of times built-in", "Recent interior date",
+    ])
+    env.cr.execute(
+        "SELECT person_code, member_name, mobile_phone, email FROM golfzon_person LIMIT %s",
+        (rows,),
+    )
+    for i, (code, name, phone, email) in enumerate(env.cr.fetchall(), 1):
+        sheet.write_row(i, 0, [code, name, "2025-01-01", phone, email, "Seoul", "1", "2025-01-01"])
+    workbook.close()
+    return output.getvalue()
+
+
+def _cases(env):
+    """(label, controller, method name, kwargs, writes) for every endpoint"""
+    dashboard = SalesStatusController()
+    groups = MemberGroupController()
+    today = date.today()
+
+    env.cr.execute("SELECT id, group_name FROM golf_group_info ORDER BY id LIMIT 1")
+    group = env.cr.fetchone() or (None, None)
+    upload = _member_list_file(env, UPLOAD_ROWS)
+
+    return [
+        ("bootstrap", dashboard, "get_dashboard_bootstrap", {}, False),
+        ("performance_indicators", dashboard, "get_performance_indicators", {}, False),
+        ("sales_data 7days", dashboard, "get_sales_data", {"period": "7days"}, False),
+        ("sales_data 30days", dashboard, "get_sales_data", {"period": "30days"}, False),
+        ("sales_breakdown 30days", dashboard, "get_sales_breakdown", {"period": "30days"}, False),
+        ("visitor_data 7days", dashboard, "get_visitor_data", {"period": "7days"}, False),
+        ("visitor_data 30days", dashboard, "get_visitor_data", {"period": "30days"}, False),
+        ("reservation_trend 7days", dashboard, "get_reservation_trend_data", {"period": "7days"}, False),
+        ("reservation_trend 30days", dashboard, "get_reservation_trend_data", {"period": "30days"}, False),
+        ("age_group_data", dashboard, "get_age_group_data", {}, False),
+        ("segments_crosstab", dashboard, "get_segment_crosstab", {}, False),
+        ("reservation_forecast 30days", dashboard, "get_reservation_forecast", {"horizon": 30}, False),
+        ("heatmap", dashboard, "get_heatmap_data", {}, False),
+        ("heatmap quarter", dashboard, "get_heatmap_data", {"window": "quarter"}, False),
+        ("golf_info", dashboard, "get_golf_info", {}, False),
+        ("member_composition", dashboard, "get_member_composition_data", {}, False),
+        ("member_group search", groups, "search_member_groups", {
+            "start_date": (today - timedelta(days=365)).isoformat(),
+            "end_date": today.isoformat(),
+        }, False),
+        ("member_group statistics", groups, "get_statistics", {}, False),
+        ("member_group condition_inquiry", groups, "condition_inquiry", {"group_title": group[1]}, False),
+        ("member_group get_members", groups, "get_members", {"group_id": group[0], "offset": 0, "limit": 10}, False),
+        ("member_group download_excel", groups, "download_excel", {}, False),
+        ("member_group download_template", groups, "download_template", {}, False),
+        ("member_group upload_member_list", groups, "upload_member_list", {
+            "group_title": "Benchmark upload",
+            "member_list_file": lambda: UploadedFile(upload),
+        }, True),
+    ]
+
+
+def _call(env, controller, method, kwargs, writes):
+    """Run one endpoint call, return (elapsed ms, queries, sql ms)"""
+    kwargs = {k: v() if callable(v) else v for k, v in kwargs.items()}
+    thread = threading.current_thread()
+    thread.query_count = 0
+    thread.query_time = 0.0
+    if writes:
+        env.cr.execute("SAVEPOINT golfzon_benchmark")
+    started = time.perf_counter()
+    try:
+        result = getattr(controller, method)(**kwargs)
+        if isinstance(result, Response):
+            # Streamed bodies (file exports) are produced while being sent
+            for _chunk in result.response:
+                pass
+            result.close()
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        if writes:
+            env.cr.execute("ROLLBACK TO SAVEPOINT golfzon_benchmark")
+            env.invalidate_all()
+    return elapsed, thread.query_count, thread.query_time * 1000
+
+
+def _summary(label, mode, samples):
+    timings = sorted(s[0] for s in samples)
+    p95_index = min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))
+    return {
+        "endpoint": label,
+        "mode": mode,
+        "runs": len(samples),
+        "min_ms": round(timings[0], 2),
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[p95_index], 2),
+        "max_ms": round(timings[-1], 2),
+        "queries": round(statistics.mean(s[1] for s in samples), 1),
+        "sql_ms": round(statistics.mean(s[2] for s in samples), 2),
+    }
+
+
+def _format_table(results):
+    columns = ["endpoint", "mode", "runs", "min_ms", "median_ms", "p95_ms", "max_ms", "queries", "sql_ms"]
+    widths = {c: max(len(c), *(len(str(r[c])) for r in results)) for c in columns}
+    lines = [
+        " | ".join(c.ljust(widths[c]) for c in columns),
+        "-+-".join("-" * widths[c] for c in columns),
+    ]
+    for r in results:
+        lines.append(" | ".join(str(r[c]).ljust(widths[c]) for c in columns))
+    return "\n".join(lines)
+
+
+def run(env, repeat=5, only=None, output=None):
+    """
+    Benchmark every endpoint ``repeat`` times, cold then warm.
+
+    :param only: optional substring, only endpoints whose label contains it run
+    :param output: optional CSV path for the result table
+    :return: list of result dicts, also printed as a table
+    """
+    _request_stack.push(BenchmarkRequest(env))
+    try:
+        results = []
+        for label, controller, method, kwargs, writes in _cases(env):
+            if only and only not in label:
+                continue
+            # Uploads are rolled back after each call, so they never hit a warm cache
+            modes = ("cold",) if writes else ("cold", "warm")
+            for mode in modes:
+                samples = []
+                for _i in range(repeat):
+                    if mode == "cold":
+                        dashboard_cache.clear()
+                    samples.append(_call(env, controller, method, kwargs, writes))
+                results.append(_summary(label, mode, samples))
+                _logger.info(f"Benchmarked {label} ({mode})")
+    finally:
+        _request_stack.pop()
+
+    if not results:
+        _logger.warning("No endpoint matched the benchmark filter")
+        return results
+
+    table = _format_table(results)
+    print(table)
+    if output:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+    return results
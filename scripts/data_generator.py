@@ -0,0 +1,411 @@
+"""
+Synthetic data generator for local performance work.
+
+Fills the ten source models of the dashboard with production-like volume and
+skew (seasonality, weekend peaks, morning tee times, a few very frequent
+visitors, one dominant account) and loads them with COPY. Run it from an
+Odoo shell against a scratch database:
+
+    $ odoo-bin shell -d golfzon_bench
+    >>> from odoo.addons.golfzon_dashboard.scripts import data_generator
+    >>> data_generator.generate(env, scale="1m", reset=True)
+    >>> env.cr.commit()
+
+``scale`` is the approximate number of visit_customers rows, every other
+table is sized relative to it.
+"""
+import logging
+import math
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from ..models.visit_customer import time_part_of
+from ..utils.age_histogram import age_histograms
+from ..utils.result_cache import dashboard_cache
+
+_logger = logging.getLogger(__name__)
+
+SCALES = {
+    "10k": 10_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+HISTORY_DAYS = 3 * 365
+FUTURE_DAYS = 60
+
+# (account_id, weight): one club carries most of the traffic
+ACCOUNTS = [(1001, 70), (1002, 20), (1003, 10)]
+
+# Tee-off hour and its relative demand, mornings sell out first
+TEE_HOURS = [
+    (5, 3), (6, 9), (7, 12), (8, 12), (9, 10), (10, 8), (11, 7),
+    (12, 7), (13, 8), (14, 7), (15, 5), (16, 4), (17, 3), (18, 2),
+]
+
+MONTH_WEIGHTS = {
+    1: 0.5, 2: 0.6, 3: 0.9, 4: 1.3, 5: 1.4, 6: 1.2,
+    7: 1.0, 8: 0.9, 9: 1.2, 10: 1.4, 11: 1.0, 12: 0.6,
+}
+
+# Monday first
+WEEKDAY_WEIGHTS = [0.8, 0.8, 0.85, 0.9, 1.1, 1.8, 1.7]
+
+BOOKING_TYPES = [("G", 60), ("J", 15), ("D", 15), ("T", 10)]
+
+# (chnl_cd_id, chnl_detail, weight)
+CHANNELS = [
+    (39718, "phone", 25),
+    (779, "mobile web", 45),
+    (39719, "travel agency", 15),
+    (1676, "agent office", 10),
+    (None, None, 5),
+]
+
+PLAYERS = [(4, 60), (3, 20), (2, 15), (1, 5)]
+
+# Green fees are paid at the front desk, extras at the restaurant or pro shop
+FRONT_DESK_STORE = 1
+EXTRA_STORES = [(2, 65), (3, 35)]
+# (payment_cd_id, weight): card, cash, points
+PAYMENT_METHODS = [(1, 75), (2, 15), (3, 10)]
+
+BOOKING_CANCEL_RATE = 0.04
+PAYMENT_CANCEL_RATE = 0.02
+EXTRA_PAYMENT_RATE = 0.4
+
+# Tables in load order, also the ones emptied by reset=True
+TABLES = [
+    "golfzon_person",
+    "members_members",
+    "booking_info",
+    "time_table",
+    "time_table_has_bookg_infos",
+    "visit_customers",
+    "payment_infos",
+    "golf_group_info",
+    "golf_group_details",
+    "golf_group_member",
+]
+
+MAGIC_COLUMNS = ["create_uid", "create_date", "write_uid", "write_date"]
+
+
+def _chooser(rng, pairs):
+    """Return a function picking a value from (value, weight) pairs"""
+    values = [p[0] for p in pairs]
+    cum_weights = []
+    total = 0
+    for p in pairs:
+        total += p[-1]
+        cum_weights.append(total)
+    return lambda: rng.choices(values, cum_weights=cum_weights)[0]
+
+
+def _encode(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    value = str(value)
+    if any(c in value for c in "\\\t\n\r"):
+        value = (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return value
+
+
+class TableWriter:
+    """Buffers rows of one table in a temporary file, then COPYs them in"""
+
+    def __init__(self, table, columns, now):
+        self.table = table
+        self.columns = list(columns) + MAGIC_COLUMNS
+        self.magic = "\t" + "\t".join(_encode(v) for v in (1, now, 1, now))
+        self.file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        self.count = 0
+
+    def write(self, row):
+        self.file.write("\t".join(_encode(v) for v in row))
+        self.file.write(self.magic)
+        self.file.write("\n")
+        self.count += 1
+
+    def load(self, cr):
+        started = time.perf_counter()
+        self.file.seek(0)
+        cr.copy_expert(
+            f"COPY {self.table} ({', '.join(self.columns)}) FROM STDIN",
+            self.file,
+        )
+        self.file.close()
+        _logger.info(
+            f"Loaded {self.count:,} rows into {self.table} "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return self.count
+
+
+def _day_weights(today):
+    """Relative demand per calendar day, including the booked-ahead window"""
+    days, weights = [], []
+    for offset in range(-HISTORY_DAYS, FUTURE_DAYS + 1):
+        day = today + timedelta(days=offset)
+        weight = MONTH_WEIGHTS[day.month] * WEEKDAY_WEIGHTS[day.weekday()]
+        # ~10% yearly growth
+        weight *= 1.1 ** (offset / 365)
+        if offset > 0:
+            # Future slots fill up as the date gets closer
+            weight *= max(0.05, 1 - offset / FUTURE_DAYS)
+        days.append(day)
+        weights.append(weight)
+    return days, weights
+
+
+def _birth_date(rng, today):
+    age = min(max(int(rng.gauss(48, 13)), 8), 85)
+    return today - timedelta(days=age * 365 + rng.randrange(365))
+
+
+def generate(env, scale="10k", seed=42, reset=False):
+    """
+    Generate and load the synthetic data set.
+
+    :param scale: one of SCALES or an explicit number of visits
+    :param seed: random seed, the same seed always produces the same rows
+    :param reset: empty the source tables first
+    :return: dict of loaded row counts per table
+    """
+    if isinstance(scale, str) and not scale.isdigit():
+        if scale.lower() not in SCALES:
+            raise ValueError(
+                f"Unknown scale {scale!r}, expected one of {', '.join(SCALES)} or a number of visits"
+            )
+        visits_target = SCALES[scale.lower()]
+    else:
+        visits_target = int(scale)
+    rng = random.Random(seed)
+    cr = env.cr
+    now = datetime.now().replace(microsecond=0)
+    today = now.date()
+    started = time.perf_counter()
+
+    if reset:
+        cr.execute(f"TRUNCATE {', '.join(TABLES)}, golfzon_daily_metrics, golfzon_daily_sales_breakdown, golfzon_monthly_kpi, golfzon_sales_ledger, golfzon_gender_counter, golfzon_visitor_sketch, golfzon_reservation_forecast, golfzon_booking_hour_cube, golfzon_dashboard_dirty_date RESTART IDENTITY")
+
+    person_count = max(100, visits_target // 8)
+    booking_count = max(50, visits_target // 3)
+    member_count = person_count // 3
+    group_count = max(20, visits_target // 5000)
+
+    pick_account = _chooser(rng, ACCOUNTS)
+    pick_hour = _chooser(rng, TEE_HOURS)
+    pick_type = _chooser(rng, BOOKING_TYPES)
+    pick_channel = _chooser(rng, [((c, d), w) for c, d, w in CHANNELS])
+    pick_store = _chooser(rng, EXTRA_STORES)
+    pick_payment_method = _chooser(rng, PAYMENT_METHODS)
+    pick_players = _chooser(rng, PLAYERS)
+    days, day_weights = _day_weights(today)
+    cum_day_weights = []
+    total = 0
+    for w in day_weights:
+        total += w
+        cum_day_weights.append(total)
+
+    def pick_person():
+        # Power-law popularity: a small core of regulars plays most rounds
+        return int(person_count * rng.random() ** 3)
+
+    counts = {}
+
+    # Persons
+    genders = bytearray(person_count)
+    persons = TableWriter("golfzon_person", [
+        "person_code", "account_id", "member_name", "birth_date", "gender_scd",
+        "nation_scd", "mobile_phone", "email", "state_scd", "created_at",
+    ], now)
+    for i in range(person_count):
+        is_male = rng.random() < 0.72
+        genders[i] = 1 if is_male else 2
+        persons.write((
+            f"P{i:09d}",
+            pick_account(),
+            f"Member {i}",
+            _birth_date(rng, today) if rng.random() < 0.93 else None,
+            "M" if is_male else "F",
+            "KR" if rng.random() < 0.95 else rng.choice(["JP", "CN", "US"]),
+            f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+            f"member{i}@example.com",
+            "active",
+            now - timedelta(days=rng.randrange(HISTORY_DAYS * 2)),
+        ))
+    counts["golfzon_person"] = persons.load(cr)
+
+    # Members, a third of the persons hold a membership
+    members = TableWriter("members_members", [
+        "member_id", "person_code", "account_id", "member_no", "entry_date",
+    ], now)
+    for i in range(member_count):
+        members.write((
+            str(i + 1),
+            f"P{rng.randrange(person_count):09d}",
+            pick_account(),
+            f"M{i:08d}",
+            today - timedelta(days=rng.randrange(HISTORY_DAYS * 3)),
+        ))
+    counts["members_members"] = members.load(cr)
+
+    # Bookings with their tee time, then the visits and payments they produce
+    bookings = TableWriter("booking_info", [
+        "bookg_info_id", "account_id", "bookg_type_scd", "bookg_state_scd",
+        "main_yn", "bookg_name", "person_code", "chnl_cd_id", "chnl_detail",
+        "play_team_cnt", "play_player_cnt", "created_at",
+    ], now)
+    slots = TableWriter("time_table", [
+        "time_table_id", "account_id", "bookg_date", "bookg_time",
+        "course_cd_id", "time_part_scd", "round_scd",
+    ], now)
+    links = TableWriter("time_table_has_bookg_infos", [
+        "time_table_has_bookg_info_id", "time_table_id", "bookg_info_id",
+        "play_persons", "bookg_method_scd",
+    ], now)
+    visits = TableWriter("visit_customers", [
+        "customer_id", "visit_team_id", "bookg_info_id", "account_id",
+        "visit_date", "visit_name", "person_code", "visit_seq", "gender_scd",
+        "greenfee_amt", "tee_hour", "time_part",
+    ], now)
+    payments = TableWriter("payment_infos", [
+        "pay_id", "customer_id", "account_id", "pay_date", "cancel_date",
+        "pay_amt", "tax_amt", "vat_amt", "cancel_yn", "store_cd_id", "payment_cd_id",
+    ], now)
+
+    visit_id = 0
+    pay_id = 0
+    for booking_id in range(1, booking_count + 1):
+        day = rng.choices(days, cum_weights=cum_day_weights)[0]
+        hour = pick_hour()
+        account = pick_account()
+        players = pick_players()
+        chnl_cd_id, chnl_detail = pick_channel()
+        booker = pick_person()
+        cancelled = rng.random() < BOOKING_CANCEL_RATE
+
+        bookings.write((
+            booking_id, account, pick_type(), "C" if cancelled else "R",
+            "Y", f"Member {booker}", f"P{booker:09d}", chnl_cd_id, chnl_detail,
+            1, players,
+            datetime.combine(day, datetime.min.time()) - timedelta(days=rng.randrange(1, 30)),
+        ))
+        slots.write((
+            booking_id, account, day,
+            hour + rng.randrange(0, 60, 7) / 60,
+            rng.randint(1, 3),
+            "1" if hour < 12 else ("2" if hour < 16 else "3"),
+            1,
+        ))
+        links.write((
+            booking_id, booking_id, booking_id, players, "online",
+        ))
+
+        if cancelled or day > today:
+            continue
+
+        weekend = day.weekday() >= 5
+        for seq in range(1, players + 1):
+            visit_id += 1
+            person = booker if seq == 1 else pick_person()
+            greenfee = round(rng.lognormvariate(math.log(190000 if weekend else 150000), 0.2), -3)
+            visits.write((
+                visit_id, booking_id, booking_id, account,
+                day, f"Member {person}", f"P{person:09d}", seq,
+                "M" if genders[person] == 1 else "F",
+                greenfee, hour, time_part_of(hour),
+            ))
+
+            amounts = [(greenfee, FRONT_DESK_STORE)]
+            if rng.random() < EXTRA_PAYMENT_RATE:
+                amounts.append((round(rng.lognormvariate(math.log(40000), 0.6), -2), pick_store()))
+            for amount, store in amounts:
+                pay_id += 1
+                pay_cancelled = rng.random() < PAYMENT_CANCEL_RATE
+                payments.write((
+                    pay_id, visit_id, account, day,
+                    day + timedelta(days=rng.randrange(3)) if pay_cancelled else None,
+                    amount, round(amount / 11, 2), round(amount / 11, 2),
+                    "Y" if pay_cancelled else "N", store, pick_payment_method(),
+                ))
+
+    for writer in (bookings, slots, links, visits, payments):
+        counts[writer.table] = writer.load(cr)
+
+    # Member groups; members reference the database id of their group
+    group_sizes = [min(500, int(5 * rng.paretovariate(1.1))) for _ in range(group_count)]
+    groups = TableWriter("golf_group_info", [
+        "group_id", "account_id", "group_name", "group_code", "group_scd",
+        "state_scd", "member_count", "created_at", "updated_at",
+    ], now)
+    for i, size in enumerate(group_sizes):
+        created = now - timedelta(days=rng.randrange(HISTORY_DAYS))
+        groups.write((
+            i + 1, pick_account(), f"Group {i + 1:05d}", f"SYN{i + 1:06d}",
+            rng.choice(["register", "condition"]), "active", str(size),
+            created, created + timedelta(days=rng.randrange(30)),
+        ))
+    counts["golf_group_info"] = groups.load(cr)
+
+    cr.execute(
+        "SELECT id FROM golf_group_info WHERE group_code LIKE %s ORDER BY id DESC LIMIT %s",
+        ("SYN%", group_count),
+    )
+    group_ids = [row[0] for row in reversed(cr.fetchall())]
+
+    details = TableWriter("golf_group_details", [
+        "group_id", "month_01_yn", "month_06_yn", "month_12_yn",
+        "mon_yn", "sat_yn", "sun_yn", "created_at",
+    ], now)
+    group_members = TableWriter("golf_group_member", [
+        "group_member_id", "group_id", "group_member_name", "person_code",
+        "mobile_phone", "email", "created_at",
+    ], now)
+    group_member_id = 0
+    for group_id, size in zip(group_ids, group_sizes):
+        details.write((
+            group_id,
+            *(rng.choice(["Y", "N"]) for _ in range(6)),
+            now,
+        ))
+        for person in rng.sample(range(person_count), min(size, person_count)):
+            group_member_id += 1
+            group_members.write((
+                group_member_id, group_id, f"Member {person}", f"P{person:09d}",
+                f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+                f"member{person}@example.com", now,
+            ))
+    counts["golf_group_details"] = details.load(cr)
+    counts["golf_group_member"] = group_members.load(cr)
+
+    for table in TABLES:
+        cr.execute(f"ANALYZE {table}")
+
+    # COPY bypasses the ORM hooks: rebuild the rollups and drop cached results
+    # The ledger first: the sales rollups are summed from it
+    env["golfzon.sales.ledger"]._rebuild()
+    env["golfzon.daily.metrics"]._resync()
+    env["golfzon.monthly.kpi"]._rebuild()
+    env["golfzon.gender.counter"]._resync()
+    env["golfzon.booking.hour.cube"]._resync()
+    env["golfzon.data.watermark"]._refresh()
+    env["golfzon.reservation.forecast"]._cron_fit()
+    env.invalidate_all()
+    dashboard_cache.clear()
+    age_histograms.clear()
+
+    _logger.info(
+        f"Synthetic data set '{scale}' generated in {time.perf_counter() - started:.1f}s: {counts}"
+    )
+    return counts
@@ -116,6 +116,7 @@ class GolfzonDashboard extends Component {
             salesPeriod: '30days',
             visitorPeriod: '30days',
             reservationPeriod: '30days',
+            heatmapWindow: '7days',
             showReservationDetails: false,
             selectedSlot: { day: "", period: "", count: 0 },
             earlyMorningData: [0, 0, 0, 0, 0, 0, 0],
@@ -172,17 +173,7 @@ class GolfzonDashboard extends Component {
         try {
             const response = await fetch('/golfzon/api/current_language');
             const data = await response.json();
-
-            if (data.status === 'success') {
-                this.state.currentLanguage = data.current_lang;
-                localStorage.setItem("dashboard_lang", data.current_lang);
-                sessionStorage.setItem("current_language", data.current_lang);
-                console.log('✅ Current language loaded:', data.current_lang);
-            } else {
-                this.state.currentLanguage = 'ko_KR';
-                localStorage.setItem("dashboard_lang", 'ko_KR');
-                sessionStorage.setItem("current_language", 'ko_KR');
-            }
+            this.applyLanguage(data);
         } catch (error) {
             console.error('❌ Error loading current language:', error);
             this.state.currentLanguage = 'ko_KR';
@@ -190,6 +181,20 @@ class GolfzonDashboard extends Component {
             sessionStorage.setItem("current_language", 'ko_KR');
         }
     }
+
+    applyLanguage(data) {
+        if (data && data.status === 'success') {
+            this.state.currentLanguage = data.current_lang;
+            localStorage.setItem("dashboard_lang", data.current_lang);
+            sessionStorage.setItem("current_language", data.current_lang);
+            console.log('✅ Current language loaded:', data.current_lang);
+        } else {
+            this.state.currentLanguage = 'ko_KR';
+            localStorage.setItem("dashboard_lang", 'ko_KR');
+            sessionStorage.setItem("current_language", 'ko_KR');
+        }
+    }
+
     getKoreanDateFallback() {
         const date = new Date();
         const koreanDays = ['일요일', '월요일', '화요일', '수요일', '목요일', '금요일', '토요일'];
@@ -208,20 +213,22 @@ class GolfzonDashboard extends Component {
         try {
             const response = await fetch('/golfzon/api/current_date');
             const data = await response.json();
-
-            if (data.status === 'success') {
-                this.state.currentDate = data.formatted_date;
-                console.log('✅ Korean date loaded from backend:', data.formatted_date);
-            } else {
-                const lang = this.state.currentLanguage || 'ko_KR';
-                this.state.currentDate = this.getKoreanDateFallback();
-            }
+            this.applyCurrentDate(data);
         } catch (error) {
             console.error('❌ Error loading current date:', error);
             this.state.currentDate = this.getKoreanDateFallback();
         }
     }
 
+    applyCurrentDate(data) {
+        if (data && data.status === 'success') {
+            this.state.currentDate = data.formatted_date;
+            console.log('✅ Korean date loaded from backend:', data.formatted_date);
+        } else {
+            this.state.currentDate = this.getKoreanDateFallback();
+        }
+    }
+
     getKoreanDateFallback() {
         const date = new Date();
         const koreanDays = ['일요일', '월요일', '화요일', '수요일', '목요일', '금요일', '토요일'];
@@ -304,25 +311,15 @@ class GolfzonDashboard extends Component {
         this.loaderManager.startLoading();
 
         try {
-            await this.loadCurrentLanguage();
-            this.loaderManager.logProgress("Language loaded");
-
-            await this.loadCurrentDate();
-            this.loaderManager.logProgress("Date initialized");
-
-            console.log("📡 Fetching all dashboard data in parallel...");
+            console.log("📡 Fetching all dashboard data in one bootstrap request...");
 
             const results = await Promise.allSettled([
                 this.initializeLocation(),
-                this.loadPerformanceData(),
-                this.loadSalesData(),
-                this.loadVisitorData(),
-                this.loadAgeData(),
-                this.loadHeatmapData(),
-                this.loadMemberCompositionData()
+                this.loadDashboardData(),
+                this.loadForecastData(),
             ]);
 
-            const names = ['Location', 'Performance', 'Sales', 'Visitor', 'Age', 'Heatmap', 'Member'];
+            const names = ['Location', 'Dashboard', 'Forecast'];
             results.forEach((result, index) => {
                 if (result.status === 'fulfilled') {
                     this.loaderManager.logProgress(`${names[index]} data loaded ✅`);
@@ -354,6 +351,87 @@ class GolfzonDashboard extends Component {
         document.addEventListener("click", this.handleOutsideDrawer.bind(this));
     }
 
+    async loadDashboardData() {
+        try {
+            await this.loadBootstrapData();
+        } catch (error) {
+            console.error("❌ Bootstrap request failed, loading widgets one by one:", error);
+            await this.loadDashboardDataIndividually();
+        }
+    }
+
+    async loadBootstrapData() {
+        const startTime = performance.now();
+        const response = await this.rpc('/golfzon/dashboard/bootstrap', {
+            sales_period: this.state.salesPeriod,
+            visitor_period: this.state.visitorPeriod,
+            reservation_period: this.state.reservationPeriod,
+        });
+
+        if (!response || !response.success) {
+            throw new Error(response?.error || 'Failed to fetch dashboard bootstrap');
+        }
+
+        const clientTime = performance.now() - startTime;
+        console.log(`✅ Dashboard bootstrap fetched in ${clientTime.toFixed(0)}ms (Server: ${response.execution_time_ms}ms)`);
+        console.log('Bootstrap section timings (ms):', response.timings_ms);
+
+        await this.applyBootstrapData(response.sections || {});
+    }
+
+    async applyBootstrapData(sections) {
+        this.applyLanguage(sections.language);
+        this.applyCurrentDate(sections.date);
+
+        this.state.performanceData = this.golfDataService.parsePerformanceResponse(sections.performance);
+
+        const golfData = this.golfDataService.parseGolfInfoResponse(sections.golf_info);
+        this.state.reservations = golfData.reservations;
+        this.state.teeTime = golfData.teeTime;
+        this.state.reservationDetails = golfData.reservationDetails;
+
+        this.state.salesData = sections.sales?.success
+            ? sections.sales.data
+            : this.salesService._getDefaultSalesData(this.state.salesPeriod);
+
+        try {
+            this.state.visitorData = this.visitorService.parseVisitorResponse(sections.visitor);
+        } catch (error) {
+            console.error('Error loading visitor data:', error);
+            this.state.visitorData = this.visitorService._getDefaultVisitorData(this.state.visitorPeriod);
+        }
+
+        this.state.reservationData = sections.reservation?.success
+            ? sections.reservation.data
+            : this.reservationService._getDefaultReservationData(this.state.reservationPeriod);
+
+        try {
+            this.state.ageData = this.ageService.parseAgeResponse(sections.age);
+        } catch (error) {
+            console.error("Error loading age data:", error);
+            this.state.ageData = this.ageService._getDefaultAgeData();
+        }
+
+        this.applyHeatmapResponse(sections.heatmap);
+        await this.applyMemberCompositionResponse(sections.member_composition);
+    }
+
+    async loadDashboardDataIndividually() {
+        await this.loadCurrentLanguage();
+        await this.loadCurrentDate();
+
+        await Promise.allSettled([
+            this.loadGolfInfo(),
+            this.loadPerformanceData(),
+            this.loadSalesData(),
+            this.loadVisitorData(),
+            this.loadReservationData(),
+            this.loadAgeData(),
+            this.loadHeatmapData(),
+            this.loadMemberCompositionData()
+        ]);
+    }
+
     async loadSalesData(period = this.state.salesPeriod) {
         try {
             console.log(`Loading sales data for period: ${period}`);
@@ -394,6 +472,11 @@ class GolfzonDashboard extends Component {
         }
     }
 
+    async loadForecastData(horizon = 14) {
+        const forecast = await this.reservationService.fetchForecast(horizon);
+        this.state.forecastData.forecast_chart = forecast ? forecast.points : [];
+    }
+
     async loadAgeData() {
         try {
             console.log("=== Loading age group data ===");
@@ -408,43 +491,11 @@ class GolfzonDashboard extends Component {
         }
     }
 
-    async loadHeatmapData() {
+    async loadHeatmapData(window = this.state.heatmapWindow) {
         try {
-            console.log('Loading heatmap data from database...');
-            const response = await this.rpc('/golfzon/heatmap/data', {});
-
-            if (response.success) {
-                // Transform the data into the new format
-                const data = response.heatmap;
-
-                data.rows.forEach((row) => {
-                    switch (row.slot_key) {
-                        case 'early morning':
-                            this.state.earlyMorningData = [...row.data];
-                            break;
-                        case 'morning':
-                            this.state.morningData = [...row.data];
-                            break;
-                        case 'afternoon':
-                            this.state.afternoonData = [...row.data];
-                            break;
-                        case 'night':
-                            this.state.nightData = [...row.data];
-                            break;
-                    }
-                });
-
-                this.state.hourlyBreakdownData = response.hourly_breakdown || {};
-                console.log('Heatmap data loaded successfully');
-            } else {
-                console.error('Failed to load heatmap:', response.error);
-                // Reset to default zeros
-                this.state.earlyMorningData = [0, 0, 0, 0, 0, 0, 0];
-                this.state.morningData = [0, 0, 0, 0, 0, 0, 0];
-                this.state.afternoonData = [0, 0, 0, 0, 0, 0, 0];
-                this.state.nightData = [0, 0, 0, 0, 0, 0, 0];
-                this.state.hourlyBreakdownData = {};
-            }
+            console.log(`Loading heatmap data from database (${window})...`);
+            const response = await this.rpc('/golfzon/heatmap/data', { window });
+            this.applyHeatmapResponse(response);
         } catch (error) {
             console.error('Error loading heatmap data:', error);
             // Reset to default zeros on error
@@ -456,26 +507,64 @@ class GolfzonDashboard extends Component {
         }
     }
 
+    applyHeatmapResponse(response) {
+        if (response && response.success) {
+            // Transform the data into the new format
+            const data = response.heatmap;
+
+            data.rows.forEach((row) => {
+                switch (row.slot_key) {
+                    case 'early morning':
+                        this.state.earlyMorningData = [...row.data];
+                        break;
+                    case 'morning':
+                        this.state.morningData = [...row.data];
+                        break;
+                    case 'afternoon':
+                        this.state.afternoonData = [...row.data];
+                        break;
+                    case 'night':
+                        this.state.nightData = [...row.data];
+                        break;
+                }
+            });
+
+            this.state.hourlyBreakdownData = response.hourly_breakdown || {};
+            console.log('Heatmap data loaded successfully');
+        } else {
+            console.error('Failed to load heatmap:', response?.error);
+            // Reset to default zeros
+            this.state.earlyMorningData = [0, 0, 0, 0, 0, 0, 0];
+            this.state.morningData = [0, 0, 0, 0, 0, 0, 0];
+            this.state.afternoonData = [0, 0, 0, 0, 0, 0, 0];
+            this.state.nightData = [0, 0, 0, 0, 0, 0, 0];
+            this.state.hourlyBreakdownData = {};
+        }
+    }
+
     async loadMemberCompositionData() {
         try {
             console.log("=== Loading Member Composition Data ===");
             const response = await this.rpc('/golfzon/member_composition/data', {});
-
-            if (response && response.success) {
-                console.log("Member composition data received:", response.data);
-                this.state.memberCompositionData = response.data;
-                console.log(`✅ Member composition loaded in ${response.execution_time_ms}ms`);
-                await this.updatePieCharts();
-            } else {
-                console.error("Failed to load member composition:", response ? response.error : 'No response');
-                this.state.memberCompositionData = this.getDefaultMemberCompositionData();
-            }
+            await this.applyMemberCompositionResponse(response);
         } catch (error) {
             console.error("Error loading member composition data:", error);
             this.state.memberCompositionData = this.getDefaultMemberCompositionData();
         }
     }
 
+    async applyMemberCompositionResponse(response) {
+        if (response && response.success) {
+            console.log("Member composition data received:", response.data);
+            this.state.memberCompositionData = response.data;
+            console.log(`✅ Member composition loaded in ${response.execution_time_ms}ms`);
+            await this.updatePieCharts();
+        } else {
+            console.error("Failed to load member composition:", response ? response.error : 'No response');
+            this.state.memberCompositionData = this.getDefaultMemberCompositionData();
+        }
+    }
+
     getDefaultMemberCompositionData() {
         return {
             by_type: {
@@ -620,26 +709,30 @@ class GolfzonDashboard extends Component {
                 console.log(`✅ Using default location: ${locationData.locationName}`);
             }
 
-            await this.loadWeatherAndGolfData(locationData.lat, locationData.lon);
+            await this.loadWeatherData(locationData.lat, locationData.lon);
 
         } catch (error) {
             console.error("❌ Location initialization failed:", error.message);
             this.state.weather.location = "Seoul, KR (default)";
 
             // Still try to load weather for Seoul
-            await this.loadWeatherAndGolfData("37.5665", "126.9780");
+            await this.loadWeatherData("37.5665", "126.9780");
         }
     }
 
-    async loadWeatherAndGolfData(lat = null, lon = null) {
+    async loadWeatherData(lat = null, lon = null) {
         try {
-            const [weatherData, golfData] = await Promise.all([
-                this.weatherService.fetchWeatherData(lat, lon),
-                this.golfDataService.fetchGolfInfo(lat, lon),
-            ]);
-
+            const weatherData = await this.weatherService.fetchWeatherData(lat, lon);
             this.state.weather = { ...this.state.weather, ...weatherData.current };
             this.state.hourlyWeather = weatherData.hourly;
+        } catch (error) {
+            console.error('Error loading weather data:', error);
+        }
+    }
+
+    async loadGolfInfo() {
+        try {
+            const golfData = await this.golfDataService.fetchGolfInfo();
             this.state.reservations = golfData.reservations;
             this.state.teeTime = golfData.teeTime;
             this.state.reservationDetails = golfData.reservationDetails;
@@ -650,7 +743,7 @@ class GolfzonDashboard extends Component {
                 detailsCount: this.state.reservationDetails.length
             });
         } catch (error) {
-            console.error('Error loading weather and golf data:', error);
+            console.error('Error loading golf data:', error);
         }
     }
 
@@ -722,6 +815,12 @@ class GolfzonDashboard extends Component {
         }
     }
 
+    async updateHeatmapWindow(window) {
+        this.state.heatmapWindow = window;
+        this.state.showReservationDetails = false;
+        await this.loadHeatmapData(window);
+    }
+
     async updateReservationChart(period) {
         console.log(`📊 Updating RESERVATION chart only for period: ${period}`);
         const startTime = performance.now();
@@ -732,7 +831,8 @@ class GolfzonDashboard extends Component {
                 this.chartService.createReservationChart(
                     this.reservationTrendChart.el,
                     period,
-                    this.state.reservationData
+                    this.state.reservationData,
+                    this.state.forecastData.forecast_chart
                 );
             }
             const duration = performance.now() - startTime;
@@ -744,7 +844,7 @@ class GolfzonDashboard extends Component {
 
     initializeAllCharts() {
         console.log("Initializing all charts...");
-        this.updateAllCharts();
+        this.renderAllCharts();
 
         if (this.ageRef?.el) {
             if (this.state.ageData && this.state.ageData.total_count !== undefined) {
@@ -774,7 +874,10 @@ class GolfzonDashboard extends Component {
             this.loadReservationData(this.state.reservationPeriod)
         ]);
 
-        // Render all charts
+        this.renderAllCharts();
+    }
+
+    renderAllCharts() {
         if (this.canvasRef.el) {
             this.chartService.createSalesChart(
                 this.canvasRef.el,
@@ -795,7 +898,8 @@ class GolfzonDashboard extends Component {
             this.chartService.createReservationChart(
                 this.reservationTrendChart.el,
                 this.state.reservationPeriod,
-                this.state.reservationData
+                this.state.reservationData,
+                this.state.forecastData.forecast_chart
             );
         }
 
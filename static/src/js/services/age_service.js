@@ -34,39 +34,13 @@ export class AgeService {
 
             console.log("📥 Server response:", response);
 
-            if (!response.success) {
-                console.error("❌ Server returned error:", response.error);
-                throw new Error(response.error || "Failed to fetch age group data");
-            }
+            const ageData = this.parseAgeResponse(response);
 
             console.log(
                 `✅ Age data fetched in ${clientTime.toFixed(2)}ms (Server: ${response.execution_time_ms
                 }ms)`
             );
 
-            console.log("📊 Raw age data from server:", response.data);
-
-            // Transform data
-            const ageData = {
-                under_10: response.data.age_groups?.under_10 || { count: 0, percentage: 0 },
-                twenties: response.data.age_groups?.["20s"] || { count: 0, percentage: 0 },
-                thirties: response.data.age_groups?.["30s"] || { count: 0, percentage: 0 },
-                forties: response.data.age_groups?.["40s"] || { count: 0, percentage: 0 },
-                fifties: response.data.age_groups?.["50s"] || { count: 0, percentage: 0 },
-                sixty_plus: response.data.age_groups?.["60_plus"] || { count: 0, percentage: 0 },
-                total_count: response.data.total_count || 0,
-            };
-
-            console.log("📊 Transformed age data:", ageData);
-            console.log("📊 Percentages:", {
-                "Under 10": ageData.under_10.percentage + "%",
-                "20s": ageData.twenties.percentage + "%",
-                "30s": ageData.thirties.percentage + "%",
-                "40s": ageData.forties.percentage + "%",
-                "50s": ageData.fifties.percentage + "%",
-                "60+": ageData.sixty_plus.percentage + "%",
-            });
-
             this.cache = ageData;
             this.cacheTimestamp = Date.now();
 
@@ -77,6 +51,32 @@ export class AgeService {
         }
     }
 
+    /**
+     * Turn an age_group_data response (standalone or bootstrap section) into state data
+     */
+    parseAgeResponse(response) {
+        if (!response || !response.success) {
+            console.error("❌ Server returned error:", response?.error);
+            throw new Error(response?.error || "Failed to fetch age group data");
+        }
+
+        console.log("📊 Raw age data from server:", response.data);
+
+        // Transform data
+        const ageData = {
+            under_10: response.data.age_groups?.under_10 || { count: 0, percentage: 0 },
+            twenties: response.data.age_groups?.["20s"] || { count: 0, percentage: 0 },
+            thirties: response.data.age_groups?.["30s"] || { count: 0, percentage: 0 },
+            forties: response.data.age_groups?.["40s"] || { count: 0, percentage: 0 },
+            fifties: response.data.age_groups?.["50s"] || { count: 0, percentage: 0 },
+            sixty_plus: response.data.age_groups?.["60_plus"] || { count: 0, percentage: 0 },
+            total_count: response.data.total_count || 0,
+        };
+
+        console.log("📊 Transformed age data:", ageData);
+        return ageData;
+    }
+
     _getDefaultAgeData() {
         console.warn("⚠️ Using default/empty age data");
         return {
@@ -159,10 +159,12 @@ export class ChartService {
     const currentYearDates = [];
     const previousYearDates = [];
   
-    // Process current year data
+    // Process current year data (days, or week/month buckets dated by their first day)
     salesData.current_year.forEach((day, index) => {
       const date = new Date(day.date);
-      let label = `${date.getMonth() + 1}.${date.getDate()}`;
+      let label = salesData.bucket === "month"
+        ? `${date.getFullYear()}.${date.getMonth() + 1}`
+        : `${date.getMonth() + 1}.${date.getDate()}`;
       labels.push(label);
       currentYearValues.push(day.amount / 10000);
       currentYearDates.push(date);
@@ -577,7 +579,7 @@ export class ChartService {
     }
   }  
 
-  async createReservationChart(canvasEl, period, reservationData) {
+  async createReservationChart(canvasEl, period, reservationData, forecastPoints = []) {
     if (!this._validateCanvas(canvasEl, "Reservation Chart")) return;
   
     if (!reservationData || !reservationData.current_year) {
@@ -613,6 +615,26 @@ export class ChartService {
         previousYearDates.push(new Date(day.date));
       });
     }
+
+    // Forecast days follow the current period, the forecast line starts
+    // from the last actual value
+    const forecastDates = [];
+    const forecastValues = currentYearValues.map(() => null);
+    const forecastLower = currentYearValues.map(() => null);
+    const forecastUpper = currentYearValues.map(() => null);
+    if (forecastPoints && forecastPoints.length > 0 && currentYearValues.length > 0) {
+      const last = currentYearValues.length - 1;
+      forecastValues[last] = forecastLower[last] = forecastUpper[last] = currentYearValues[last];
+      forecastPoints.forEach((point) => {
+        const date = new Date(point.date);
+        labels.push(`${date.getMonth() + 1}.${date.getDate()}`);
+        forecastDates.push(date);
+        forecastValues.push(point.forecast);
+        forecastLower.push(point.lower);
+        forecastUpper.push(point.upper);
+      });
+    }
+    const allDates = currentYearDates.concat(forecastDates);
   
     this.destroyChart("reservation");
   
@@ -656,7 +678,45 @@ export class ChartService {
               pointHoverBorderColor: COLOR_SECONDARY, // ✅ LIGHT BLUE border
               pointHoverBorderWidth: 3, // ✅ Border thickness
             },
-          ],
+            {
+              label: _t("Reservation Forecast"),
+              data: forecastValues,
+              borderColor: COLOR_PRIMARY,
+              backgroundColor: "transparent",
+              borderWidth: 2,
+              borderDash: [6, 4],
+              tension: 0.4,
+              pointRadius: 0,
+              pointHoverRadius: 6,
+              pointHoverBackgroundColor: "white",
+              pointHoverBorderColor: COLOR_PRIMARY,
+              pointHoverBorderWidth: 3,
+            },
+            {
+              // 95% band: upper bound filled down to the lower bound
+              label: _t("Forecast Range"),
+              data: forecastUpper,
+              borderColor: "transparent",
+              backgroundColor: "rgba(4, 109, 236, 0.08)",
+              fill: "+1",
+              tension: 0.4,
+              pointRadius: 0,
+              pointHoverRadius: 0,
+              isForecastBand: true,
+            },
+            {
+              label: _t("Forecast Range"),
+              data: forecastLower,
+              borderColor: "transparent",
+              backgroundColor: "transparent",
+              fill: false,
+              tension: 0.4,
+              pointRadius: 0,
+              pointHoverRadius: 0,
+              isForecastBand: true,
+            },
+            // Without forecast, only the actual series
+          ].slice(0, forecastDates.length > 0 ? 5 : 2),
         },
         options: {
           responsive: true,
@@ -703,7 +763,7 @@ export class ChartService {
                 color: "#1e1e1e",
                 generateLabels: function (chart) {
                   const datasets = chart.data.datasets;
-                  return datasets.map((dataset, i) => ({
+                  return datasets.map((dataset, i) => dataset.isForecastBand ? null : ({
                     text: dataset.label,
                     fillStyle: dataset.borderColor,
                     hidden: !chart.isDatasetVisible(i),
@@ -715,7 +775,7 @@ export class ChartService {
                     strokeStyle: dataset.borderColor,
                     pointStyle: 'circle',
                     datasetIndex: i
-                  }));
+                  })).filter(Boolean);
                 }
               },
             },
@@ -730,22 +790,30 @@ export class ChartService {
               caretSize: 6,
               titleFont: { size: 14, weight: "600" },
               bodyFont: { size: 13 },
+              filter: (item) => !item.dataset.isForecastBand,
               callbacks: {
                 title: (items) => {
                   if (!items || !items[0]) return "";
                   const idx = items[0].dataIndex;
                   const datasetIndex = items[0].datasetIndex;
   
-                  const date = datasetIndex === 0
-                    ? currentYearDates[idx]
-                    : previousYearDates[idx];
+                  const date = datasetIndex === 1
+                    ? previousYearDates[idx]
+                    : allDates[idx];
   
                   return chartService._formatFullDate(date) || labels[idx] || "";
                 },
                 label: (ctx) => {
                   const value = ctx.raw ?? 0;
                   const isCurrentYear = ctx.datasetIndex === 0;
-  
+
+                  if (ctx.datasetIndex === 2) {
+                    const idx = ctx.dataIndex;
+                    return [
+                      `${_t("Forecast")}: ${Math.round(value)}`,
+                      `${_t("Range")}: ${Math.round(forecastLower[idx])} - ${Math.round(forecastUpper[idx])}`,
+                    ];
+                  }
                   if (isCurrentYear) {
                     return `${_t("Reservations")}: ${value}`;
                   } else {
@@ -12,26 +12,31 @@ export class GolfDataService {
       console.log('Fetching golf info from database...');
 
       const response = await this.rpc('/golfzon/dashboard/golfinfo', {});
-
-      if (response && response.success) {
-        console.log('Golf data received from database:', response);
-        console.log(`Golf data loaded in ${response.execution_time_ms}ms`);
-
-        return {
-          reservations: response.reservations,
-          teeTime: response.teeTime,
-          reservationDetails: response.reservationDetails
-        };
-      } else {
-        console.error('Failed to load golf data:', response?.error);
-        return this.getDefaultGolfData();
-      }
+      return this.parseGolfInfoResponse(response);
     } catch (error) {
       console.error('Error fetching golf data:', error);
       return this.getDefaultGolfData();
     }
   }
 
+  /**
+   * Turn a golfinfo response (standalone or bootstrap section) into state data
+   */
+  parseGolfInfoResponse(response) {
+    if (response && response.success) {
+      console.log('Golf data received from database:', response);
+      console.log(`Golf data loaded in ${response.execution_time_ms}ms`);
+
+      return {
+        reservations: response.reservations,
+        teeTime: response.teeTime,
+        reservationDetails: response.reservationDetails
+      };
+    }
+    console.error('Failed to load golf data:', response?.error);
+    return this.getDefaultGolfData();
+  }
+
   getDefaultGolfData() {
     // Fallback data structure (empty)
     return {
@@ -52,24 +57,29 @@ export class GolfDataService {
       const response = await this.rpc("/golfzon/dashboard/performance_indicators", {});
 
       console.log("✅ Database response:", response);
-
-      if (response && response.success) {
-        console.log("✅ Performance data loaded successfully from database");
-        return {
-          sales_performance: response.sales_performance,
-          avg_order_value: response.avg_order_value,
-          utilization_rate: response.utilization_rate
-        };
-      } else {
-        console.error("❌ Error in performance data response:", response?.error);
-        return this.getDefaultPerformanceData();
-      }
+      return this.parsePerformanceResponse(response);
     } catch (error) {
       console.error("❌ Error fetching performance data:", error);
       return this.getDefaultPerformanceData();
     }
   }
 
+  /**
+   * Turn a performance indicators response (standalone or bootstrap section) into state data
+   */
+  parsePerformanceResponse(response) {
+    if (response && response.success) {
+      console.log("✅ Performance data loaded successfully from database");
+      return {
+        sales_performance: response.sales_performance,
+        avg_order_value: response.avg_order_value,
+        utilization_rate: response.utilization_rate
+      };
+    }
+    console.error("❌ Error in performance data response:", response?.error);
+    return this.getDefaultPerformanceData();
+  }
+
   getDefaultPerformanceData() {
     console.warn("⚠️ Using fallback performance data (no database data available)");
     return {
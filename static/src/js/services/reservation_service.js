@@ -46,6 +46,30 @@ export class ReservationService {
         }
     }
 
+    /**
+     * Daily reservation forecast (nightly fit) for the next `horizon` days,
+     * null when the server has no forecast (e.g. not enough history).
+     */
+    async fetchForecast(horizon = 14) {
+        const cacheKey = `forecast_${horizon}`;
+        if (this.cache.has(cacheKey)) {
+            return this.cache.get(cacheKey);
+        }
+
+        try {
+            const response = await this.rpc("/golfzon/reservation/forecast", { horizon });
+            if (!response.success) {
+                console.warn("Reservation forecast not available:", response.error);
+                return null;
+            }
+            this.cache.set(cacheKey, response.data);
+            return response.data;
+        } catch (error) {
+            console.error("Error fetching reservation forecast:", error);
+            return null;
+        }
+    }
+
     _getDefaultReservationData(period) {
         const days = period === "7days" ? 7 : 30;
         const today = new Date();
@@ -9,9 +9,11 @@ export class SalesService {
 
     /**
      * Fetch sales data with client-side caching for instant UI updates
+     * @param {string} period - '7days', '30days', '90days', '1year' or 'custom'
+     * @param {Object} options - start_date/end_date for 'custom', bucket, max_points
      */
-    async fetchSalesData(period = '30days') {
-        const cacheKey = `sales_${period}`;
+    async fetchSalesData(period = '30days', options = {}) {
+        const cacheKey = `sales_${period}_${JSON.stringify(options)}`;
         const now = Date.now();
 
         // Check cache first
@@ -35,7 +37,8 @@ export class SalesService {
             console.log(`Fetching sales data for period: ${period}`);
 
             const response = await this.rpc('/golfzon/sales_data', {
-                period: period
+                period: period,
+                ...options
             });
 
             const endTime = performance.now();
@@ -71,7 +74,7 @@ export class SalesService {
 
     /**
      * Default data structure when API fails
-     * @param {string} period - '7days' or '30days'
+     * @param {string} period - '7days', '30days', '90days' or '1year'
      */
     _getDefaultSalesData(period = '30days') {
         // Generate dummy data based on period
@@ -80,7 +83,7 @@ export class SalesService {
         const today = new Date();
 
         // Calculate number of days
-        const days = period === '7days' ? 7 : 30;
+        const days = { '7days': 7, '90days': 90, '1year': 365 }[period] || 30;
 
         console.log(`Generating default data for ${days} days`);
 
@@ -30,9 +30,7 @@ export class VisitorService {
             const endTime = performance.now();
             const clientTime = endTime - startTime;
 
-            if (!response.success) {
-                throw new Error(response.error || "Failed to fetch visitor data");
-            }
+            const visitorData = this.parseVisitorResponse(response);
 
             console.log(
                 `✅ Visitor data fetched in ${clientTime.toFixed(2)}ms (Server: ${
@@ -40,19 +38,6 @@ export class VisitorService {
                 }ms)`
             );
 
-            const visitorData = {
-                total_visitors: response.data.total_visitors || 0,
-                percentage_change: response.data.percentage_change || 0,
-                sections: response.data.sections || { part1: 0, part2: 0, part3: 0 },
-                gender_ratio: response.data.gender_ratio || {
-                    male_percentage: 0,
-                    female_percentage: 0,
-                },
-                current_year: response.data.current_year || [],
-                previous_year: response.data.previous_year || [],
-                date_range: response.data.date_range || { start: "", end: "" },
-            };
-
             // Cache the data
             this.cache.set(cacheKey, {
                 data: visitorData,
@@ -66,6 +51,28 @@ export class VisitorService {
         }
     }
 
+    /**
+     * Turn a visitor_data response (standalone or bootstrap section) into state data
+     */
+    parseVisitorResponse(response) {
+        if (!response || !response.success) {
+            throw new Error(response?.error || "Failed to fetch visitor data");
+        }
+
+        return {
+            total_visitors: response.data.total_visitors || 0,
+            percentage_change: response.data.percentage_change || 0,
+            sections: response.data.sections || { part1: 0, part2: 0, part3: 0 },
+            gender_ratio: response.data.gender_ratio || {
+                male_percentage: 0,
+                female_percentage: 0,
+            },
+            current_year: response.data.current_year || [],
+            previous_year: response.data.previous_year || [],
+            date_range: response.data.date_range || { start: "", end: "" },
+        };
+    }
+
     _getDefaultVisitorData(period) {
         const days = period === "7days" ? 7 : 30;
         const today = new Date();
@@ -0,0 +1 @@
+from . import test_sales_ledger
@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+class TestSalesLedger(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Ledger = cls.env["golfzon.sales.ledger"]
+        cls.today = fields.Date.context_today(cls.Ledger)
+        cls.pay_date = cls.today - timedelta(days=10)
+
+    def _entries(self, payment):
+        return self.Ledger.search([("payment_id", "=", payment.id)], order="id")
+
+    def test_backdated_payment_posted_on_pay_date(self):
+        payment = self.env["payment.infos"].create({
+            "pay_id": 1,
+            "account_id": 1,
+            "pay_date": self.pay_date,
+            "pay_amt": 50000,
+        })
+        entries = self._entries(payment)
+        self.assertEqual(entries.mapped("entry_type"), ["sale"])
+        self.assertEqual(entries.entry_date, self.pay_date)
+        self.assertEqual(entries.amount, 50000)
+
+    def test_backdated_payment_loaded_by_sql(self):
+        self.env.cr.execute(
+            """
+            INSERT INTO payment_infos (pay_id, account_id, pay_date, pay_amt, cancel_yn)
+            VALUES (2, 1, %s, 30000, 'N')
+            RETURNING id
+            """,
+            (self.pay_date,),
+        )
+        payment = self.env["payment.infos"].browse(self.env.cr.fetchone()[0])
+        self.Ledger._cron_post()
+        entries = self._entries(payment)
+        self.assertEqual(entries.mapped("entry_type"), ["sale"])
+        self.assertEqual(entries.entry_date, self.pay_date)
+
+        # The closed day of the late payment is refreshed in the daily rollup
+        self.env["golfzon.daily.metrics"]._cron_refresh()
+        metrics = self.env["golfzon.daily.metrics"].search([
+            ("metric_date", "=", self.pay_date), ("account_id", "=", 1),
+        ])
+        self.assertEqual(metrics.sales_amount, sum(
+            self.Ledger.search([
+                ("entry_date", "=", self.pay_date), ("account_id", "=", 1),
+            ]).mapped("amount")
+        ))
+
+    def test_cancellation_posted_on_today(self):
+        payment = self.env["payment.infos"].create({
+            "pay_id": 1,
+            "account_id": 1,
+            "pay_date": self.pay_date,
+            "pay_amt": 50000,
+        })
+        payment.write({"cancel_yn": "Y", "cancel_date": self.pay_date + timedelta(days=1)})
+        cancel = self._entries(payment).filtered(lambda entry: entry.entry_type == "cancel")
+        self.assertEqual(cancel.entry_date, self.today)
+        self.assertEqual(cancel.amount, -50000)
+        self.assertEqual(cancel.transaction_count, -1)
+
+    def test_payment_deleted_by_sql_is_voided(self):
+        payment = self.env["payment.infos"].create({
+            "pay_id": 3,
+            "account_id": 1,
+            "pay_date": self.pay_date,
+            "pay_amt": 20000,
+        })
+        self.env.cr.execute("DELETE FROM payment_infos WHERE id = %s", (payment.id,))
+        entries = self._entries(payment)
+        self.assertEqual(entries.mapped("entry_type"), ["sale", "void"])
+        self.assertEqual(sum(entries.mapped("amount")), 0)
+        self.assertEqual(sum(entries.mapped("transaction_count")), 0)
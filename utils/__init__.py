@@ -0,0 +1,8 @@
+from . import instrumentation
+from . import result_cache
+from . import watermarks
+from . import xlsx_export
+from . import downsample
+from . import hyperloglog
+from . import age_histogram
+from . import forecast
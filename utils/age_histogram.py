@@ -0,0 +1,80 @@
+import threading
+import time
+
+# Chart groups, teens being counted with the 20s as the chart has no group
+# for them
+AGE_GROUPS = ("under_10", "20s", "30s", "40s", "50s", "60_plus")
+MAX_AGE = 150
+
+# Safety net for other workers: writes reload the counts of this worker
+# right after commit, the others after the time to live
+DEFAULT_TTL_SECONDS = 3600
+
+
+def age_on(birth_date, day):
+    """Age in full years on ``day`` (same as DATE_PART('year', AGE(day, birth_date)))"""
+    return day.year - birth_date.year - ((day.month, day.day) < (birth_date.month, birth_date.day))
+
+
+def age_group(age):
+    """Chart group of an age, None when the age is not plausible"""
+    if age < 0 or age > MAX_AGE:
+        return None
+    if age < 10:
+        return "under_10"
+    if age >= 60:
+        return "60_plus"
+    return f"{max(age // 10, 2)}0s"
+
+
+def bucket(birth_date_counts, day):
+    """{group: persons} of {birth_date: persons} on ``day``"""
+    groups = dict.fromkeys(AGE_GROUPS, 0)
+    for birth_date, count in birth_date_counts.items():
+        group = age_group(age_on(birth_date, day))
+        if group:
+            groups[group] += count
+    return groups
+
+
+class AgeHistogramCache:
+    """
+    Person counts per birth date, held in memory per database, and the age
+    groups they make on the current day. Ages only change at midnight: the
+    groups are bucketed again from the counts held, once per day, without
+    querying the database.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, dbname, day, loader):
+        """
+        Return {group: persons} of the database on ``day``, calling
+        ``loader()`` for {birth_date: persons} when missing or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(dbname)
+        if entry is None or entry["expires"] <= now:
+            # Loaded outside the lock: two concurrent loads only cost a query
+            entry = {"expires": now + self.ttl, "counts": loader(), "day": None, "groups": None}
+        if entry["day"] != day:
+            entry = dict(entry, day=day, groups=bucket(entry["counts"], day))
+        with self._lock:
+            self._entries[dbname] = entry
+        return entry["groups"]
+
+    def invalidate(self, dbname):
+        with self._lock:
+            self._entries.pop(dbname, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# One cache per worker process
+age_histograms = AgeHistogramCache()
@@ -0,0 +1,45 @@
+"""
+Largest-Triangle-Three-Buckets downsampling.
+
+Keeps the first and last points and, for every bucket in between, the point
+forming the largest triangle with the point kept in the previous bucket and
+the average of the next bucket. Peaks and dips survive, unlike plain
+averaging or striding.
+"""
+
+
+def lttb_indices(values, threshold):
+    """
+    Indices of the points of ``values`` (y values at evenly spaced x) kept
+    when downsampling to ``threshold`` points.
+    """
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    indices = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average point of the next bucket (the last point for the last bucket)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        prev_x, prev_y = previous, values[previous]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs((prev_x - avg_x) * (values[i] - prev_y) - (prev_x - i) * (avg_y - prev_y))
+            if area > best_area:
+                best, best_area = i, area
+        indices.append(best)
+        previous = best
+
+    indices.append(count - 1)
+    return indices
@@ -0,0 +1,102 @@
+"""
+Seasonal least squares forecast of a daily series.
+
+    y[t] = trend + day of week effect + yoy * y[t - 364] + noise
+
+The year-over-year term uses the same weekday 52 weeks earlier, so the
+seasonality of the year comes from the series itself instead of 365 more
+coefficients. The model is fitted once, with one lstsq call over the design
+matrix, and projected up to 52 weeks ahead without recursion: the lag of a
+forecast day is always an observed day.
+
+Confidence bands are +/- Z_95 residual standard deviations, the error of the
+coefficients being negligible next to the daily noise over years of data.
+
+NumPy is optional for the module: without it ``fit_seasonal`` raises
+ForecastUnavailable.
+"""
+
+import time
+from datetime import timedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Same weekday, one year earlier
+SEASON_LAG_DAYS = 364
+
+# Two-sided 95% normal quantile
+Z_95 = 1.96
+
+# Observations needed on top of the lag for a meaningful fit
+MIN_FIT_DAYS = 8 * 7
+
+
+class ForecastUnavailable(Exception):
+    """The forecast cannot be computed (NumPy missing, not enough history)"""
+
+
+def _design(day_index, weekdays, lagged):
+    """[1, t, 6 weekday dummies (Monday is the base), lagged value] columns"""
+    columns = [np.ones_like(day_index), day_index]
+    columns += [(weekdays == weekday).astype(float) for weekday in range(1, 7)]
+    columns.append(lagged)
+    return np.column_stack(columns)
+
+
+def fit_seasonal(first_date, values, horizon):
+    """
+    Fit the model on ``values``, the daily series starting on ``first_date``
+    (days without data as 0), and project ``horizon`` days after the last.
+
+    :return: {"points": [{"date", "forecast", "lower", "upper"}],
+        "coefficients", "residual_std", "history_days", "fit_ms"}
+    """
+    if np is None:
+        raise ForecastUnavailable("NumPy is required for the reservation forecast")
+    if horizon > SEASON_LAG_DAYS:
+        raise ForecastUnavailable(f"The horizon is limited to {SEASON_LAG_DAYS} days")
+
+    started = time.perf_counter()
+    y = np.asarray(values, dtype=float)
+    days = len(y)
+    if days < SEASON_LAG_DAYS + MIN_FIT_DAYS:
+        raise ForecastUnavailable(
+            f"{days} days of history, {SEASON_LAG_DAYS + MIN_FIT_DAYS} needed"
+        )
+
+    # Day index and weekday of the history followed by the horizon
+    day_index = np.arange(days + horizon, dtype=float)
+    weekdays = (first_date.weekday() + day_index.astype(int)) % 7
+    lagged = np.concatenate([np.full(SEASON_LAG_DAYS, np.nan), y])[: days + horizon]
+
+    design = _design(day_index, weekdays, lagged)
+    fitted_rows = slice(SEASON_LAG_DAYS, days)
+    coefficients, _residuals, _rank, _sv = np.linalg.lstsq(
+        design[fitted_rows], y[fitted_rows], rcond=None
+    )
+    residuals = y[fitted_rows] - design[fitted_rows] @ coefficients
+    residual_std = float(residuals.std(ddof=design.shape[1]))
+
+    forecast = design[days:] @ coefficients
+    band = Z_95 * residual_std
+    last_date = first_date + timedelta(days=days - 1)
+    points = [
+        {
+            "date": (last_date + timedelta(days=offset + 1)).strftime("%Y-%m-%d"),
+            "forecast": round(max(float(value), 0.0), 1),
+            "lower": round(max(float(value) - band, 0.0), 1),
+            "upper": round(float(value) + band, 1),
+        }
+        for offset, value in enumerate(forecast)
+    ]
+    names = ["intercept", "trend"] + [f"weekday_{weekday}" for weekday in range(1, 7)] + ["yoy"]
+    return {
+        "points": points,
+        "coefficients": {name: float(value) for name, value in zip(names, coefficients)},
+        "residual_std": residual_std,
+        "history_days": days,
+        "fit_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,65 @@
+"""
+HyperLogLog distinct-count sketches.
+
+A sketch is REGISTER_COUNT one-byte registers. Each value is hashed to 64
+bits: the low PRECISION bits pick a register, which keeps the highest rank
+(position of the first 1 bit in the remaining 52 bits) seen. Sketches of
+disjoint or overlapping sets merge with a register-wise max, so daily
+sketches add up to the distinct count of any range.
+
+The registers are built in PostgreSQL (REGISTER_SQL and RANK_SQL, on the
+hashtextextended(value, 0) hash), so Python never rehashes the values.
+
+Standard error is 1.04 / sqrt(REGISTER_COUNT), about 1.6% with 4096
+registers: 95% of the estimates are within 3.3% of the true count.
+"""
+
+import math
+
+PRECISION = 12
+REGISTER_COUNT = 1 << PRECISION
+RELATIVE_ERROR = 1.04 / math.sqrt(REGISTER_COUNT)
+
+# Rank when the 52 hash bits left after the register index are all 0
+MAX_RANK = 64 - PRECISION + 1
+
+# SQL hash of a value, ``{value}`` being its SQL expression
+HASH_SQL = "hashtextextended({value}, 0)"
+
+# Register and rank of a hash, ``{hash}`` being its SQL expression
+REGISTER_SQL = f"({{hash}} & {REGISTER_COUNT - 1})::integer"
+RANK_SQL = (
+    f"COALESCE(NULLIF(position('1' IN substring({{hash}}::bit(64)::text FROM 1 FOR {64 - PRECISION})), 0), "
+    f"{MAX_RANK})"
+)
+
+
+def from_ranks(ranks):
+    """Sketch (bytes) of (register, rank) pairs, the max rank per register"""
+    registers = bytearray(REGISTER_COUNT)
+    for register, rank in ranks:
+        if rank > registers[register]:
+            registers[register] = rank
+    return bytes(registers)
+
+
+def merge(sketches):
+    """Register-wise max of the sketches, an empty sketch when none"""
+    merged = None
+    for sketch in sketches:
+        sketch = bytes(sketch)
+        merged = sketch if merged is None else bytes(map(max, merged, sketch))
+    return merged if merged is not None else bytes(REGISTER_COUNT)
+
+
+def estimate(sketch):
+    """Estimated distinct count of a sketch"""
+    m = REGISTER_COUNT
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / sum(2.0 ** -register for register in sketch)
+    zeros = sketch.count(0)
+    if raw <= 2.5 * m and zeros:
+        # Small range correction: linear counting on the empty registers
+        return m * math.log(m / zeros)
+    # 64-bit hashes: no large range correction needed
+    return raw
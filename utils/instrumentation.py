@@ -0,0 +1,259 @@
+import functools
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from odoo.http import request
+
+_logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets, the last bucket is open
+BUCKET_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Number of one-minute buckets kept per endpoint
+WINDOW_MINUTES = 60
+
+_local = threading.local()
+
+
+def _sql_counters():
+    """Query count and SQL time (seconds) Odoo accumulates on the request thread"""
+    thread = threading.current_thread()
+    return getattr(thread, "query_count", 0), getattr(thread, "query_time", 0.0)
+
+
+def _is_error(result):
+    if isinstance(result, dict):
+        return result.get("success") is False or result.get("status") == "error"
+    return False
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, percentiles are bucket upper bounds"""
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, value_ms):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.total += 1
+        self.max = max(self.max, value_ms)
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        if not self.total:
+            return 0
+        rank = q * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max
+                return round(min(bound, self.max), 2)
+        return round(self.max, 2)
+
+
+class MinuteBucket:
+    """Everything recorded for one endpoint during one wall-clock minute"""
+
+    def __init__(self, minute):
+        self.minute = minute
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.sql_ms = 0.0
+        self.python_ms = 0.0
+        self.queries = 0
+        self.rows = 0
+        self.latency = Histogram()
+        # label -> [calls, sql_ms, queries, rows]
+        self.statements = {}
+
+
+class EndpointStats:
+    def __init__(self):
+        self.buckets = deque(maxlen=WINDOW_MINUTES)
+
+    def bucket(self, minute):
+        if not self.buckets or self.buckets[-1].minute != minute:
+            self.buckets.append(MinuteBucket(minute))
+        return self.buckets[-1]
+
+
+class StatsRegistry:
+    """Ring buffers of per-minute histograms, one per instrumented endpoint"""
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, total_ms, sql_ms, queries, sample, failed):
+        minute = int(time.time() // 60)
+        with self._lock:
+            stats = self._endpoints.setdefault(name, EndpointStats())
+            bucket = stats.bucket(minute)
+            bucket.calls += 1
+            bucket.errors += int(failed)
+            bucket.total_ms += total_ms
+            bucket.sql_ms += sql_ms
+            bucket.python_ms += max(total_ms - sql_ms, 0)
+            bucket.queries += queries
+            bucket.rows += sample["rows"]
+            bucket.latency.add(total_ms)
+            for label, values in sample["statements"].items():
+                totals = bucket.statements.setdefault(label, [0, 0.0, 0, 0])
+                for i, value in enumerate(values):
+                    totals[i] += value
+
+    def snapshot(self):
+        oldest = int(time.time() // 60) - WINDOW_MINUTES
+        result = {}
+        with self._lock:
+            for name, stats in self._endpoints.items():
+                buckets = [b for b in stats.buckets if b.minute > oldest]
+                calls = sum(b.calls for b in buckets)
+                if not calls:
+                    continue
+                latency = Histogram()
+                statements = {}
+                for b in buckets:
+                    latency.merge(b.latency)
+                    for label, values in b.statements.items():
+                        totals = statements.setdefault(label, [0, 0.0, 0, 0])
+                        for i, value in enumerate(values):
+                            totals[i] += value
+
+                result[name] = {
+                    "calls": calls,
+                    "errors": sum(b.errors for b in buckets),
+                    "avg_ms": round(sum(b.total_ms for b in buckets) / calls, 2),
+                    "p50_ms": latency.percentile(0.50),
+                    "p95_ms": latency.percentile(0.95),
+                    "p99_ms": latency.percentile(0.99),
+                    "max_ms": round(latency.max, 2),
+                    "avg_sql_ms": round(sum(b.sql_ms for b in buckets) / calls, 2),
+                    "avg_python_ms": round(sum(b.python_ms for b in buckets) / calls, 2),
+                    "avg_queries": round(sum(b.queries for b in buckets) / calls, 2),
+                    "avg_rows": round(sum(b.rows for b in buckets) / calls, 2),
+                    "statements": {
+                        label: {
+                            "calls": s_calls,
+                            "avg_sql_ms": round(s_sql_ms / s_calls, 2),
+                            "total_sql_ms": round(s_sql_ms, 2),
+                            "queries": s_queries,
+                            "rows": s_rows,
+                        }
+                        for label, (s_calls, s_sql_ms, s_queries, s_rows) in sorted(
+                            statements.items(), key=lambda item: -item[1][1]
+                        )
+                    },
+                    "timeline": [
+                        {
+                            "minute": datetime.fromtimestamp(b.minute * 60, timezone.utc).isoformat(),
+                            "calls": b.calls,
+                            "errors": b.errors,
+                            "avg_ms": round(b.total_ms / b.calls, 2),
+                            "p95_ms": b.latency.percentile(0.95),
+                        }
+                        for b in buckets
+                    ],
+                }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+endpoint_stats = StatsRegistry()
+
+
+def instrumented(func):
+    """
+    Record latency, SQL time, query count and rows of a controller route.
+    SQL figures come from the per-thread counters maintained by Odoo's
+    cursor, everything else is Python time. Statements executed inside a
+    ``sql_label`` block are also broken down per label.
+    """
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _local.__dict__.setdefault("stack", [])
+        sample = {"statements": {}, "rows": 0}
+        stack.append(sample)
+        queries_before, sql_before = _sql_counters()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = _is_error(result)
+            return result
+        finally:
+            total_ms = (time.perf_counter() - started) * 1000
+            queries_after, sql_after = _sql_counters()
+            stack.pop()
+            if stack:
+                # Nested route call (e.g. the bootstrap endpoint), the parent
+                # gets the statement breakdown as well
+                parent = stack[-1]
+                parent["rows"] += sample["rows"]
+                for label, values in sample["statements"].items():
+                    totals = parent["statements"].setdefault(label, [0, 0.0, 0, 0])
+                    for i, value in enumerate(values):
+                        totals[i] += value
+            try:
+                endpoint_stats.record(
+                    name,
+                    total_ms,
+                    (sql_after - sql_before) * 1000,
+                    queries_after - queries_before,
+                    sample,
+                    failed,
+                )
+            except Exception:
+                _logger.exception(f"Failed to record statistics for {name}")
+
+    return wrapper
+
+
+@contextmanager
+def sql_label(label):
+    """
+    Attribute the SQL executed in the block (or decorated method) to
+    ``label`` in the stats of the current route. Rows are taken from the
+    rowcount of the last statement.
+    """
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        yield
+        return
+    queries_before, sql_before = _sql_counters()
+    try:
+        yield
+    finally:
+        queries_after, sql_after = _sql_counters()
+        try:
+            rows = max(request.env.cr.rowcount, 0)
+        except Exception:
+            rows = 0
+        sample = stack[-1]
+        sample["rows"] += rows
+        totals = sample["statements"].setdefault(label, [0, 0.0, 0, 0])
+        totals[0] += 1
+        totals[1] += (sql_after - sql_before) * 1000
+        totals[2] += queries_after - queries_before
+        totals[3] += rows
@@ -0,0 +1,142 @@
+import copy
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from odoo.http import request
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 300
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with a time to live per entry.
+    Entries are tagged with the (database, model) pairs they were computed
+    from, so a write on one model only drops the results depending on it.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Return (True, value) for a fresh entry, (False, None) otherwise"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key, value, tags=(), ttl=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), value, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, tags):
+        """Drop every entry tagged with one of the given tags"""
+        tags = set(tags)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[2] & tags]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# One cache per worker process, shared by every dashboard endpoint
+dashboard_cache = ResultCache()
+
+
+def cached_endpoint(name, depends=(), ttl=None):
+    """
+    Cache the successful results of a dashboard endpoint.
+
+    The key is built from the endpoint name, its bound parameters (defaults
+    included, so ``period="30days"`` and no argument share an entry), the
+    database, company and language of the caller and today's date, so
+    rolling periods never outlive the day they were computed for.
+    ``depends`` lists the models whose writes invalidate the entry, see
+    ``golfzon.dashboard.source.mixin``. ``ttl`` overrides the time to live
+    of the cache, in seconds.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+
+            env = request.env
+            dbname = env.cr.dbname
+            key = (
+                dbname,
+                name,
+                env.company.id,
+                env.lang,
+                datetime.now().date().isoformat(),
+                json.dumps(params, sort_keys=True, default=str),
+            )
+
+            hit, value = dashboard_cache.get(key)
+            if hit:
+                _logger.debug(f"Cache hit for {name}")
+                return copy.deepcopy(value)
+
+            result = func(self, *args, **kwargs)
+            # Errors are never cached, the next call retries
+            if isinstance(result, dict) and result.get("success"):
+                dashboard_cache.set(
+                    key,
+                    copy.deepcopy(result),
+                    tags={(dbname, model) for model in depends},
+                    ttl=ttl,
+                )
+            return result
+
+        return wrapper
+
+    return decorator
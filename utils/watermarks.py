@@ -0,0 +1,46 @@
+import threading
+import time
+
+DEFAULT_TTL_SECONDS = 60
+
+
+class WatermarkRegistry:
+    """
+    Latest data date per source and account, held in memory per database.
+    The table backing it is reloaded when the entry expires or after a
+    commit that moved a watermark in this worker; other workers pick the
+    change up within the time to live.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, dbname, loader):
+        """
+        Return {source: {account_id: date}} of the database, calling
+        ``loader()`` to read it when missing or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(dbname)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        # Loaded outside the lock: two concurrent loads only cost a query
+        marks = loader()
+        with self._lock:
+            self._entries[dbname] = (now + self.ttl, marks)
+        return marks
+
+    def invalidate(self, dbname):
+        with self._lock:
+            self._entries.pop(dbname, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# One registry per worker process
+data_watermarks = WatermarkRegistry()
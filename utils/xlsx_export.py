@@ -0,0 +1,81 @@
+"""
+Constant memory XLSX exports.
+
+Rows are read through a PostgreSQL server-side cursor a page at a time,
+written by xlsxwriter in ``constant_memory`` mode (each row is flushed to
+disk once the next one starts) into a temporary file, and the finished file
+is streamed back in chunks. Memory use stays flat whatever the row count.
+"""
+import logging
+import os
+import tempfile
+
+import psycopg2
+import xlsxwriter
+
+_logger = logging.getLogger(__name__)
+
+FETCH_SIZE = 2000
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_query(cr, name, query, params=None, fetch_size=FETCH_SIZE):
+    """
+    Yield the rows of ``query`` as dicts, fetched ``fetch_size`` at a time
+    through the server-side cursor ``name``.
+    The cursor lives in the current transaction, consume the rows before
+    the request ends.
+    """
+    cr.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", params)
+    try:
+        while True:
+            cr.execute(f"FETCH FORWARD {int(fetch_size)} FROM {name}")
+            rows = cr.dictfetchall()
+            if not rows:
+                break
+            yield from rows
+    finally:
+        try:
+            cr.execute(f"CLOSE {name}")
+        except psycopg2.errors.InFailedSqlTransaction:
+            # The transaction is rolled back anyway, keep the original error
+            pass
+
+
+def open_workbook():
+    """Return a constant_memory workbook writing to a new temporary file, and its path"""
+    fd, path = tempfile.mkstemp(prefix="golfzon_export_", suffix=".xlsx")
+    os.close(fd)
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "tmpdir": tempfile.gettempdir()})
+    return workbook, path
+
+
+class FileStream:
+    """
+    Response body reading a file in chunks and removing it once the
+    response is closed, whether it was sent completely or not.
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self._file = open(path, "rb")
+
+    def __iter__(self):
+        while True:
+            chunk = self._file.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self):
+        self._file.close()
+        remove_file(self.path)
+
+
+def remove_file(path):
+    try:
+        os.unlink(path)
+    except OSError as e:
+        _logger.warning(f"Could not remove export file {path}: {e}")